@@ -0,0 +1,363 @@
+import os
+import re
+import json
+import time
+import threading
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# OpenAI 채점 모델 (OpenAI 호환 서버의 모델은 grader_backends.COMPATIBLE_MODEL)
+MODEL = os.getenv("QUIZ_OPENAI_MODEL", "gpt-4.1-mini")
+
+# 상태 확인이나 연결에 실패한 서버에 다시 요청해 보기까지 기다리는 시간 (초)
+HEALTH_RETRY_SEC = float(os.getenv("QUIZ_GRADER_HEALTH_RETRY", "30"))
+
+# 채점 요청 제한 시간 (초)
+GRADING_TIMEOUT = float(os.getenv("QUIZ_GRADING_TIMEOUT", "20"))
+
+# 일괄 채점 요청 1건에 담을 입력 토큰 예산과 최대 문항 수
+BATCH_TOKEN_BUDGET = int(os.getenv("QUIZ_BATCH_TOKEN_BUDGET", "3000"))
+BATCH_MAX_ITEMS = int(os.getenv("QUIZ_BATCH_MAX_ITEMS", "40"))
+
+# 채점 요청에 넣는 문제 본문의 최대 글자 수 (넘으면 앞뒤만 남기고 줄임, 0이면 줄이지 않음)
+QUESTION_CHAR_LIMIT = int(os.getenv("QUIZ_JUDGE_QUESTION_CHARS", "300"))
+
+# 세션(창 또는 명령줄 실행 1회)에서 AI 채점에 쓸 수 있는 토큰 수 (0이면 제한 없음)
+# 다 쓰면 AI 없이 로컬 규칙과 임베딩 유사도로 채점
+SESSION_TOKEN_BUDGET = int(os.getenv("QUIZ_SESSION_TOKEN_BUDGET", "0"))
+
+# 비용 계산용 100만 토큰당 가격 (USD, 기본값은 gpt-4.1-mini 기준)
+PRICE_INPUT = float(os.getenv("QUIZ_PRICE_INPUT", "0.40"))
+PRICE_CACHED_INPUT = float(os.getenv("QUIZ_PRICE_CACHED_INPUT", "0.10"))
+PRICE_OUTPUT = float(os.getenv("QUIZ_PRICE_OUTPUT", "1.60"))
+
+# 단일/일괄 채점이 함께 쓰는 시스템 프롬프트 (요청마다 같은 접두부라 프롬프트 캐시에 걸리도록 고정)
+JUDGE_PROMPT = (
+    "Quiz judge: U (user answer) is correct if it means A (answer to Q), in any wording or language. "
+    'Reply Y or N; for numbered items JSON {"v":"<Y/N per item>"}.'
+)
+
+_WHITESPACE = re.compile(r'\s+')
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def getClient():
+    """기본 OpenAI 서버의 공유 클라이언트"""
+    return clientPool().client()
+
+
+def isConnectionError(error):
+    """서버에 닿지 못한 오류(연결 실패, 시간 초과)인지
+
+    인증 실패(401)나 없는 모델(404) 같은 설정 오류는 서버가 응답한 것이므로 해당하지 않는다.
+    """
+    return (isinstance(error, (ConnectionError, TimeoutError))
+            or type(error).__name__ in ('APIConnectionError', 'APITimeoutError'))
+
+
+def createClient(base_url=None, api_key=None, max_connections=None, max_retries=2):
+    """새 OpenAI(호환) 클라이언트 생성, max_connections로 연결 풀 크기 지정"""
+    from openai import OpenAI
+    options = {}
+    if max_connections:
+        import httpx
+        options['http_client'] = httpx.Client(limits=httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        ))
+    # 키가 없으면 OpenAI()가 설정 오류를 내도록 둠 (키가 필요 없는 호환 서버는 백엔드에서 값을 넣음)
+    return OpenAI(
+        api_key=api_key or os.getenv("OPENAI_API_KEY"),
+        base_url=base_url,
+        max_retries=max_retries,
+        **options
+    )
+
+
+class ClientPool:
+    """OpenAI(호환) 서버 하나의 클라이언트(연결 풀)와 상태 확인 결과
+
+    클라이언트는 첫 요청 때 만든다 (openai/httpx 임포트 비용을 시작 시점에서 제외).
+    같은 서버를 쓰는 창과 채점기는 clientPool()로 같은 풀을 공유한다.
+    """
+    def __init__(self, base_url=None, api_key=None, max_connections=None):
+        self.base_url = base_url
+        self.api_key = api_key
+        self.max_connections = max_connections
+        self.lock = threading.Lock()
+        self._client = None
+        # None: 확인 전, True/False: 마지막 확인 또는 요청 결과
+        self.healthy = None
+        self.error = ''
+        self.checked_at = 0.0
+
+    def client(self):
+        with self.lock:
+            if self._client is None:
+                self._client = createClient(self.base_url, self.api_key, self.max_connections)
+            return self._client
+
+    def check(self, timeout=5.0):
+        """모델 목록을 요청해 서버 상태를 확인하고 (정상 여부, 응답 시간 ms, 오류)를 반환
+
+        연결 실패나 시간 초과일 때만 풀을 실패 상태로 두어 한동안 로컬에서 채점하게 한다.
+        인증이나 설정 오류는 로컬 채점으로 덮지 않고, 요청할 때 오류가 그대로 드러나도록 둔다.
+        """
+        start = time.perf_counter()
+        try:
+            self.client().with_options(timeout=timeout, max_retries=0).models.list()
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+            if isConnectionError(e):
+                self.markFailed(e)
+            return False, (time.perf_counter() - start) * 1000, error
+        self.healthy = True
+        self.error = ''
+        self.checked_at = time.monotonic()
+        return True, (time.perf_counter() - start) * 1000, ''
+
+    def markFailed(self, error):
+        self.healthy = False
+        self.error = f'{type(error).__name__}: {error}'
+        self.checked_at = time.monotonic()
+
+    def available(self):
+        """마지막으로 실패한 지 HEALTH_RETRY_SEC가 지나지 않았으면 False"""
+        return self.healthy is not False or time.monotonic() - self.checked_at >= HEALTH_RETRY_SEC
+
+
+def clientPool(base_url=None, api_key=None, max_connections=None):
+    key = (base_url, api_key, max_connections)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ClientPool(base_url, api_key, max_connections)
+        return pool
+
+
+def warmUp():
+    """클라이언트를 만들고 API 서버와 연결을 맺어 둠 (첫 채점의 임포트/TLS 지연 제거)"""
+    clientPool().check()
+
+
+def compactQuestion(question, limit=QUESTION_CHAR_LIMIT):
+    """공백을 줄이고, 너무 긴 문제는 앞부분과 끝부분만 남김 (빈칸 문제는 끝에 빈칸이 있는 경우가 많음)"""
+    question = _WHITESPACE.sub(' ', question).strip()
+    if limit and len(question) > limit:
+        head = limit * 2 // 3
+        question = question[:head] + '…' + question[len(question) - (limit - head - 1):]
+    return question
+
+
+def formatItem(question, correct_answer, user_answer):
+    return f"Q: {compactQuestion(question)}\nA: {correct_answer}\nU: {user_answer}"
+
+
+class JudgeReplyError(ValueError):
+    """채점 응답이 Y/N이 아님 (오답으로 캐시하지 않고 실패로 처리해 다시 채점)"""
+
+
+def parseVerdict(content):
+    """단일 채점 응답(Y/N, 앞뒤 공백·따옴표·마침표 허용)을 정답 여부로, 그 밖의 응답은 JudgeReplyError"""
+    reply = (content or '').strip().strip('"\'.').strip().upper()
+    if reply in ('Y', 'YES'):
+        return True
+    if reply in ('N', 'NO'):
+        return False
+    raise JudgeReplyError(f'채점 응답을 해석할 수 없습니다: {content!r}')
+
+
+def judgeAnswer(question, correct_answer, user_answer, timeout=GRADING_TIMEOUT, client=None, meter=None,
+                model=MODEL):
+    """OpenAI로 답안을 채점하여 정답 여부를 반환 (meter를 주면 토큰 사용량을 집계)
+
+    응답이 Y/N이 아니면 JudgeReplyError를 낸다 (호출한 쪽에서 캐시하지 않도록).
+    """
+    messages = [
+        {"role": "system", "content": JUDGE_PROMPT},
+        {"role": "user", "content": formatItem(question, correct_answer, user_answer)},
+    ]
+    response = (client or getClient()).chat.completions.create(
+        model=model,
+        temperature=0,
+        # Y/N 한 글자 (앞에 공백이나 따옴표가 붙어도 잘리지 않도록 약간 여유)
+        max_tokens=3,
+        timeout=timeout,
+        messages=messages
+    )
+    content = response.choices[0].message.content
+    if meter is not None:
+        meter.record(response, messages, content)
+    return parseVerdict(content)
+
+
+def estimateTokens(text):
+    """토크나이저 없이 쓰는 보수적인 토큰 수 추정 (UTF-8 3바이트 ≈ 1토큰)"""
+    return len(text.encode('utf-8')) // 3 + 1
+
+
+def formatBatchItem(item, number=0):
+    """일괄 요청의 n번째 문항 (응답은 번호 순서의 Y/N 문자열이라 긴 id 대신 번호를 씀)"""
+    return f"[{number}] " + formatItem(item.question, item.correct_answer, item.user_answer)
+
+
+def chunkItems(items, token_budget=BATCH_TOKEN_BUDGET, max_items=BATCH_MAX_ITEMS):
+    """문항들을 요청 1건의 토큰 예산과 문항 수 제한에 맞게 나눔"""
+    chunks = []
+    current = []
+    used = estimateTokens(JUDGE_PROMPT)
+    for item in items:
+        cost = estimateTokens(formatBatchItem(item, len(current) + 1))
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            chunks.append(current)
+            current = []
+            used = estimateTokens(JUDGE_PROMPT)
+        current.append(item)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def judgeBatch(items, timeout=GRADING_TIMEOUT, client=None, meter=None, model=MODEL):
+    """문항 여러 개를 요청 1건으로 채점하여 {id: 정답 여부}를 반환
+
+    응답의 판정 수가 문항 수와 다르거나 형식이 잘못되면 빈 결과를 반환한다.
+    """
+    messages = [
+        {"role": "system", "content": JUDGE_PROMPT},
+        {"role": "user", "content": "\n".join(formatBatchItem(item, n) for n, item in enumerate(items, 1))},
+    ]
+    response = (client or getClient()).chat.completions.create(
+        model=model,
+        temperature=0,
+        # {"v":"YNY..."}: 문항당 1토큰 이하
+        max_tokens=8 + len(items),
+        timeout=timeout,
+        response_format={"type": "json_object"},
+        messages=messages
+    )
+    content = response.choices[0].message.content
+    if meter is not None:
+        meter.record(response, messages, content, judgments=len(items))
+    return parseBatchVerdicts(content, items)
+
+
+def parseBatchVerdicts(content, items):
+    try:
+        verdicts = json.loads(content)["v"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return {}
+    if not isinstance(verdicts, str):
+        return {}
+    verdicts = verdicts.replace(' ', '').replace(',', '').upper()
+    if len(verdicts) != len(items) or set(verdicts) - {'Y', 'N'}:
+        return {}
+    return {item.id: verdict == 'Y' for item, verdict in zip(items, verdicts)}
+
+
+class UsageMeter:
+    """AI 채점 요청의 토큰 수와 비용을 집계하고 세션 토큰 예산을 확인 (작업 스레드에서 호출)
+
+    OpenAI 호환 서버가 usage를 돌려주지 않으면 요청/응답 글자 수로 추정한다.
+    """
+    def __init__(self, budget=SESSION_TOKEN_BUDGET):
+        self.budget = budget
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.judgments = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+
+    def record(self, response, messages, content='', judgments=1):
+        usage = getattr(response, 'usage', None)
+        if usage is not None and usage.prompt_tokens:
+            prompt = usage.prompt_tokens
+            completion = usage.completion_tokens or 0
+            details = getattr(usage, 'prompt_tokens_details', None)
+            cached = (getattr(details, 'cached_tokens', 0) or 0) if details is not None else 0
+        else:
+            prompt = sum(estimateTokens(message['content']) for message in messages)
+            completion = estimateTokens(content or '')
+            cached = 0
+        with self.lock:
+            self.requests += 1
+            self.judgments += judgments
+            self.prompt_tokens += prompt
+            self.cached_tokens += cached
+            self.completion_tokens += completion
+
+    def totalTokens(self):
+        return self.prompt_tokens + self.completion_tokens
+
+    def exhausted(self):
+        return bool(self.budget) and self.totalTokens() >= self.budget
+
+    def cost(self):
+        """USD 기준 추정 비용"""
+        uncached = self.prompt_tokens - self.cached_tokens
+        return (uncached * PRICE_INPUT + self.cached_tokens * PRICE_CACHED_INPUT
+                + self.completion_tokens * PRICE_OUTPUT) / 1_000_000
+
+    def stats(self):
+        with self.lock:
+            total = self.totalTokens()
+            return {
+                'requests': self.requests,
+                'judgments': self.judgments,
+                'prompt_tokens': self.prompt_tokens,
+                'cached_tokens': self.cached_tokens,
+                'completion_tokens': self.completion_tokens,
+                'tokens_per_judgment': total / self.judgments if self.judgments else 0.0,
+                'cost_usd': self.cost(),
+                'budget': self.budget,
+                'exhausted': self.exhausted(),
+            }
+
+
+def gradeBatch(items, judge_batch=judgeBatch, timeout=GRADING_TIMEOUT,
+               token_budget=BATCH_TOKEN_BUDGET, max_items=BATCH_MAX_ITEMS, max_retries=2, meter=None):
+    """문항들을 묶음 단위로 채점하고, 실패한 문항만 골라 다시 요청
+
+    (verdicts, failed)를 반환: verdicts는 {id: 정답 여부}, failed는 끝내 채점하지 못한 문항 목록.
+    meter의 토큰 예산을 다 쓰면 남은 문항은 요청하지 않고 failed에 넣는다.
+    """
+    verdicts = {}
+    remaining = list(items)
+    for attempt in range(max_retries + 1):
+        failed = []
+        for chunk in chunkItems(remaining, token_budget, max_items):
+            if meter is not None and meter.exhausted():
+                failed.extend(chunk)
+                continue
+            try:
+                results = judge_batch(chunk, timeout=timeout)
+            except Exception:
+                results = {}
+            verdicts.update(results)
+            failed.extend(item for item in chunk if item.id not in results)
+        remaining = failed
+        if not remaining:
+            break
+    return verdicts, remaining
+
+
+class StubGrader:
+    """API 없이 느린 응답을 흉내 내는 테스트용 채점기"""
+    def __init__(self, delay=2.0):
+        self.delay = delay
+
+    def __call__(self, question, correct_answer, user_answer, timeout=GRADING_TIMEOUT):
+        time.sleep(self.delay)
+        return self.compare(correct_answer, user_answer)
+
+    def batch(self, items, timeout=GRADING_TIMEOUT):
+        time.sleep(self.delay)
+        return {item.id: self.compare(item.correct_answer, item.user_answer) for item in items}
+
+    def compare(self, correct_answer, user_answer):
+        return user_answer.strip().lower() == correct_answer.strip().lower()
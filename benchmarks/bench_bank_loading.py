@@ -0,0 +1,34 @@
+"""여러 문제 파일 병합 로딩 시간 측정
+
+사용법: python benchmarks/bench_bank_loading.py [파일 수] [파일당 문제 수]
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import expandSources, loadBank
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(file_count):
+            questions = {f'L{i} 문제 {j}: The ____ of item {j}': f'answer {j}' for j in range(per_file)}
+            with open(os.path.join(folder, f'L{i}.json'), 'w', encoding='utf-8') as file:
+                json.dump(questions, file, ensure_ascii=False, indent=4)
+
+        start = time.perf_counter()
+        bank = loadBank(expandSources(folder))
+        elapsed = time.perf_counter() - start
+
+    print(f'파일 {file_count}개, 문제 {len(bank)}개, 중복 {len(bank.duplicates)}개: {elapsed * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""JSON 로딩과 .qbank(mmap) 로딩의 시작 시간/메모리 비교
+
+사용법: python benchmarks/bench_compiled_bank.py [문제 수]
+각 방식은 새 프로세스에서 측정한다 (파일은 OS 페이지 캐시에 올라가 있을 수 있음).
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from compiled_bank import compileBank
+
+CHILD = '''
+import sys, time, resource
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+if {path!r}.endswith('.qbank'):
+    from compiled_bank import CompiledBank, CompiledQuestionPool
+    pool = CompiledQuestionPool(CompiledBank({path!r}), seed=0)
+else:
+    import json
+    from question_pool import QuestionPool
+    with open({path!r}, 'r', encoding='utf-8') as file:
+        pool = QuestionPool(json.load(file), seed=0)
+loaded = time.perf_counter()
+for _ in range(100):
+    question = pool.draw()
+    answer = pool[question]
+done = time.perf_counter()
+# ru_maxrss는 fork 직후 부모의 메모리까지 포함할 수 있어 VmHWM을 우선 사용
+try:
+    with open('/proc/self/status') as status:
+        peak_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM'))
+except OSError:
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(loaded - start, done - loaded, peak_kb)
+'''
+
+
+def measure(path):
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD.format(root=ROOT, path=path)],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    load, draw, rss_kb = float(output[0]), float(output[1]), int(output[2])
+    return load, draw, rss_kb
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    questions = {
+        f'L{i % 10 + 19} 문제 {i}: In retrieval-augmented generation, the ____ is used for item {i}': f'dense vectors {i}'
+        for i in range(size)
+    }
+
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = os.path.join(folder, 'bank.json')
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump(questions, file, ensure_ascii=False, indent=4)
+        qbank_path = os.path.join(folder, 'bank.qbank')
+        compileBank(questions, qbank_path)
+        zbank_path = os.path.join(folder, 'bank_z.qbank')
+        compileBank(questions, zbank_path, compress=True)
+
+        print(f'문제 수: {size}')
+        for label, path in (('json', json_path), ('qbank', qbank_path), ('qbank+zlib', zbank_path)):
+            load, draw, rss_kb = measure(path)
+            print(f'{label:<11} 파일 {os.path.getsize(path) / 1e6:7.1f} MB | '
+                  f'로딩 {load * 1000:8.1f} ms | 100문제 {draw * 1000:6.2f} ms | 최대 RSS {rss_kb / 1024:7.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
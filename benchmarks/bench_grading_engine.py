@@ -0,0 +1,46 @@
+"""GradingEngine 처리량 측정 (가짜 OpenAI 호환 서버 사용)
+
+사용법: python benchmarks/bench_grading_engine.py [답안 수] [--workers 16] [--rate 50] [--latency 0.2] [--error-rate 0.05]
+"""
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from grading import JudgeItem
+from grading_engine import GradingEngine
+from fake_openai_server import startServer
+
+
+def main():
+    args = sys.argv[1:]
+
+    def option(name, default):
+        return type(default)(args[args.index(name) + 1]) if name in args else default
+
+    count = int(args[0]) if args and not args[0].startswith('--') else 200
+    latency = option('--latency', 0.2)
+    server, base_url = startServer(latency=latency, error_rate=option('--error-rate', 0.05))
+
+    items = [
+        JudgeItem(i, f'문제 {i}', f'answer {i}', f'answer {i}' if i % 3 else f'wrong {i}')
+        for i in range(count)
+    ]
+    results = {}
+    for workers in (1, option('--workers', 16)):
+        engine = GradingEngine(
+            base_url=base_url, api_key='fake', max_workers=workers,
+            rate=option('--rate', 50.0), backoff=0.05
+        )
+        verdicts = engine.gradeMany(items)
+        wrong = sum(1 for item in items if verdicts[item.id] is not None and verdicts[item.id] != (item.id % 3 != 0))
+        results[f'workers_{workers}'] = dict(engine.stats(), mismatched=wrong)
+        print(f'workers={workers:<3}', json.dumps(results[f'workers_{workers}'], ensure_ascii=False))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""모듈 임포트 시간 측정 (python -X importtime 결과 요약)
+
+사용법: python benchmarks/bench_import_time.py [모듈 ...] [--json 결과.json]
+"""
+import os
+import sys
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODULES = ['main', 'quiz_app', 'quiz_app_advanced', 'json_creator']
+
+
+def measure(module):
+    """새 인터프리터에서 모듈을 임포트하고 누적 임포트 시간을 반환"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # "import time:   self |  cumulative | 패키지" (들여쓰기 = 중첩 깊이)
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'unknown error'
+        return {'module': module, 'error': error}
+
+    # importtime은 자식을 부모보다 먼저 출력하므로, 대상 모듈 직전의 깊이 1 항목이 직접 임포트한 패키지
+    total = 0
+    children = []
+    group = []
+    for entry in entries:
+        if entry[1] == 0:
+            if entry[0] == module:
+                total = entry[3]
+                children = group
+            group = []
+        elif entry[1] == 1:
+            group.append(entry)
+    heaviest = sorted(children, key=lambda e: e[3], reverse=True)[:10]
+    return {
+        'module': module,
+        'total_ms': total / 1000,
+        'heaviest': [{'name': n, 'cumulative_ms': c / 1000} for n, _, _, c in heaviest],
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    json_path = None
+    if '--json' in args:
+        position = args.index('--json')
+        json_path = args[position + 1]
+        del args[position:position + 2]
+    modules = args or DEFAULT_MODULES
+
+    results = [measure(module) for module in modules]
+    for result in results:
+        if 'error' in result:
+            print(f"{result['module']:<20} 실패: {result['error']}")
+            continue
+        print(f"{result['module']:<20} {result['total_ms']:8.1f} ms")
+        for item in result['heaviest'][:5]:
+            print(f"    {item['name']:<30} {item['cumulative_ms']:8.1f} ms")
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=4)
+
+
+if __name__ == '__main__':
+    main()
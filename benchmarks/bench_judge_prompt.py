@@ -0,0 +1,94 @@
+"""AI 채점 요청의 판정당 토큰 수 비교 (이전 프롬프트 형식 → 현재 형식)
+
+사용법: python benchmarks/bench_judge_prompt.py ["Questions/*/*.json"] [--answers 2000]
+API를 호출하지 않고 요청/응답 본문을 만들어 토큰 수를 센다 (tiktoken이 있으면
+o200k_base 토크나이저, 없으면 ai_judge.estimateTokens 추정치). 응답은 모델이
+형식대로 답했다고 가정한 본문이다.
+"""
+import os
+import sys
+import json
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_judge import BATCH_MAX_ITEMS, JUDGE_PROMPT, estimateTokens, formatBatchItem, formatItem
+from grading import JudgeItem
+from question_bank import expandSources, loadBank
+from synthetic_bank import makeAnswers
+
+# 이전 형식: 단일/일괄 프롬프트가 달라 접두부를 공유하지 않고, 문제 전체와 긴 필드 이름을 보냄
+LEGACY_JUDGE_PROMPT = ("You are a quiz judge. Compare the user's answer to the correct answer. Reply with ONLY "
+                       "'Yes' if correct (even if phrased differently or in another language), or 'No' if incorrect.")
+LEGACY_BATCH_PROMPT = (
+    "You are a quiz judge. For each numbered item, compare the user's answer to the correct answer. "
+    "An answer is correct even if phrased differently or in another language. "
+    'Reply with ONLY a JSON object: {"verdicts": [{"id": <item id>, "correct": true|false}, ...]} '
+    "with exactly one entry per item."
+)
+# 채팅 형식이 메시지마다 붙이는 토큰 수
+MESSAGE_OVERHEAD = 4
+
+
+def tokenCounter():
+    try:
+        import tiktoken
+    except ImportError:
+        return estimateTokens, 'estimate'
+    encoding = tiktoken.get_encoding('o200k_base')
+    return lambda text: len(encoding.encode(text)), 'o200k_base'
+
+
+def requestTokens(count, system, user, reply):
+    return count(system) + count(user) + 2 * MESSAGE_OVERHEAD + count(reply)
+
+
+def measure(items, count, batch_size):
+    """{형식: 판정당 토큰 수}"""
+    single = {'before': 0, 'after': 0}
+    for item in items:
+        legacy_user = (f"Question: {item.question}\nCorrect Answer: {item.correct_answer}\n"
+                       f"User's Answer: {item.user_answer}")
+        single['before'] += requestTokens(count, LEGACY_JUDGE_PROMPT, legacy_user, 'Yes')
+        single['after'] += requestTokens(count, JUDGE_PROMPT,
+                                         formatItem(item.question, item.correct_answer, item.user_answer), 'Y')
+
+    batch = {'before': 0, 'after': 0}
+    for start in range(0, len(items), batch_size):
+        chunk = items[start:start + batch_size]
+        legacy_user = "\n\n".join(
+            f"[{item.id}] Question: {item.question}\nCorrect Answer: {item.correct_answer}\n"
+            f"User's Answer: {item.user_answer}" for item in chunk
+        )
+        legacy_reply = json.dumps({'verdicts': [{'id': item.id, 'correct': True} for item in chunk]})
+        batch['before'] += requestTokens(count, LEGACY_BATCH_PROMPT, legacy_user, legacy_reply)
+        user = "\n".join(formatBatchItem(item, n) for n, item in enumerate(chunk, 1))
+        batch['after'] += requestTokens(count, JUDGE_PROMPT, user, json.dumps({'v': 'Y' * len(chunk)}))
+
+    return {
+        'single': {key: value / len(items) for key, value in single.items()},
+        'batch': {key: value / len(items) for key, value in batch.items()},
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    answers = int(args[args.index('--answers') + 1]) if '--answers' in args else 2000
+    source = args[0] if args and not args[0].startswith('--') else os.path.join(ROOT, 'Questions', '*', '*.json')
+    questions = loadBank(expandSources(source)).answers
+    if not questions:
+        print(f'문제 파일이 없습니다: {source}', file=sys.stderr)
+        sys.exit(1)
+
+    items = [JudgeItem(n, *item) for n, item in enumerate(makeAnswers(questions, answers))]
+    count, tokenizer = tokenCounter()
+    results = measure(items, count, BATCH_MAX_ITEMS)
+    print(f'문제 {len(questions)}개, 답안 {len(items)}개, 토크나이저 {tokenizer}')
+    for mode, values in results.items():
+        saved = (1 - values['after'] / values['before']) * 100
+        print(f"{mode:<7} 판정당 토큰 {values['before']:6.1f} → {values['after']:6.1f} ({saved:.0f}% 감소)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""문제 추첨 방식 비교: random.choice(list(dict)) vs QuestionPool
+
+사용법: python benchmarks/bench_question_pool.py [문제 수]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_pool import QuestionPool
+
+
+def makeBank(size):
+    return {f'문제 {i}: What is item {i}?': f'answer {i}' for i in range(size)}
+
+
+def runDict(bank, rounds, rng):
+    ques = dict(bank)
+    start = time.perf_counter()
+    for turn in range(rounds):
+        question = rng.choice(list(ques.keys()))
+        if turn % 2 == 0:
+            ques.pop(question)
+    return time.perf_counter() - start
+
+
+def runPool(bank, rounds, seed):
+    pool = QuestionPool(bank, seed=seed)
+    start = time.perf_counter()
+    question = None
+    for turn in range(rounds):
+        question = pool.draw(avoid=question)
+        if turn % 2 == 0:
+            pool.pop(question)
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rounds = min(size, 2000)
+    bank = makeBank(size)
+
+    dict_time = runDict(bank, rounds, random.Random(0))
+    pool_time = runPool(bank, rounds, 0)
+
+    print(f'문제 수: {size}, 출제 횟수: {rounds}')
+    print(f'random.choice(list(...)): {dict_time / rounds * 1e6:10.2f} us/문제')
+    print(f'QuestionPool.draw:        {pool_time / rounds * 1e6:10.2f} us/문제')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""퀴즈 창 생성 시간/메모리 측정 (런처에서 여러 창을 연 상황)
+
+사용법: python benchmarks/bench_quiz_windows.py [창 수]
+화면 없이 (QT_QPA_PLATFORM=offscreen) Basic/AI 창을 번갈아 만들고,
+창 하나당 생성·표시 시간과 늘어난 최대 메모리를 출력한다.
+"""
+import os
+import sys
+import time
+import resource
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    folder = tempfile.mkdtemp()
+    # 창마다 여는 DB는 임시 폴더에 (사용자 기록을 건드리지 않도록)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ['QUIZ_RESULTS_DB'] = os.path.join(folder, 'results.db')
+    os.environ['QUIZ_SCHEDULE_DB'] = os.path.join(folder, 'schedule.db')
+
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')
+
+    import quiz_app
+    import quiz_app_advanced
+    from ai_judge import StubGrader
+    from verdict_cache import VerdictCache
+
+    factories = {
+        'basic': quiz_app.QuizApp,
+        'ai': lambda: quiz_app_advanced.QuizApp(grader=StubGrader(), verdict_cache=VerdictCache(':memory:')),
+    }
+    windows = []
+    for name, factory in factories.items():
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        times = []
+        for _ in range(count):
+            start = time.perf_counter()
+            window = factory()
+            window.show()
+            app.processEvents()
+            times.append((time.perf_counter() - start) * 1000)
+            windows.append(window)
+        grown_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+        first = times[0]
+        times.sort()
+        print(f'{name:<6} 첫 창 {first:7.1f} ms  중앙값 {times[len(times) // 2]:7.1f} ms  '
+              f'창당 메모리 {grown_kb / count:8.0f} KB')
+
+    for window in windows:
+        window.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""큰 JSON 문제 파일의 json.load와 스트리밍 로딩 비교 (첫 문제까지 걸린 시간/전체 시간/최대 메모리)
+
+사용법: python benchmarks/bench_streaming_load.py [문제 수]
+각 방식은 새 프로세스에서 측정한다.
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = '''
+import sys, time, json
+sys.path.insert(0, {root!r})
+from question_bank import iterQuestions
+start = time.perf_counter()
+first = None
+if {mode!r} == 'stream':
+    questions = {{}}
+    for question, answer in iterQuestions({path!r}):
+        if first is None:
+            first = time.perf_counter()
+        questions[question] = answer
+else:
+    with open({path!r}, 'r', encoding='utf-8') as file:
+        questions = json.load(file)
+    first = time.perf_counter()
+done = time.perf_counter()
+with open('/proc/self/status') as status:
+    peak_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM'))
+print(first - start, done - start, peak_kb, len(questions))
+'''
+
+
+def measure(path, mode):
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD.format(root=ROOT, path=path, mode=mode)],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), float(output[1]), int(output[2])
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'bank.json')
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({
+                f'L{i % 10 + 19} 문제 {i}: In retrieval-augmented generation, the ____ is used for item {i}':
+                    f'dense vectors {i}' for i in range(size)
+            }, file, ensure_ascii=False, indent=4)
+
+        print(f'문제 수: {size}, 파일 {os.path.getsize(path) / 1e6:.1f} MB')
+        for mode in ('json', 'stream'):
+            first, total, rss_kb = measure(path, mode)
+            print(f'{mode:<7} 첫 문제 {first * 1000:8.1f} ms | 전체 {total * 1000:8.1f} ms | 최대 RSS {rss_kb / 1024:7.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""로컬 테스트용 가짜 OpenAI 호환 채점 서버
+
+/v1/chat/completions 요청의 정답(A:)과 답안(U:)을 비교해 Y/N으로 답한다.
+번호가 붙은 일괄 요청("[1] Q: ...")에는 {"v": "YN..."}으로, GET /v1/models에는 모델 목록으로 답한다
+(grader_backends.py check로 상태 확인 가능).
+사용법: python benchmarks/fake_openai_server.py [--port 8765] [--latency 0.2] [--error-rate 0.05]
+"""
+import re
+import sys
+import json
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_ANSWERS = re.compile(r"\nA: (.*)\nU: (.*)")
+_BATCH_ITEMS = re.compile(r"^\[\d+\] Q: .*\nA: (.*)\nU: (.*)$", re.MULTILINE)
+
+
+def isCorrect(correct_answer, user_answer):
+    return correct_answer.strip().lower() == user_answer.strip().lower()
+
+
+class FakeJudgeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.rstrip('/').endswith('/models'):
+            self.reply(200, {
+                'object': 'list',
+                'data': [{'id': self.server.model, 'object': 'model', 'created': 0, 'owned_by': 'fake'}],
+            })
+            return
+        self.reply(404, {'error': {'message': f'unknown path {self.path}', 'type': 'invalid_request_error'}})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+        server = self.server
+
+        time.sleep(server.latency)
+        with server.lock:
+            server.requests += 1
+        if random.random() < server.error_rate:
+            status = random.choice((429, 500, 503))
+            self.reply(status, {'error': {'message': 'fake error', 'type': 'server_error'}})
+            return
+
+        content = body['messages'][-1]['content']
+        items = _BATCH_ITEMS.findall(content)
+        if items:
+            reply = json.dumps({'v': ''.join('Y' if isCorrect(*item) else 'N' for item in items)})
+        else:
+            match = _ANSWERS.search(content)
+            reply = 'Y' if match and isCorrect(*match.groups()) else 'N'
+        self.reply(200, {
+            'id': 'chatcmpl-fake',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'fake'),
+            'choices': [{
+                'index': 0,
+                'finish_reason': 'stop',
+                'message': {'role': 'assistant', 'content': reply},
+            }],
+            'usage': {'prompt_tokens': len(content) // 4, 'completion_tokens': len(reply) // 2 + 1,
+                      'total_tokens': len(content) // 4 + len(reply) // 2 + 1},
+        })
+
+    def reply(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def startServer(port=0, latency=0.05, error_rate=0.0, model='fake-judge'):
+    """백그라운드 스레드에서 서버를 띄우고 (server, base_url)을 반환"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), FakeJudgeHandler)
+    server.daemon_threads = True
+    server.model = model
+    server.latency = latency
+    server.error_rate = error_rate
+    server.requests = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/v1'
+
+
+def main():
+    args = sys.argv[1:]
+
+    def option(name, default):
+        return type(default)(args[args.index(name) + 1]) if name in args else default
+
+    server, base_url = startServer(option('--port', 8765), option('--latency', 0.2), option('--error-rate', 0.0))
+    print(f'가짜 채점 서버 실행 중: {base_url}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+"""로딩/추첨/로컬 채점/진행 저장·재개/AI 채점(가짜 채점기) 통합 벤치마크
+
+사용법:
+    python benchmarks/run_benchmarks.py --sizes 1000,10000,100000 --output results.json
+    python benchmarks/run_benchmarks.py --sizes 1000000 --skip ai --compare baseline.json
+
+결과는 JSON 파일로 저장되며, --compare로 이전 결과와 비교해 threshold(%) 이상
+느려진 항목을 표시한다 (하나라도 있으면 종료 코드 1).
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_bank import makeAnswers, makeBank
+from grading import JudgeItem, TieredGrader
+from compiled_bank import compileBank
+from progress_journal import ProgressJournal
+from question_pool import QuestionPool
+from quiz_core import Grader, QuizSession
+from scheduler import ScheduledQuestionPool, Scheduler
+
+SECTIONS = ('load', 'draw', 'match', 'journal', 'ai')
+
+
+def measure(function, repeat):
+    """function을 repeat번 실행한 소요 시간(ms)의 중앙값/최솟값"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return {'median_ms': statistics.median(times), 'min_ms': min(times)}
+
+
+def perOp(result, operations):
+    result['per_op_us'] = result['median_ms'] * 1000 / operations
+    return result
+
+
+def benchLoad(folder, questions, repeat):
+    json_path = os.path.join(folder, 'bank.json')
+    with open(json_path, 'w', encoding='utf-8') as file:
+        json.dump(questions, file, ensure_ascii=False, indent=4)
+    qbank_path = os.path.join(folder, 'bank.qbank')
+    compileBank(questions, qbank_path)
+
+    def load(method, path):
+        session = QuizSession(journal=False)
+        getattr(session, method)(path)
+
+    return {
+        'json': measure(lambda: load('load', json_path), repeat),
+        'stream': measure(lambda: load('loadStreaming', json_path), repeat),
+        'qbank': measure(lambda: load('load', qbank_path), repeat),
+    }
+
+
+def benchDraw(questions, operations, repeat, seed):
+    results = {}
+    for label, make in (
+        ('random', lambda: QuestionPool(questions, seed=seed)),
+        ('scheduled', lambda: ScheduledQuestionPool(questions, Scheduler(user='bench'), seed=seed)),
+    ):
+        pool = make()
+
+        def run():
+            # 뽑고, 절반은 맞힌 것으로 빼고 다시 넣어 풀 크기를 유지
+            for n in range(operations):
+                question = pool.draw()
+                if n % 2:
+                    answer = pool.pop(question)
+                    pool.add(question, answer)
+                elif label == 'scheduled':
+                    pool.scheduler.review(question, False)
+                    pool.reschedule(question)
+
+        results[label] = perOp(measure(run, repeat), operations)
+    return results
+
+
+def benchMatch(answers, repeat):
+    results = {}
+    for label, tiers in (('exact', ('exact',)), ('tiered', None)):
+        grader = TieredGrader(tiers=tiers) if tiers else TieredGrader()
+
+        def run():
+            for _, correct, answer in answers:
+                grader.gradeLocal(correct, answer)
+
+        results[label] = perOp(measure(run, repeat), len(answers))
+    return results
+
+
+def benchJournal(folder, questions, operations, repeat):
+    keys = list(questions)[:operations]
+    path = os.path.join(folder, 'progress.jsonl')
+
+    def save():
+        if os.path.exists(path):
+            os.remove(path)
+        journal = ProgressJournal(path, 'bench')
+        journal.open()
+        for n, question in enumerate(keys):
+            journal.append(question, n % 3 != 0)
+        journal.close()
+
+    def resume():
+        journal = ProgressJournal(path, 'bench')
+        journal.open()
+        journal.apply(questions)
+        journal.close()
+
+    return {
+        'save': perOp(measure(save, repeat), len(keys)),
+        'resume': measure(resume, repeat),
+    }
+
+
+def benchAI(answers, latency, workers):
+    from grading_engine import GradingEngine
+
+    def judge(question, correct_answer, user_answer, timeout=None):
+        time.sleep(latency)
+        return user_answer.strip().casefold() == correct_answer.casefold()
+
+    items = [JudgeItem(n, *item) for n, item in enumerate(answers)]
+    results = {}
+    for count in sorted({1, workers}):
+        engine = GradingEngine(judge=judge, max_workers=count, rate=1e6)
+        start = time.perf_counter()
+        Grader(TieredGrader(), None, judge).gradeMany(items, engine)
+        elapsed = time.perf_counter() - start
+        results[f'workers_{count}'] = dict(engine.stats(), elapsed_ms=elapsed * 1000)
+    return results
+
+
+def runSize(size, args):
+    questions = makeBank(size, args.lang, args.seed)
+    answers = makeAnswers(questions, args.answers, args.seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        if 'load' in args.sections:
+            results['load'] = benchLoad(folder, questions, args.repeat)
+        if 'draw' in args.sections:
+            results['draw'] = benchDraw(questions, args.operations, args.repeat, args.seed)
+        if 'match' in args.sections:
+            results['match'] = benchMatch(answers, args.repeat)
+        if 'journal' in args.sections:
+            results['journal'] = benchJournal(folder, questions, min(size, args.operations), args.repeat)
+        if 'ai' in args.sections:
+            results['ai'] = benchAI(answers[:args.ai_answers], args.stub_latency, args.workers)
+    return results
+
+
+def gitRevision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(results, prefix=''):
+    """{'100000.load.json.median_ms': 12.3, ...} 형태로 펼침"""
+    flat = {}
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + '.'))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+
+def compare(current, baseline, threshold):
+    """소요 시간 지표(median_ms, per_op_us)가 threshold% 이상 늘어난 항목 목록"""
+    regressions = []
+    old = flatten(baseline['results'])
+    for name, value in flatten(current['results']).items():
+        if not name.endswith(('median_ms', 'per_op_us')) or name not in old or old[name] <= 0:
+            continue
+        change = (value - old[name]) / old[name] * 100
+        if change >= threshold:
+            regressions.append((name, old[name], value, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='퀴즈 앱 핵심 경로 벤치마크')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='문제 수 목록 (쉼표 구분, 최대 1000000 권장)')
+    parser.add_argument('--lang', choices=('ko', 'en', 'mixed'), default='mixed')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5, help='항목별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--operations', type=int, default=20000, help='추첨/저장 측정 횟수')
+    parser.add_argument('--answers', type=int, default=20000, help='로컬 채점 측정 답안 수')
+    parser.add_argument('--ai-answers', type=int, default=200, help='AI 채점 측정 답안 수')
+    parser.add_argument('--stub-latency', type=float, default=0.05, help='가짜 AI 채점기 응답 시간 (초)')
+    parser.add_argument('--workers', type=int, default=16, help='AI 채점 동시 요청 수')
+    parser.add_argument('--skip', default='', help=f'건너뛸 항목 (쉼표 구분: {",".join(SECTIONS)})')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=20.0, help='회귀로 볼 증가율 (%%)')
+    args = parser.parse_args(argv)
+    skipped = {name.strip() for name in args.skip.split(',') if name.strip()}
+    args.sections = [name for name in SECTIONS if name not in skipped]
+    random.seed(args.seed)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'git': gitRevision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'args': {key: value for key, value in vars(args).items() if key != 'sections'},
+        },
+        'results': {},
+    }
+    for size in (int(size) for size in args.sizes.split(',')):
+        start = time.perf_counter()
+        report['results'][str(size)] = runSize(size, args)
+        print(f'문제 {size}개: {time.perf_counter() - start:.1f}초', file=sys.stderr)
+        print(json.dumps({size: report['results'][str(size)]}, ensure_ascii=False, indent=4))
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=4)
+    print(f'결과 저장: {args.output}', file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            regressions = compare(report, json.load(file), args.threshold)
+        for name, old, new, change in regressions:
+            print(f'회귀: {name} {old:.3f} → {new:.3f} (+{change:.0f}%)', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
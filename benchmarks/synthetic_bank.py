@@ -0,0 +1,61 @@
+"""벤치마크용 합성 문제 모음 생성 (Questions/대인지 퀴즈와 비슷한 빈칸형 한국어/영어 문제)"""
+import random
+
+
+EN_TEMPLATES = [
+    'In retrieval-augmented generation, the ____ is used to {verb} {noun} for item {i}',
+    'The main advantage of {noun} methods like {name} is that they are ____ and ____ (case {i})',
+    'The key limitation of {noun} is its failure to capture ____ and ____ in scenario {i}',
+    '{name} improves {noun} by applying ____ before the {verb} step #{i}',
+]
+KO_TEMPLATES = [
+    '{ko_noun}에서 ____ 은/는 {ko_verb} 위해 사용된다 (항목 {i})',
+    'L{lecture} {ko_noun}의 주요 장점은 ____ 과 ____ 이다 #{i}',
+    '{name} 방식이 {ko_noun}을 개선하는 핵심 원리는 ____ 이다 (사례 {i})',
+    '{ko_noun}의 한계는 ____ 를 반영하지 못한다는 점이다 [{i}]',
+]
+EN_WORDS = ['dense vectors', 'keyword overlap', 'semantic meaning', 'cross encoder', 'query expansion',
+            'chunking', 'reranking', 'embedding drift', 'fast and interpretable', 'synonyms']
+KO_WORDS = ['밀집 벡터', '키워드 중복', '의미 정보', '교차 인코더', '질의 확장',
+            '문서 분할', '재순위화', '임베딩 변화', '빠르고 해석 가능', '동의어']
+NOUNS = ['sparse retrieval', 'dense retrieval', 'hybrid search', 'prompt tuning', 'vector indexing']
+KO_NOUNS = ['희소 검색', '밀집 검색', '하이브리드 검색', '프롬프트 튜닝', '벡터 색인']
+VERBS = ['rank', 'retrieve', 'encode', 'filter']
+KO_VERBS = ['순위를 매기기', '문서를 찾기', '문장을 인코딩하기', '결과를 거르기']
+NAMES = ['BM25', 'DPR', 'ColBERT', 'SPLADE', 'HyDE']
+
+
+def makeBank(size, lang='mixed', seed=0):
+    """{문제: 정답} 딕셔너리 (lang: ko, en, mixed), 같은 seed면 같은 결과"""
+    rng = random.Random(seed)
+    questions = {}
+    for i in range(size):
+        korean = lang == 'ko' or (lang == 'mixed' and i % 2 == 0)
+        template = rng.choice(KO_TEMPLATES if korean else EN_TEMPLATES)
+        question = template.format(
+            i=i, lecture=19 + i % 10, verb=rng.choice(VERBS), noun=rng.choice(NOUNS), name=rng.choice(NAMES),
+            ko_noun=rng.choice(KO_NOUNS), ko_verb=rng.choice(KO_VERBS)
+        )
+        questions[question] = rng.choice(KO_WORDS if korean else EN_WORDS)
+    return questions
+
+
+def makeAnswers(questions, count, seed=0):
+    """채점용 (문제, 정답, 답안) 목록: 정확 일치/표기 차이/오타/오답을 고르게 섞음"""
+    rng = random.Random(seed)
+    items = list(questions.items())
+    answers = []
+    for n in range(count):
+        question, correct = items[rng.randrange(len(items))]
+        kind = n % 4
+        if kind == 0:
+            answer = correct
+        elif kind == 1:
+            answer = f'  {correct.upper()}. '
+        elif kind == 2:
+            position = rng.randrange(len(correct))
+            answer = correct[:position] + correct[position + 1:]
+        else:
+            answer = rng.choice(EN_WORDS + KO_WORDS)
+        answers.append((question, correct, answer))
+    return answers
@@ -0,0 +1,132 @@
+import re
+from collections import namedtuple
+
+
+# 빈칸 표시 ("____", 밑줄 두 개 이상)
+_BLANK = re.compile(r'_{2,}')
+# 빈칸 답을 나누는 구분자 (정답 "A and B", 답안 "A, B" 등, "21,127" 같은 숫자의 쉼표는 제외)
+_SEPARATORS = re.compile(r'\s*(?:(?<!\d),|,(?!\d)|[;&\n]|\band\b|\bbut\b|및|그리고)\s*', re.IGNORECASE)
+_COMMAS = re.compile(r'\s*(?:(?<!\d),|,(?!\d)|;)\s*')
+# 한 빈칸 안의 대안 ("similarity or dot product")
+# ("TCP/IP"의 /는 대안이 아니라 이름의 일부)
+_ALTERNATIVES = re.compile(r'\s*(?:\bor\b|또는|혹은)\s*', re.IGNORECASE)
+# 빈칸 사이에 and 연결어만 있으면("____ and ____") 답을 적는 순서는 상관없음
+# (쉼표로만 나열한 "(____, ____, ____)"는 순서가 있는 묶음)
+_CONNECTOR_GAP = re.compile(r'\s*(?:,?\s*and|&|및|그리고)\s*', re.IGNORECASE)
+_WORD = re.compile(r'\w+')
+
+# alternatives: 원문 그대로의 인정 답 목록
+Blank = namedtuple('Blank', ['alternatives'])
+# 문제 하나의 빈칸 구조 (answer가 바뀌면 다시 컴파일)
+BlankPattern = namedtuple('BlankPattern', ['answer', 'blanks', 'ordered', 'sentence'])
+# 빈칸별 채점 결과 (correct/total은 부분 점수, extra는 어느 빈칸에도 맞지 않는 답 수)
+BlankResult = namedtuple('BlankResult', ['correct', 'total', 'extra'])
+
+
+def splitSegments(text):
+    return [part for part in _SEPARATORS.split(text.strip()) if part]
+
+
+def compilePattern(question, correct_answer):
+    """빈칸이 두 개 이상이고 정답을 빈칸 수만큼 나눌 수 있으면 BlankPattern, 아니면 None"""
+    pieces = _BLANK.split(question)
+    count = len(pieces) - 1
+    if count < 2:
+        return None
+
+    segments = splitSegments(correct_answer)
+    if len(segments) != count:
+        # 빈칸 하나의 답에 and가 들어 있으면 쉼표로만 나눔 ("A of B and C, D")
+        segments = [part for part in _COMMAS.split(correct_answer.strip()) if part]
+    if len(segments) != count:
+        # "____ ____" → "keyword overlap"처럼 단어 하나씩 들어가는 경우
+        segments = correct_answer.split()
+        if len(segments) != count:
+            return None
+
+    blanks = []
+    for segment in segments:
+        alternatives = [segment] + [part for part in _ALTERNATIVES.split(segment) if part and part != segment]
+        blanks.append(Blank(tuple(alternatives)))
+
+    gaps = pieces[1:-1]
+    ordered = not all(_CONNECTOR_GAP.fullmatch(gap) for gap in gaps)
+    return BlankPattern(correct_answer, tuple(blanks), ordered, compileSentence(pieces))
+
+
+def compileSentence(pieces):
+    """문장 전체를 채워 적은 답안에서 빈칸 부분만 원문 그대로 뽑아내는 패턴
+
+    빈칸 밖의 문장은 대소문자와 구두점, 띄어쓰기 차이를 무시하고 맞춘다.
+    """
+    regex = r'\W*' + r'\W+'.join(map(re.escape, _WORD.findall(pieces[0])))
+    for index, piece in enumerate(pieces[1:], 1):
+        regex += r'\W*(.+?)'
+        words = _WORD.findall(piece)
+        if words:
+            regex += r'\W*' + r'\W+'.join(map(re.escape, words))
+        elif index < len(pieces) - 1:
+            # 붙어 있는 빈칸("____ ____")은 띄어쓰기로 구분
+            regex += r'\s+'
+    return re.compile(regex + r'\W*$', re.IGNORECASE)
+
+
+class BlankGrader:
+    """빈칸이 여러 개인 "____" 문제를 빈칸별로 채점 (AI 호출 없음)
+
+    정답을 빈칸 수만큼 나눈 패턴을 문제를 처음 채점할 때 컴파일해 두고, 답안도 같은
+    구분자로 나눠 빈칸에 맞춰 본다. 빈칸 하나하나는 TieredGrader의 로컬 단계
+    (정확 일치, 정규화, 변형, 유사도, 동의어 중 설정된 것)로만 비교한다.
+    """
+    def __init__(self):
+        self.patterns = {}
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def pattern(self, question, correct_answer):
+        if '__' not in question:
+            return None
+        pattern = self.patterns.get(question)
+        if pattern is None or pattern.answer != correct_answer:
+            pattern = compilePattern(question, correct_answer)
+            if pattern is None:
+                return None
+            self.patterns[question] = pattern
+        return pattern
+
+    def judge(self, question, correct_answer, user_answer, local):
+        """BlankResult (빈칸 문제가 아니면 None)
+
+        빈칸을 모두 맞히고 남는 답이 없어야 정답이다.
+        """
+        pattern = self.pattern(question, correct_answer)
+        if pattern is None:
+            return None
+        blanks = pattern.blanks
+
+        sentence = pattern.sentence.match(user_answer.strip())
+        if sentence is not None:
+            segments = list(sentence.groups())
+        else:
+            segments = splitSegments(user_answer)
+            if len(segments) < len(blanks) and len(user_answer.split()) == len(blanks):
+                segments = user_answer.split()
+
+        # 순서가 있으면 앞에서부터, 없으면 남은 빈칸 중 맞는 곳에 배정
+        matched = [False] * len(blanks)
+        extra = 0
+        position = 0
+        for segment in segments:
+            start = position if pattern.ordered else 0
+            for index in range(start, len(blanks)):
+                if not matched[index] and self.accepts(blanks[index], segment, local):
+                    matched[index] = True
+                    position = index + 1
+                    break
+            else:
+                extra += 1
+        return BlankResult(sum(matched), len(blanks), extra)
+
+    def accepts(self, blank, segment, local):
+        return any(local.matchTier(alternative, segment) is not None for alternative in blank.alternatives)
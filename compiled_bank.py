@@ -0,0 +1,246 @@
+import os
+import sys
+import mmap
+import zlib
+import array
+import random
+import struct
+import hashlib
+import argparse
+
+from question_bank import expandSources, loadBank
+from question_pool import DEFAULT_SEED
+
+
+# 파일 구조: 헤더 | zlib 사전 | 항목 테이블 (문제 해시 순 정렬) | UTF-8 문자열 영역
+MAGIC = b'QBNK'
+VERSION = 1
+FLAG_ZLIB = 1
+
+# magic, version, flags, 문제 수, 테이블 위치, 문자열 영역 위치, 사전 위치, 사전 길이
+HEADER = struct.Struct('<4sHHIQQQI')
+# 문제 해시, 문제 위치, 문제 길이, 정답 위치, 정답 길이 (위치는 문자열 영역 기준)
+ENTRY = struct.Struct('<QQIQI')
+HASH = struct.Struct('<Q')
+
+ZDICT_SIZE = 32 * 1024
+
+
+def questionHash(question):
+    return HASH.unpack(hashlib.blake2b(question.encode('utf-8'), digest_size=8).digest())[0]
+
+
+def buildZdict(questions):
+    """짧은 문자열끼리도 압축되도록 자주 나오는 텍스트로 zlib 사전을 만듦"""
+    sample = []
+    size = 0
+    for question, answer in questions.items():
+        text = (question + '\n' + answer + '\n').encode('utf-8')
+        sample.append(text)
+        size += len(text)
+        if size >= ZDICT_SIZE:
+            break
+    # zlib은 사전의 뒤쪽을 더 가깝게 보므로 그대로 이어 붙임
+    return b''.join(sample)[-ZDICT_SIZE:]
+
+
+def compileBank(questions, path, compress=False):
+    """{문제: 정답} 딕셔너리를 .qbank 파일로 저장"""
+    zdict = buildZdict(questions) if compress else b''
+
+    def encode(text):
+        data = text.encode('utf-8')
+        if compress:
+            compressor = zlib.compressobj(9, zdict=zdict)
+            data = compressor.compress(data) + compressor.flush()
+        return data
+
+    entries = sorted((questionHash(q), q, a) for q, a in questions.items())
+    blob = bytearray()
+    table = bytearray()
+    for hash_value, question, answer in entries:
+        q_data = encode(question)
+        a_data = encode(answer)
+        table += ENTRY.pack(hash_value, len(blob), len(q_data), len(blob) + len(q_data), len(a_data))
+        blob += q_data
+        blob += a_data
+
+    zdict_offset = HEADER.size
+    table_offset = zdict_offset + len(zdict)
+    blob_offset = table_offset + len(table)
+    flags = FLAG_ZLIB if compress else 0
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, flags, len(entries), table_offset, blob_offset, zdict_offset, len(zdict)))
+        file.write(zdict)
+        file.write(table)
+        file.write(blob)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+class CompiledBank:
+    """.qbank 파일을 mmap으로 열어 필요한 문제만 그때그때 디코딩하는 읽기 전용 문제 모음"""
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.flags, self.count, self.table_offset, self.blob_offset, zdict_offset, zdict_len = \
+            HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f'{path}: 지원하지 않는 문제 파일 형식입니다')
+        self.zdict = self.mm[zdict_offset:zdict_offset + zdict_len]
+
+    def __len__(self):
+        return self.count
+
+    def entry(self, index):
+        return ENTRY.unpack_from(self.mm, self.table_offset + index * ENTRY.size)
+
+    def decode(self, offset, length):
+        start = self.blob_offset + offset
+        data = self.mm[start:start + length]
+        if self.flags & FLAG_ZLIB:
+            decompressor = zlib.decompressobj(zdict=self.zdict)
+            data = decompressor.decompress(data) + decompressor.flush()
+        return data.decode('utf-8')
+
+    def question(self, index):
+        _, q_off, q_len, _, _ = self.entry(index)
+        return self.decode(q_off, q_len)
+
+    def answer(self, index):
+        _, _, _, a_off, a_len = self.entry(index)
+        return self.decode(a_off, a_len)
+
+    def find(self, question):
+        """문제의 인덱스를 해시 이진 탐색으로 찾음 (없으면 -1)"""
+        target = questionHash(question)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if HASH.unpack_from(self.mm, self.table_offset + middle * ENTRY.size)[0] < target:
+                low = middle + 1
+            else:
+                high = middle
+        while low < self.count and HASH.unpack_from(self.mm, self.table_offset + low * ENTRY.size)[0] == target:
+            if self.question(low) == question:
+                return low
+            low += 1
+        return -1
+
+    def __contains__(self, question):
+        return self.find(question) >= 0
+
+    def __getitem__(self, question):
+        index = self.find(question)
+        if index < 0:
+            raise KeyError(question)
+        return self.answer(index)
+
+    def __iter__(self):
+        return (self.question(index) for index in range(self.count))
+
+    def items(self):
+        return ((self.question(index), self.answer(index)) for index in range(self.count))
+
+    def close(self):
+        self.mm.close()
+        self.file.close()
+
+
+class CompiledQuestionPool:
+    """CompiledBank 위에서 동작하는 QuestionPool (문제 번호만 들고 있다가 뽑을 때 디코딩)"""
+    def __init__(self, bank, seed=DEFAULT_SEED):
+        self.bank = bank
+        self.keys = array.array('I', range(len(bank)))
+        self.position = array.array('I', range(len(bank)))
+        self.rng = random.Random(seed)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def indexOf(self, question):
+        index = self.bank.find(question)
+        if index < 0 or not self.hasIndex(index):
+            return -1
+        return index
+
+    def hasIndex(self, index):
+        position = self.position[index]
+        return position < len(self.keys) and self.keys[position] == index
+
+    def __contains__(self, question):
+        return self.indexOf(question) >= 0
+
+    def __getitem__(self, question):
+        index = self.indexOf(question)
+        if index < 0:
+            raise KeyError(question)
+        return self.bank.answer(index)
+
+    def __iter__(self):
+        return (self.bank.question(index) for index in self.keys)
+
+    def items(self):
+        return ((self.bank.question(index), self.bank.answer(index)) for index in self.keys)
+
+    def add(self, question, answer=None):
+        """제외했던 문제를 다시 출제 대상으로 (파일에 없는 문제는 추가할 수 없음)"""
+        index = self.bank.find(question)
+        if index < 0:
+            raise KeyError(question)
+        if not self.hasIndex(index):
+            self.position[index] = len(self.keys)
+            self.keys.append(index)
+
+    requeue = add
+
+    def pop(self, question):
+        index = self.indexOf(question)
+        if index < 0:
+            raise KeyError(question)
+        position = self.position[index]
+        last = self.keys.pop()
+        if last != index:
+            self.keys[position] = last
+            self.position[last] = position
+        return self.bank.answer(index)
+
+    def draw(self, avoid=None):
+        if not self.keys:
+            raise IndexError('빈 문제 풀에서 추첨할 수 없습니다')
+        position = self.rng.randrange(len(self.keys))
+        question = self.bank.question(self.keys[position])
+        if question == avoid and len(self.keys) > 1:
+            position = (position + 1 + self.rng.randrange(len(self.keys) - 1)) % len(self.keys)
+            question = self.bank.question(self.keys[position])
+        return question
+
+    def close(self):
+        self.bank.close()
+
+    def getState(self):
+        return self.rng.getstate()
+
+    def setState(self, state):
+        self.rng.setstate(state)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='JSON 문제 파일을 .qbank 형식으로 변환합니다')
+    parser.add_argument('source', help='JSON 문제 파일, 폴더 또는 glob 패턴')
+    parser.add_argument('output', help='저장할 .qbank 경로')
+    parser.add_argument('--compress', action='store_true', help='zlib(공유 사전)으로 문자열 압축')
+    args = parser.parse_args(argv)
+
+    bank = loadBank(expandSources(args.source))
+    for path, error in bank.errors.items():
+        print(f'건너뜀: {path}: {error}', file=sys.stderr)
+    count = compileBank(bank.answers, args.output, compress=args.compress)
+    print(f'{args.output}: 문제 {count}개, {os.path.getsize(args.output):,} bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""AI 채점 백엔드 등록부
+
+QUIZ_GRADER_BACKEND로 고른다.
+- openai: OpenAI API
+- openai-compatible: llama.cpp, vLLM 같은 OpenAI 호환 서버
+- local: AI 없이 로컬 규칙(QUIZ_SEMANTIC_GRADER를 켜면 임베딩 유사도 포함)만 사용
+- stub: 느린 가짜 채점기
+
+사용법: python grader_backends.py check [백엔드 ...]
+"""
+import os
+import sys
+import time
+import inspect
+import argparse
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+from ai_judge import (GRADING_TIMEOUT, MODEL, StubGrader, UsageMeter, clientPool, isConnectionError, judgeAnswer,
+                      judgeBatch)
+
+# 기본 백엔드 (QUIZ_OFFLINE=1이면 local)
+DEFAULT_BACKEND = os.getenv("QUIZ_GRADER_BACKEND", "openai")
+
+# OpenAI 호환 서버 주소, 키, 모델 (llama.cpp: http://localhost:8080/v1, vLLM: http://localhost:8000/v1)
+# OpenAI 백엔드의 모델(QUIZ_OPENAI_MODEL)과 설정을 나눠 두어 백엔드를 바꿔도 서로 섞이지 않음
+COMPATIBLE_BASE_URL = os.getenv("QUIZ_COMPATIBLE_BASE_URL", "http://localhost:8080/v1")
+COMPATIBLE_API_KEY = os.getenv("QUIZ_COMPATIBLE_API_KEY", "")
+COMPATIBLE_MODEL = os.getenv("QUIZ_COMPATIBLE_MODEL", "local-model")
+
+# 백엔드별 연결 풀 크기 (CPU 서버는 동시에 처리할 수 있는 요청이 적음)
+OPENAI_MAX_CONNECTIONS = int(os.getenv("QUIZ_OPENAI_MAX_CONNECTIONS", "8"))
+COMPATIBLE_MAX_CONNECTIONS = int(os.getenv("QUIZ_COMPATIBLE_MAX_CONNECTIONS", "2"))
+
+# stub 백엔드의 응답 시간 (초)
+STUB_DELAY = float(os.getenv("QUIZ_STUB_DELAY", "2.0"))
+
+# ok: 정상 여부, latency_ms: 확인에 걸린 시간, detail: 모델 이름이나 오류
+# reachable: 서버가 응답했는지 (False면 연결 실패로 로컬 채점, True인데 ok가 아니면 인증/설정 오류)
+HealthStatus = namedtuple('HealthStatus', ['ok', 'latency_ms', 'detail', 'reachable'], defaults=(True,))
+
+BACKENDS = {}
+
+
+def registerBackend(name):
+    """백엔드 클래스를 이름으로 등록하는 데코레이터"""
+    def register(cls):
+        cls.name = name
+        BACKENDS[name] = cls
+        return cls
+    return register
+
+
+class Backend(ABC):
+    """채점 백엔드 공통 인터페이스
+
+    backend(question, correct_answer, user_answer, timeout=...)로 한 문항,
+    batch(items, timeout=...)로 여러 문항을 채점한다. remote가 False인 백엔드는
+    Grader에서 원격 채점기 없이(로컬에서 모두 결정) 쓰인다.
+    """
+    name = ''
+    remote = True
+
+    def __init__(self, meter=None):
+        self.meter = meter if meter is not None else UsageMeter()
+
+    @abstractmethod
+    def __call__(self, question, correct_answer, user_answer, timeout=GRADING_TIMEOUT):
+        """한 문항의 정답 여부 (True/False)"""
+
+    def batch(self, items, timeout=GRADING_TIMEOUT):
+        return {item.id: self(item.question, item.correct_answer, item.user_answer, timeout=timeout)
+                for item in items}
+
+    def available(self):
+        return True
+
+    def healthCheck(self, timeout=5.0):
+        return HealthStatus(True, 0.0, self.name)
+
+    def warmUp(self):
+        """시작 시 연결을 맺어 두고 서버 상태(HealthStatus)를 확인 (작업 스레드에서 호출)"""
+        return self.healthCheck()
+
+
+@registerBackend('openai')
+class OpenAIBackend(Backend):
+    """OpenAI API 채점기 (같은 서버를 쓰는 백엔드끼리 연결 풀 공유)"""
+    def __init__(self, model=MODEL, base_url=None, api_key=None, max_connections=OPENAI_MAX_CONNECTIONS,
+                 meter=None):
+        super().__init__(meter)
+        self.model = model
+        self.base_url = base_url
+        self.api_key = api_key
+        self.pool = clientPool(base_url, api_key, max_connections)
+
+    def __call__(self, question, correct_answer, user_answer, timeout=GRADING_TIMEOUT):
+        return self.request(judgeAnswer, question, correct_answer, user_answer, timeout=timeout)
+
+    def batch(self, items, timeout=GRADING_TIMEOUT):
+        return self.request(judgeBatch, items, timeout=timeout)
+
+    def request(self, judge, *args, timeout):
+        try:
+            return judge(*args, timeout=timeout, client=self.pool.client(), meter=self.meter, model=self.model)
+        except Exception as e:
+            # 서버에 연결되지 않으면 한동안 요청하지 않고 로컬에서 채점 (인증/설정 오류는 그대로 알림)
+            if isConnectionError(e):
+                self.pool.markFailed(e)
+            raise
+
+    def available(self):
+        return self.pool.available()
+
+    def healthCheck(self, timeout=5.0):
+        ok, latency_ms, error = self.pool.check(timeout)
+        return HealthStatus(ok, latency_ms, self.model if ok else error, self.pool.healthy is not False)
+
+
+@registerBackend('openai-compatible')
+class CompatibleBackend(OpenAIBackend):
+    """OpenAI 호환 서버(llama.cpp, vLLM 등)의 채점기"""
+    def __init__(self, model=COMPATIBLE_MODEL, base_url=COMPATIBLE_BASE_URL, api_key=COMPATIBLE_API_KEY,
+                 max_connections=COMPATIBLE_MAX_CONNECTIONS, meter=None):
+        super().__init__(model, base_url, api_key or 'unused', max_connections, meter)
+
+
+@registerBackend('local')
+class LocalBackend(Backend):
+    """AI 없이 로컬 규칙(켜져 있으면 임베딩 유사도 포함)으로 결정하는 채점기"""
+    remote = False
+
+    def __init__(self, meter=None):
+        super().__init__(meter)
+        # QuizApp/Grader에서는 쓰지 않으므로(remote=False) 처음 호출될 때 만듦
+        self.local = None
+        self.semantic = None
+
+    def __call__(self, question, correct_answer, user_answer, timeout=GRADING_TIMEOUT):
+        if self.local is None:
+            from grading import TieredGrader
+            from semantic_grader import createSemanticGrader
+            self.semantic = createSemanticGrader()
+            self.local = TieredGrader()
+        if self.local.matchTier(correct_answer, user_answer) is not None:
+            return True
+        if self.semantic is not None:
+            return bool(self.semantic.judge(correct_answer, user_answer, decisive=True))
+        return False
+
+
+@registerBackend('stub')
+class StubBackend(StubGrader, Backend):
+    """API 없이 느린 응답을 흉내 내는 채점기 (QUIZ_STUB_DELAY초)"""
+    def __init__(self, delay=STUB_DELAY, meter=None):
+        StubGrader.__init__(self, delay)
+        Backend.__init__(self, meter)
+
+
+def createBackend(name=None, **options):
+    """이름(기본: QUIZ_GRADER_BACKEND, QUIZ_OFFLINE=1이면 local)으로 백엔드 생성"""
+    if name is None:
+        name = 'local' if os.getenv("QUIZ_OFFLINE", "") == "1" else DEFAULT_BACKEND
+    try:
+        cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f'알 수 없는 채점 백엔드: {name} (사용 가능: {", ".join(BACKENDS)})') from None
+    try:
+        inspect.signature(cls).bind(**options)
+    except TypeError:
+        raise ValueError(f'{name} 백엔드에 쓸 수 없는 설정: {", ".join(options)}') from None
+    return cls(**options)
+
+
+def checkCommand(args):
+    failed = False
+    for name in args.backends or [None]:
+        start = time.perf_counter()
+        backend = createBackend(name)
+        status = backend.healthCheck(args.timeout)
+        failed = failed or not status.ok
+        result = '정상' if status.ok else '실패' if not status.reachable else '설정 오류'
+        print(f'{backend.name:<18} {result}  {status.latency_ms:7.1f} ms  '
+              f'(생성 포함 {(time.perf_counter() - start) * 1000:.0f} ms)  {status.detail}')
+    if failed:
+        sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='AI 채점 백엔드를 확인합니다')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    check = commands.add_parser('check', help='백엔드 상태 확인 (하나라도 실패하면 종료 코드 1)')
+    check.add_argument('backends', nargs='*',
+                       help=f'확인할 백엔드 ({", ".join(BACKENDS)}, 기본: QUIZ_GRADER_BACKEND={DEFAULT_BACKEND})')
+    check.add_argument('--timeout', type=float, default=5.0)
+    check.set_defaults(handler=checkCommand)
+
+    args = parser.parse_args(argv)
+    try:
+        args.handler(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == '__main__':
+    main()
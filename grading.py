@@ -0,0 +1,360 @@
+import os
+import re
+import json
+import unicodedata
+from collections import Counter, namedtuple
+
+
+# verdict: True(정답) / False(오답) / None(로컬에서 판단 불가 → 원격 채점으로 넘김)
+# credit: 빈칸 문제의 부분 점수 (맞힌 빈칸 수, 전체 빈칸 수), 해당 없으면 None
+GradeResult = namedtuple('GradeResult', ['verdict', 'tier', 'credit'], defaults=(None,))
+
+# 채점할 답안 1건 (id는 일괄 채점 결과를 되짚기 위한 식별자)
+JudgeItem = namedtuple('JudgeItem', ['id', 'question', 'correct_answer', 'user_answer'])
+
+LOCAL_TIERS = ('exact', 'normalized', 'variant', 'similarity', 'alias')
+
+DEFAULT_ALIAS_GROUPS = [
+    ['베이징', '북경', 'Beijing'],
+    ['서울', 'Seoul'],
+    ['도쿄', '동경', 'Tokyo'],
+]
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_DIGITS = re.compile(r'\d+')
+# 복합 정답의 연결어 ("A or B", "A and B", "A, B")
+# "/"는 "TCP/IP", "I/O"처럼 이름의 일부인 경우가 많아 연결어로 보지 않음
+_OR = re.compile(r'\s*(?:\bor\b|또는|혹은)\s*')
+_AND = re.compile(r'\s*(?:\band\b|&|;|및|그리고)\s*')
+_COMMA = re.compile(r'\s*,\s*')
+_ARTICLES = re.compile(r'^(?:(?:the|a|an)\s+)+')
+_CONNECTORS = re.compile(r'\b(?:or|and)\b|[,;&]|또는|혹은|및|그리고', re.IGNORECASE)
+
+# 정답 변형 색인 파일 확장자 (문제 파일 옆에 저장)
+VARIANT_EXTENSION = '.qvar'
+# .qvar 형식 버전 (연결어 규칙이 바뀌면 올려서 이전 파일을 다시 계산)
+VARIANT_FORMAT = 3
+
+
+def normalizeText(text):
+    """유니코드/대소문자/구두점/공백 차이를 제거"""
+    text = unicodedata.normalize('NFKC', text).casefold()
+    text = _PUNCTUATION.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def variantParts(text):
+    """복합 답을 대안 목록으로 분리: [[반드시 함께 적을 부분, ...], ...]
+
+    or로 나뉜 것은 대안, and로 나뉜 것은 함께 적어야 하는 부분이다.
+    쉼표는 or가 있으면 대안 나열("A, B or C"), 없으면 함께 적을 부분으로 본다.
+    부분마다 정규화하고 앞의 관사를 떼어 순서 없이 비교할 수 있도록 정렬한다.
+    """
+    text = unicodedata.normalize('NFKC', text).casefold()
+    has_or = _OR.search(text) is not None
+    alternatives = []
+    for alternative in _OR.split(text):
+        chunks = _COMMA.split(alternative) if has_or else [alternative]
+        for chunk in chunks:
+            pieces = _AND.split(chunk) if has_or else _AND.split(_COMMA.sub(' and ', chunk))
+            parts = sorted(filter(None, (_ARTICLES.sub('', normalizeText(piece)) for piece in pieces)))
+            if parts:
+                alternatives.append(parts)
+    return alternatives
+
+
+def alternativesKey(alternatives):
+    """대안 목록의 키: 함께 적을 부분은 &, 대안은 |로 이음 ("a&b|c")"""
+    return '|'.join(sorted('&'.join(parts) for parts in alternatives))
+
+
+def answerVariants(correct_answer):
+    """정답에서 인정할 답안 키 집합 (대안 하나, 또는 대안을 or/and로 모두 적은 경우)"""
+    alternatives = variantParts(correct_answer)
+    variants = {alternativesKey([parts]) for parts in alternatives}
+    if len(alternatives) > 1:
+        variants.add(alternativesKey(alternatives))
+        variants.add(alternativesKey([sorted(part for parts in alternatives for part in parts)]))
+    return frozenset(variants)
+
+
+def variantKey(user_answer):
+    """답안을 정답 변형과 비교할 키 (순서와 관사는 무시하고 and/or 구분은 유지)"""
+    return alternativesKey(variantParts(user_answer))
+
+
+def stripArticles(text):
+    """정규화한 답의 앞 관사를 뗌 ("the mean" → "mean")"""
+    return _ARTICLES.sub('', text) or text
+
+
+def editDistance(a, b, limit=None):
+    """두 문자열의 레벤슈타인 거리 (limit 초과 시 limit + 1 반환)"""
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class AliasTable:
+    """같은 뜻으로 인정할 표현 묶음 (예: 베이징/북경/Beijing)"""
+    def __init__(self, groups=DEFAULT_ALIAS_GROUPS):
+        self.group_of = {}
+        for group in groups:
+            self.addGroup(group)
+
+    def addGroup(self, group):
+        terms = [normalizeText(term) for term in group]
+        # 이미 등록된 묶음과 겹치면 하나로 합침
+        group_id = next((self.group_of[t] for t in terms if t in self.group_of), None)
+        if group_id is None:
+            group_id = len(self.group_of)
+        for term in terms:
+            self.group_of[term] = group_id
+
+    def loadJSON(self, path):
+        """[["베이징", "북경"], ...] 형식의 JSON 파일에서 묶음을 추가"""
+        with open(path, 'r', encoding='utf-8') as file:
+            for group in json.load(file):
+                self.addGroup(group)
+
+    def same(self, a, b):
+        group_id = self.group_of.get(a)
+        return group_id is not None and group_id == self.group_of.get(b)
+
+
+class VariantIndex:
+    """정답 → 인정할 답안 키 집합
+
+    문제를 불러올 때 연결어가 있는 복합 정답의 변형을 미리 펼쳐 두므로 채점할 때는
+    답안의 키를 하나 만들어 집합에서 찾기만 하면 된다. 미리 펼치지 못한 복합 정답(.qbank)은
+    처음 채점할 때 만들고, 연결어가 없는 정답은 변형이 없다 (대소문자 등의 차이는
+    normalized 단계의 몫). 문제 파일 옆의 .qvar 파일로 저장해 두면 다음 로딩 때 다시
+    계산하지 않는다.
+    """
+    def __init__(self):
+        self.variants = {}
+        self.prepared = set()
+
+    def __len__(self):
+        return len(self.variants)
+
+    def add(self, answers):
+        """아직 없는 복합 정답의 변형을 만들고 새로 추가된 수를 반환"""
+        added = 0
+        for answer in answers:
+            if answer not in self.variants and _CONNECTORS.search(answer):
+                self.variants[answer] = answerVariants(answer)
+                added += 1
+        return added
+
+    def match(self, correct_answer, user_answer):
+        variants = self.variants.get(correct_answer)
+        if variants is None:
+            if not _CONNECTORS.search(correct_answer):
+                return False
+            variants = self.variants[correct_answer] = answerVariants(correct_answer)
+        return variantKey(user_answer) in variants
+
+    def save(self, path, answers=None):
+        answers = self.variants if answers is None else dict.fromkeys(answers)
+        self.add(answers)
+        data = {answer: sorted(self.variants[answer]) for answer in answers if answer in self.variants}
+        data = {'format': VARIANT_FORMAT, 'variants': data}
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        """path의 변형을 추가 (형식이 다른 이전 파일이면 False)"""
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('format') != VARIANT_FORMAT:
+            return False
+        for answer, variants in data['variants'].items():
+            self.variants.setdefault(answer, frozenset(variants))
+        return True
+
+    def prepare(self, source, answers=(), save=True):
+        """문제 파일 옆의 .qvar를 읽고, 없는 정답은 펼쳐 둠 (단일 JSON 파일이고 save면 저장)"""
+        from question_bank import expandSources
+        for path in expandSources(source):
+            if path in self.prepared or not path.endswith('.json'):
+                continue
+            self.prepared.add(path)
+            index_path = variantPathFor(path)
+            if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(path):
+                self.load(index_path)
+        if self.add(answers) and save and os.path.isfile(source) and source.endswith('.json'):
+            try:
+                self.save(variantPathFor(source), answers)
+            except OSError:
+                pass
+
+
+def variantPathFor(path):
+    return os.path.splitext(path)[0] + VARIANT_EXTENSION
+
+
+class TieredGrader:
+    """저렴한 로컬 규칙부터 차례로 적용하고, 애매한 답안만 원격 채점기로 넘기는 채점기
+
+    로컬 단계는 정답 판정만 내린다. 다르게 표현된 정답을 로컬에서 오답으로
+    단정할 수 없으므로, 어느 단계에도 걸리지 않은 답안은 원격 채점기가 있으면
+    넘기고 없으면 오답 처리한다.
+    """
+    def __init__(self, remote=None, aliases=None, similarity_threshold=0.85, tiers=LOCAL_TIERS, variants=None):
+        self.remote = remote
+        self.tiers = tiers
+        self.aliases = aliases if aliases is not None else AliasTable()
+        self.variants = variants if variants is not None else VariantIndex()
+        self.similarity_threshold = similarity_threshold
+        self.tier_counts = Counter()
+
+    def gradeLocal(self, correct_answer, user_answer):
+        """로컬 단계만 적용 (판단 불가면 verdict=None)"""
+        tier = self.matchTier(correct_answer, user_answer)
+        if tier is None:
+            return GradeResult(None, None)
+        return self.record(True, tier)
+
+    def matchTier(self, correct_answer, user_answer):
+        """정답으로 인정한 로컬 단계 이름 (없으면 None, 집계하지 않음)"""
+        if 'exact' in self.tiers and user_answer == correct_answer:
+            return 'exact'
+
+        correct = normalizeText(correct_answer)
+        user = normalizeText(user_answer)
+        if 'normalized' in self.tiers and (user == correct or stripArticles(user) == stripArticles(correct)):
+            return 'normalized'
+
+        if 'variant' in self.tiers and self.variants.match(correct_answer, user_answer):
+            return 'variant'
+
+        if 'similarity' in self.tiers and self.isSimilar(correct, user):
+            return 'similarity'
+
+        if 'alias' in self.tiers and self.aliases.same(correct, user):
+            return 'alias'
+
+        return None
+
+    def isSimilar(self, correct, user):
+        if not correct or not user:
+            return False
+        # 숫자가 다르면 철자가 비슷해도 다른 답
+        if _DIGITS.findall(correct) != _DIGITS.findall(user):
+            return False
+        # 띄어쓰기만 다른 답 ("machinelearning")
+        if correct.replace(' ', '') == user.replace(' ', ''):
+            return True
+        # 단어가 더해지거나(non categorical) 순서가 바뀐 답(A, B ↔ B, A)은 뜻이 달라질 수 있음
+        correct_words = correct.split()
+        user_words = user.split()
+        if len(correct_words) != len(user_words):
+            return False
+        # 앞부분이 다른 단어는 접두사로 뜻이 반대일 수 있음 (internal/external, supervised/unsupervised)
+        if any(c[:2] != u[:2] for c, u in zip(correct_words, user_words)):
+            return False
+        longest = max(len(correct), len(user))
+        if longest < 4:
+            return False
+        limit = int(longest * (1 - self.similarity_threshold))
+        return editDistance(correct, user, limit) <= limit
+
+    def grade(self, question, correct_answer, user_answer, timeout=None):
+        result = self.gradeLocal(correct_answer, user_answer)
+        if result.verdict is not None:
+            return result
+        if self.remote is None:
+            return self.record(False, 'local')
+        return self.record(self.remote(question, correct_answer, user_answer, timeout=timeout), 'remote')
+
+    def record(self, verdict, tier):
+        self.tier_counts[tier] += 1
+        return GradeResult(verdict, tier)
+
+    def stats(self):
+        """단계별 판정 횟수와 원격 호출을 피한 비율"""
+        total = sum(self.tier_counts.values())
+        remote = self.tier_counts['remote']
+        return {
+            'tiers': dict(self.tier_counts),
+            'total': total,
+            'avoided_remote_rate': (total - remote) / total if total else 0.0,
+        }
+
+
+def variantsCommand(args):
+    """문제 파일마다 .qvar를 다시 만들고 복합 정답 비율과 로컬에서 처리되는 답안 비율을 출력"""
+    from question_bank import expandSources, loadBank
+
+    index = VariantIndex()
+    bank = {}
+    for path in expandSources(args.source):
+        if not path.endswith('.json'):
+            continue
+        answers = loadBank([path]).answers
+        bank.update(answers)
+        index.save(variantPathFor(path), answers.values())
+
+    distinct = set(bank.values())
+    compound = [answer for answer in distinct if answer in index.variants]
+    report = {
+        'questions': len(bank),
+        'answers': len(distinct),
+        'compound_answers': len(compound),
+        'compound_rate': len(compound) / len(distinct) if distinct else 0.0,
+        'variants': sum(len(index.variants[answer]) for answer in compound),
+    }
+
+    # AI가 정답으로 판정했던 답안 중 이제 변형 색인만으로 정답 처리되는 비율
+    if args.db:
+        from results_store import ResultStore
+        store = ResultStore(args.db)
+        try:
+            attempts = store.labelledAttempts()
+        finally:
+            store.close()
+        accepted = [(bank[question], answer) for question, answer, verdict in attempts
+                    if verdict and question in bank]
+        grader = TieredGrader(tiers=('exact', 'normalized'))
+        covered = sum(1 for correct, answer in accepted
+                      if grader.matchTier(correct, answer) is None and index.match(correct, answer))
+        report['ai_accepted'] = len(accepted)
+        report['ai_accepted_now_local'] = covered
+        report['ai_accepted_now_local_rate'] = covered / len(accepted) if accepted else 0.0
+    print(json.dumps(report, ensure_ascii=False, indent=4))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='복합 정답의 변형 색인을 관리합니다')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    variants = commands.add_parser('variants', help='문제 파일마다 정답 변형 색인(.qvar)을 다시 만들고 적용 범위 출력')
+    variants.add_argument('source', help='문제 JSON 파일, 폴더 또는 glob 패턴')
+    variants.add_argument('--db', help='풀이 기록 DB 경로 (AI가 정답 처리한 답안 중 로컬로 처리되는 비율 계산)')
+    variants.set_defaults(handler=variantsCommand)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
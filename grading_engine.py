@@ -0,0 +1,135 @@
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_judge import GRADING_TIMEOUT, MODEL, createClient, isConnectionError, judgeAnswer
+
+
+class TokenBucket:
+    """초당 rate건, 최대 burst건까지 몰아서 허용하는 요청 속도 제한기"""
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def isRetryable(error):
+    """429/5xx 응답과 연결 오류/타임아웃은 재시도 대상"""
+    status = getattr(error, 'status_code', None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isConnectionError(error)
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class GradingEngine:
+    """여러 답안을 제한된 동시성과 요청 속도로 병렬 채점
+
+    하나의 클라이언트(연결 풀)를 모든 작업 스레드가 공유하여 연결을 재사용한다.
+    judge를 주면 OpenAI 대신 그 함수(question, correct_answer, user_answer, timeout=...)를 쓴다.
+    judge에 available()이 있으면(백엔드) 서버에 연결되지 않는 동안에는 요청하지 않는다.
+    meter(UsageMeter)를 주면 토큰 사용량을 집계하고, 예산을 다 쓴 뒤의 답안은 요청하지 않는다.
+    """
+    def __init__(self, judge=None, base_url=None, api_key=None, max_workers=8,
+                 rate=10.0, burst=None, max_retries=4, backoff=0.5, timeout=GRADING_TIMEOUT, meter=None,
+                 model=MODEL):
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst)
+        self.meter = meter
+        if judge is None:
+            # 재시도는 엔진이 백오프와 함께 직접 처리
+            client = createClient(base_url, api_key, max_connections=max_workers, max_retries=0)
+
+            def judge(question, correct_answer, user_answer, timeout=GRADING_TIMEOUT):
+                return judgeAnswer(question, correct_answer, user_answer, timeout=timeout, client=client,
+                                   meter=meter, model=model)
+        self.judge = judge
+        self.available = getattr(judge, 'available', None)
+        self.stats_lock = threading.Lock()
+        self.resetStats()
+
+    def resetStats(self):
+        self.latencies = []
+        self.completed = 0
+        self.errors = 0
+        self.retries = 0
+        self.skipped = 0
+        self.unavailable = 0
+        self.elapsed = 0.0
+
+    def gradeOne(self, item):
+        """답안 1건 채점, 재시도 가능한 오류는 지수 백오프로 다시 시도 (실패 시 None)"""
+        if self.meter is not None and self.meter.exhausted():
+            with self.stats_lock:
+                self.skipped += 1
+            return None
+        for attempt in range(self.max_retries + 1):
+            if self.available is not None and not self.available():
+                with self.stats_lock:
+                    self.unavailable += 1
+                return None
+            self.bucket.acquire()
+            start = time.perf_counter()
+            try:
+                verdict = self.judge(item.question, item.correct_answer, item.user_answer, timeout=self.timeout)
+            except Exception as e:
+                if attempt < self.max_retries and isRetryable(e):
+                    with self.stats_lock:
+                        self.retries += 1
+                    time.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+                    continue
+                with self.stats_lock:
+                    self.errors += 1
+                return None
+            with self.stats_lock:
+                self.latencies.append(time.perf_counter() - start)
+                self.completed += 1
+            return verdict
+        return None
+
+    def gradeMany(self, items):
+        """{item.id: 정답 여부 또는 None}을 반환"""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            verdicts = dict(zip((item.id for item in items), executor.map(self.gradeOne, items)))
+        self.elapsed += time.perf_counter() - start
+        return verdicts
+
+    def stats(self):
+        with self.stats_lock:
+            latencies = list(self.latencies)
+            return {
+                'completed': self.completed,
+                'errors': self.errors,
+                'retries': self.retries,
+                'skipped_over_budget': self.skipped,
+                'skipped_unavailable': self.unavailable,
+                'throughput_per_sec': self.completed / self.elapsed if self.elapsed else 0.0,
+                'latency_p50_ms': percentile(latencies, 0.50) * 1000,
+                'latency_p95_ms': percentile(latencies, 0.95) * 1000,
+                'latency_max_ms': max(latencies, default=0.0) * 1000,
+            }
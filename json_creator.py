@@ -235,16 +235,24 @@ class JSONCreator(QWidget):
 
             if data:
                 options = QFileDialog.Options()
-                file_name, _ = QFileDialog.getSaveFileName(
-                    self, "JSON 파일 저장", "", "JSON Files (*.json)", options=options
+                file_name, selected_filter = QFileDialog.getSaveFileName(
+                    self, "JSON 파일 저장", "",
+                    "JSON Files (*.json);;Compiled Question Bank (*.qbank)", options=options
                 )
 
                 if file_name:
-                    if not file_name.endswith('.json'):
-                        file_name += '.json'
-                    
-                    with open(file_name, 'w', encoding='utf-8') as file:
-                        json.dump(data, file, ensure_ascii=False, indent=4)
+                    # 대용량 문제 모음용 바이너리 형식 (mmap으로 필요한 문제만 읽음)
+                    if file_name.endswith('.qbank') or selected_filter.startswith('Compiled'):
+                        from compiled_bank import compileBank
+                        if not file_name.endswith('.qbank'):
+                            file_name += '.qbank'
+                        compileBank(data, file_name)
+                    else:
+                        if not file_name.endswith('.json'):
+                            file_name += '.json'
+
+                        with open(file_name, 'w', encoding='utf-8') as file:
+                            json.dump(data, file, ensure_ascii=False, indent=4)
 
                     msg = QMessageBox(self)
                     msg.setWindowTitle('성공')
@@ -5,9 +5,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QColor
-import quiz_app
-import quiz_app_advanced
-import json_creator
 
 
 class FeatureCard(QFrame):
@@ -147,7 +144,7 @@ class MainWindow(QWidget):
         # Basic Quiz Card
         basic_card = FeatureCard(
             title='Basic Quiz',
-            description='정확히 일치하는 답만\n정답으로 인정합니다',
+            description='정확히 일치하는 답만 정답\n(복합 정답은 순서 무관)',
             button_text='시작하기',
             color='#10b981',
             on_click=self.startQuizApp
@@ -186,15 +183,19 @@ class MainWindow(QWidget):
 
         self.setLayout(main_layout)
 
+    # 각 도구는 카드를 클릭했을 때 처음 임포트하여 런처 시작 시간을 줄임
     def startQuizApp(self):
+        import quiz_app
         self.quiz_app = quiz_app.QuizApp()
         self.quiz_app.show()
 
     def startAdvancedQuizApp(self):
+        import quiz_app_advanced
         self.advanced_quiz_app = quiz_app_advanced.QuizApp()
         self.advanced_quiz_app.show()
 
     def startJSONCreator(self):
+        import json_creator
         self.json_creator = json_creator.JSONCreator()
         self.json_creator.show()
 
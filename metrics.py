@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import bisect
+import functools
+import threading
+
+
+# 설정하면 측정을 켜고 종료 시 이 경로로 내보냄 (.prom이면 Prometheus 텍스트, 그 외 JSON)
+METRICS_PATH = os.getenv("QUIZ_METRICS", "")
+
+# 0.01ms ~ 약 100초를 1.25배 간격으로 나눈 히스토그램 구간 경계 (ms)
+BUCKET_BOUNDS = tuple(0.01 * 1.25 ** i for i in range(73))
+
+
+class Histogram:
+    """고정 구간 지연 시간 히스토그램 (메모리 일정, 백분위수는 구간 안에서 보간)"""
+    def __init__(self, bounds=BUCKET_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                low = self.bounds[index - 1] if index > 0 else 0.0
+                high = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(self.max, low + (high - low) * (rank - seen) / count)
+            seen += count
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'sum_ms': self.total,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max,
+        }
+
+
+class _Span:
+    __slots__ = ('registry', 'name', 'start')
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Registry:
+    """이름별 지연 시간 히스토그램 모음
+
+    꺼져 있으면 span()은 아무 일도 하지 않는 공유 객체를 돌려주므로
+    계측 코드를 남겨 두어도 비용이 거의 없다.
+    """
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def span(self, name):
+        """with metrics.span('next_question'): ... 구간의 소요 시간을 기록"""
+        return _Span(self, name) if self.enabled else _NO_SPAN
+
+    def timed(self, name):
+        """함수 호출 시간을 기록하는 데코레이터"""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Span(self, name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def observe(self, name, value_ms):
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    def prometheusText(self, prefix='quiz'):
+        """Prometheus 텍스트 형식 (구간 경계는 초 단위)"""
+        lines = []
+        with self.lock:
+            for name, histogram in sorted(self.histograms.items()):
+                metric = f'{prefix}_{name.replace(".", "_")}_seconds'
+                lines.append(f'# TYPE {metric} histogram')
+                cumulative = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound / 1000:.6g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum {histogram.total / 1000:.6f}')
+                lines.append(f'{metric}_count {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path):
+        """확장자에 따라 JSON 또는 Prometheus 텍스트로 저장"""
+        if path.endswith('.prom'):
+            text = self.prometheusText()
+        else:
+            text = json.dumps(self.snapshot(), ensure_ascii=False, indent=4)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(text)
+
+
+metrics = Registry(enabled=bool(METRICS_PATH))
+
+
+def exportMetrics(path=METRICS_PATH):
+    """QUIZ_METRICS가 설정되어 있으면 지금까지의 측정값을 내보냄"""
+    if path and metrics.enabled:
+        metrics.export(path)
@@ -0,0 +1,213 @@
+import os
+import re
+import json
+import hashlib
+from collections import namedtuple
+
+
+DEFAULT_CHECKPOINT_DIR = os.getenv(
+    "QUIZ_CHECKPOINT_DIR",
+    os.path.join(os.path.expanduser("~"), ".quiz_app", "checkpoints"),
+)
+
+# 이어서 풀 수 있는 세션 요약 (total: 전체 문제 수, 알 수 없으면 0)
+Checkpoint = namedtuple('Checkpoint', ['path', 'source', 'solved', 'correct', 'wrong', 'total', 'updated_at'])
+
+
+class ProgressJournal:
+    """퀴즈 진행 상황을 답안 1건당 한 줄씩 덧붙여 기록하는 저널
+
+    원본 문제 파일은 그대로 두고, 재개할 때 저널을 원본 위에 재생한다.
+    fsync는 fsync_every 건마다 묶어서 수행하고, compact_every 건마다
+    지금까지의 기록을 스냅샷 한 줄로 압축한다. 스냅샷은 임시 파일에 쓴 뒤
+    교체하므로 어느 시점에 죽어도 마지막 스냅샷 + 그 뒤의 기록이 남는다.
+
+    state에 함수를 넣으면 스냅샷마다 그 반환값(추첨 상태 등)을 함께 저장하고,
+    재생한 값은 session_state로 돌려준다. mode는 저널을 쓴 앱(basic/ai)이다.
+    """
+    def __init__(self, path, source, mode='', fsync_every=10, compact_every=500):
+        self.path = path
+        self.source = os.path.abspath(source) if source else None
+        self.mode = mode
+        self.fsync_every = fsync_every
+        self.compact_every = compact_every
+        self.solved = set()
+        # 시험 모드에서 채점을 미룬 {문제: 답안}
+        self.deferred = {}
+        self.correct_count = 0
+        self.wrong_count = 0
+        self.session_state = {}
+        self.state = None
+        self.pending = 0
+        self.records = 0
+        self.file = None
+
+    @staticmethod
+    def pathFor(source, mode='', directory=DEFAULT_CHECKPOINT_DIR):
+        """문제 파일(또는 폴더/glob)과 앱 모드에 대응하는 저널 파일 경로
+
+        채점 방식과 시험 모드의 미채점 답안이 앱마다 다르므로 Basic과 AI Quiz는
+        같은 문제 파일이라도 따로 저장한다.
+        """
+        base_name = os.path.splitext(os.path.basename(os.path.normpath(source)))[0]
+        base_name = re.sub(r'[^\w.-]+', '_', base_name) or 'bank'
+        if mode:
+            base_name = f'{mode}_{base_name}'
+        # 이름이 같은 다른 폴더의 파일과 겹치지 않도록 전체 경로의 해시를 붙임
+        digest = hashlib.sha1(os.path.abspath(source).encode('utf-8')).hexdigest()[:8]
+        return os.path.join(directory, f"progress_{base_name}_{digest}.jsonl")
+
+    def open(self):
+        """기존 저널을 재생한 뒤 이어 쓰기 위해 연다"""
+        if not self.replay():
+            self.solved.clear()
+            self.deferred.clear()
+            self.correct_count = 0
+            self.wrong_count = 0
+            self.session_state = {}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # 재생한 상태로 압축해 두면 잘린 마지막 줄 뒤에 이어 쓰는 일이 없음
+        self.writeSnapshot()
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+    def replay(self):
+        """저널을 읽어 상태를 복원, 다른 문제 파일의 저널이면 False"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return False
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # 비정상 종료로 잘린 마지막 줄은 무시
+                continue
+            if 'source' in record:
+                if self.source is None:
+                    self.source = record['source']
+                elif record['source'] != self.source:
+                    return False
+                self.mode = record.get('mode', '')
+                self.solved = set(record['solved'])
+                self.deferred = record.get('deferred', {})
+                self.correct_count = record['correct']
+                self.wrong_count = record['wrong']
+                self.session_state = record.get('session', {})
+            elif 'p' in record:
+                self.deferred[record['q']] = record['p']
+            else:
+                self.deferred.pop(record['q'], None)
+                if record['ok']:
+                    self.solved.add(record['q'])
+                    self.correct_count += 1
+                else:
+                    self.wrong_count += 1
+            self.records += 1
+        return self.records > 0
+
+    def empty(self):
+        """기록된 답안이 없으면 True"""
+        return not (self.correct_count or self.wrong_count or self.deferred)
+
+    def apply(self, questions):
+        """원본 문제 딕셔너리에서 이미 맞힌 문제를 제거한 사본을 반환"""
+        return {q: a for q, a in questions.items() if q not in self.solved}
+
+    def append(self, question, is_correct):
+        self.deferred.pop(question, None)
+        if is_correct:
+            self.solved.add(question)
+            self.correct_count += 1
+        else:
+            self.wrong_count += 1
+        self.write({'q': question, 'ok': is_correct})
+
+    def defer(self, question, user_answer):
+        """시험 모드에서 채점을 미룬 답안을 기록"""
+        self.deferred[question] = user_answer
+        self.write({'q': question, 'p': user_answer})
+
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+        self.records += 1
+        self.pending += 1
+
+        if self.records >= self.compact_every:
+            self.compact()
+        elif self.pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        if self.file and self.pending:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.pending = 0
+
+    def compact(self):
+        """지금까지의 기록을 스냅샷 한 줄로 교체"""
+        if self.file:
+            self.file.close()
+        self.writeSnapshot()
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+    def writeSnapshot(self):
+        if self.state is not None:
+            self.session_state = self.state()
+        snapshot = {
+            'source': self.source,
+            'mode': self.mode,
+            'correct': self.correct_count,
+            'wrong': self.wrong_count,
+            'session': self.session_state,
+            'deferred': self.deferred,
+            'solved': sorted(self.solved),
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps(snapshot, ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        self.records = 1
+        self.pending = 0
+
+    def close(self):
+        """마지막 세션 상태까지 담은 스냅샷으로 압축하고 닫음"""
+        if self.file:
+            self.file.close()
+            self.file = None
+            self.writeSnapshot()
+
+    def delete(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def listCheckpoints(mode=None, directory=DEFAULT_CHECKPOINT_DIR):
+    """이어서 풀 수 있는 세션 목록 (최근에 저장된 순, mode를 주면 그 앱의 세션만)"""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    checkpoints = []
+    for name in names:
+        if not (name.startswith('progress_') and name.endswith('.jsonl')):
+            continue
+        path = os.path.join(directory, name)
+        journal = ProgressJournal(path, None)
+        if not journal.replay() or journal.source is None:
+            continue
+        if mode is not None and journal.mode != mode:
+            continue
+        checkpoints.append(Checkpoint(
+            path, journal.source, len(journal.solved), journal.correct_count, journal.wrong_count,
+            journal.session_state.get('total', 0), os.path.getmtime(path)
+        ))
+    checkpoints.sort(key=lambda checkpoint: checkpoint.updated_at, reverse=True)
+    return checkpoints
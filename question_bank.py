@@ -0,0 +1,191 @@
+import os
+import re
+import glob
+import json
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+# file: 원본 파일 경로, lecture: 파일 이름에서 딴 강의 태그 (예: L24)
+QuestionSource = namedtuple('QuestionSource', ['file', 'lecture'])
+
+# 이 크기를 넘는 단일 JSON 파일은 GUI에서 스트리밍으로 읽음
+STREAMING_THRESHOLD = 8 * 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DELIMITER = re.compile(r'[ \t\n\r]*[,:}]')
+# 흔한 경우인 "문제": "정답", 한 쌍을 정규식 한 번으로 읽는 빠른 경로
+_STRING_PAIR = re.compile(r'[ \t\n\r]*("[^"\\]*(?:\\.[^"\\]*)*")[ \t\n\r]*:[ \t\n\r]*("[^"\\]*(?:\\.[^"\\]*)*")[ \t\n\r]*([,}])')
+
+# 같은 문제가 여러 파일에 있을 때: 먼저 읽힌 파일이 우선, conflict는 정답이 서로 다른 경우
+Duplicate = namedtuple('Duplicate', ['question', 'kept', 'dropped', 'conflict'])
+
+
+def expandSources(source):
+    """파일, 폴더, glob 패턴을 JSON 파일 경로 목록으로 변환 (정렬됨)"""
+    if os.path.isdir(source):
+        return sorted(glob.glob(os.path.join(source, '*.json')))
+    if glob.has_magic(source):
+        return sorted(path for path in glob.glob(source, recursive=True) if os.path.isfile(path))
+    return [source] if os.path.isfile(source) else []
+
+
+def lectureTag(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def readQuestionFile(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+class QuestionBank:
+    """여러 문제 파일을 하나로 합친 인덱스
+
+    answers는 {문제: 정답}, sources는 {문제: QuestionSource}.
+    """
+    def __init__(self):
+        self.answers = {}
+        self.sources = {}
+        self.duplicates = []
+        self.errors = {}
+        self.files = []
+
+    def __len__(self):
+        return len(self.answers)
+
+    def add(self, path, questions):
+        source = QuestionSource(path, lectureTag(path))
+        if path not in self.files:
+            self.files.append(path)
+        for question, answer in questions.items():
+            kept = self.sources.get(question)
+            if kept is not None:
+                self.duplicates.append(Duplicate(question, kept, source, self.answers[question] != answer))
+                continue
+            self.answers[question] = answer
+            self.sources[question] = source
+
+    def lectures(self):
+        return sorted({source.lecture for source in self.sources.values()})
+
+    def problems(self, limit=5):
+        """읽지 못한 파일과 중복 문제 요약 (문제가 없으면 빈 목록)"""
+        lines = [f'{os.path.basename(path)}: {error}' for path, error in list(self.errors.items())[:limit]]
+        if len(self.errors) > limit:
+            lines.append(f'... 외 {len(self.errors) - limit}개 파일')
+        if self.duplicates:
+            conflicts = sum(1 for duplicate in self.duplicates if duplicate.conflict)
+            lines.append(f'중복 문제 {len(self.duplicates)}개 (정답이 다른 문제 {conflicts}개, 먼저 읽은 파일의 정답 사용)')
+        return lines
+
+
+def loadBank(paths, max_workers=8):
+    """문제 파일들을 병렬로 읽어 QuestionBank로 합침 (합치는 순서는 paths 순서)"""
+    bank = QuestionBank()
+    if len(paths) == 1:
+        results = [readFileSafely(paths[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(readFileSafely, paths))
+
+    for path, (questions, error) in zip(paths, results):
+        if error is not None:
+            bank.errors[path] = error
+        else:
+            bank.add(path, questions)
+    return bank
+
+
+def readFileSafely(path):
+    try:
+        questions = readQuestionFile(path)
+    except (OSError, ValueError) as e:
+        return None, str(e)
+    if not isinstance(questions, dict):
+        return None, '{"문제": "정답"} 형식이 아닙니다'
+    return questions, None
+
+
+def decodeString(text):
+    """따옴표를 포함한 JSON 문자열 토큰을 디코딩 (이스케이프가 없으면 잘라내기만 함)"""
+    return json.loads(text) if '\\' in text else text[1:-1]
+
+
+def iterQuestions(path, chunk_size=1024 * 1024, progress=None):
+    """{"문제": "정답", ...} 파일을 조금씩 읽으며 (문제, 정답)을 하나씩 반환
+
+    파일 전체를 메모리에 올리지 않으므로 수백 MB 파일도 일정한 메모리로 읽는다.
+    progress를 주면 읽은 바이트 비율(0~100)을 넘겨 호출한다.
+    """
+    total = os.path.getsize(path) or 1
+    with open(path, 'r', encoding='utf-8') as file:
+        buffer = ''
+        position = 0
+        eof = False
+
+        def fill():
+            nonlocal buffer, position, eof
+            chunk = file.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            if progress:
+                progress(min(100, int(file.buffer.tell() * 100 / total)))
+            return True
+
+        def skipWhitespace():
+            nonlocal position
+            while True:
+                position = _WHITESPACE.match(buffer, position).end()
+                if position < len(buffer) or not fill():
+                    return
+
+        def expect(chars):
+            nonlocal position
+            skipWhitespace()
+            if position >= len(buffer) or buffer[position] not in chars:
+                raise ValueError(f'{path}: JSON 형식 오류 (위치 근처: {buffer[position:position + 20]!r})')
+            position += 1
+            return buffer[position - 1]
+
+        def readValue():
+            nonlocal position
+            skipWhitespace()
+            while True:
+                try:
+                    value, end = _DECODER.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if fill():
+                        continue
+                    raise
+                # 숫자 등이 청크 경계에서 잘렸을 수 있으므로 ("0." → 0) 뒤에 구분자가 보일 때까지 더 읽고 다시 해석
+                if not _DELIMITER.match(buffer, end) and not eof and fill():
+                    continue
+                position = end
+                return value
+
+        expect('{')
+        skipWhitespace()
+        if position < len(buffer) and buffer[position] == '}':
+            return
+        while True:
+            match = _STRING_PAIR.match(buffer, position)
+            if match:
+                position = match.end()
+                question, answer, delimiter = match.groups()
+                yield decodeString(question), decodeString(answer)
+                if delimiter == '}':
+                    break
+                continue
+            question = readValue()
+            expect(':')
+            answer = readValue()
+            yield question, answer
+            if expect(',}') == '}':
+                break
+        if progress:
+            progress(100)
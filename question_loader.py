@@ -0,0 +1,47 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from question_bank import iterQuestions
+
+
+class StreamingLoader(QThread):
+    """큰 JSON 문제 파일을 GUI 스레드 밖에서 조금씩 읽어 묶음 단위로 전달
+
+    첫 묶음은 작게 보내 바로 출제를 시작할 수 있게 하고, 이후에는 시그널
+    횟수를 줄이도록 큰 묶음으로 보낸다.
+    """
+    batchLoaded = pyqtSignal(object)
+    progress = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, path, first_batch=200, batch_size=5000, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.first_batch = first_batch
+        self.batch_size = batch_size
+        self.last_percent = -1
+
+    def reportProgress(self, percent):
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.progress.emit(percent)
+
+    def run(self):
+        batch = []
+        limit = self.first_batch
+        try:
+            for pair in iterQuestions(self.path, progress=self.reportProgress):
+                if self.isInterruptionRequested():
+                    return
+                batch.append(pair)
+                if len(batch) >= limit:
+                    self.batchLoaded.emit(batch)
+                    batch = []
+                    limit = self.batch_size
+        except (OSError, ValueError) as e:
+            if batch:
+                self.batchLoaded.emit(batch)
+            if not self.isInterruptionRequested():
+                self.failed.emit(str(e))
+            return
+        if batch and not self.isInterruptionRequested():
+            self.batchLoaded.emit(batch)
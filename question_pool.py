@@ -0,0 +1,75 @@
+import os
+import random
+
+
+# 설정하면 같은 순서로 출제되는 재현 가능한 세션
+DEFAULT_SEED = os.getenv('QUIZ_SEED')
+
+
+class QuestionPool:
+    """O(1) 추첨/삭제를 지원하는 문제 풀
+
+    문제 목록을 배열로 들고 있고, 삭제할 때는 마지막 원소와 자리를 바꿔
+    꺼내므로 매번 키 목록을 새로 만들 필요가 없다. 딕셔너리처럼
+    pool[question], len(pool), pool.pop(question)을 그대로 쓸 수 있다.
+    """
+    def __init__(self, questions=None, seed=DEFAULT_SEED):
+        self.answers = {}
+        self.keys = []
+        self.index = {}
+        self.rng = random.Random(seed)
+        for question, answer in (questions or {}).items():
+            self.add(question, answer)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, question):
+        return question in self.index
+
+    def __getitem__(self, question):
+        return self.answers[question]
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def items(self):
+        return ((question, self.answers[question]) for question in self.keys)
+
+    def add(self, question, answer):
+        """문제를 풀에 추가 (이미 있으면 정답만 갱신)"""
+        if question not in self.index:
+            self.index[question] = len(self.keys)
+            self.keys.append(question)
+        self.answers[question] = answer
+
+    def requeue(self, question, answer):
+        """빠졌던 문제를 다시 출제 대상으로 되돌림"""
+        self.add(question, answer)
+
+    def pop(self, question):
+        """문제를 풀에서 제거하고 정답을 반환"""
+        position = self.index.pop(question)
+        last = self.keys.pop()
+        if last != question:
+            self.keys[position] = last
+            self.index[last] = position
+        return self.answers.pop(question)
+
+    def draw(self, avoid=None):
+        """무작위 문제 하나를 반환 (풀에서는 제거하지 않음)
+
+        avoid를 주면 다른 문제가 남아 있는 한 같은 문제를 연속으로 내지 않는다.
+        """
+        if not self.keys:
+            raise IndexError('빈 문제 풀에서 추첨할 수 없습니다')
+        position = self.rng.randrange(len(self.keys))
+        if self.keys[position] == avoid and len(self.keys) > 1:
+            position = (position + 1 + self.rng.randrange(len(self.keys) - 1)) % len(self.keys)
+        return self.keys[position]
+
+    def getState(self):
+        return self.rng.getstate()
+
+    def setState(self, state):
+        self.rng.setstate(state)
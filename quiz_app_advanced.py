@@ -1,522 +1,403 @@
 import sys
-import random
-import json
 import os
-import shutil
-from openai import OpenAI
-from dotenv import load_dotenv
-from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QMessageBox, QStackedWidget, QFileDialog,
-    QFrame, QProgressBar, QGraphicsDropShadowEffect
-)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QColor
-
-# Load environment variables
-load_dotenv()
-
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-
-class ModernButton(QPushButton):
-    """모던한 스타일의 버튼"""
-    def __init__(self, text, primary=True, parent=None):
-        super().__init__(text, parent)
-        self.primary = primary
-        self.setFont(QFont('Pretendard', 12, QFont.Medium))
-        self.setCursor(Qt.PointingHandCursor)
-        self.setMinimumHeight(48)
-        self.updateStyle()
-    
-    def updateStyle(self):
-        if self.primary:
-            self.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #6366f1, stop:1 #8b5cf6);
-                    color: white;
-                    border: none;
-                    border-radius: 12px;
-                    padding: 12px 24px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #4f46e5, stop:1 #7c3aed);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #4338ca, stop:1 #6d28d9);
-                }
-                QPushButton:disabled {
-                    background: #94a3b8;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #f1f5f9;
-                    color: #475569;
-                    border: 2px solid #e2e8f0;
-                    border-radius: 12px;
-                    padding: 12px 24px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #e2e8f0;
-                    border-color: #cbd5e1;
-                }
-                QPushButton:pressed {
-                    background-color: #cbd5e1;
-                }
-            """)
-
-
-class ModernLineEdit(QLineEdit):
-    """모던한 스타일의 입력 필드"""
-    def __init__(self, placeholder="", parent=None):
+import time
+import threading
+from functools import partial
+from PyQt5.QtWidgets import QApplication, QHBoxLayout, QMessageBox, QCheckBox
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
+from verdict_cache import VerdictCache
+from grading import AliasTable, TieredGrader
+from ai_judge import GRADING_TIMEOUT, UsageMeter, judgeBatch, gradeBatch
+from grader_backends import createBackend
+from quiz_core import Grader, QuizSession
+from semantic_grader import createSemanticGrader
+from quiz_ui import QuizWindow
+from scheduler import createScheduler
+from results_store import ResultStore
+from metrics import metrics
+
+# 동의어 묶음 JSON 파일 (선택)
+ALIAS_FILE = os.getenv("QUIZ_ALIAS_FILE", "")
+
+# 입력을 멈춘 뒤 추측 채점까지 기다리는 시간 (ms, 0이면 끔)
+# 타자 사이의 짧은 멈춤에는 요청하지 않도록 답을 다 적고 잠시 멈췄을 때만 보냄
+SPECULATIVE_DELAY_MS = int(os.getenv("QUIZ_SPECULATIVE_DELAY_MS", "600"))
+# 문제당 제출 전에 미리 보낼 수 있는 AI 채점 요청 수 (기본 0: 로컬/캐시 추측만)
+# 다음 문제로 넘어가 취소해도 이미 보낸 HTTP 요청은 끝까지 처리되어 과금되므로 켤 때만 사용
+SPECULATIVE_REMOTE_LIMIT = int(os.getenv("QUIZ_SPECULATIVE_REMOTE", "0"))
+
+
+def createLocalGrader():
+    aliases = AliasTable()
+    if ALIAS_FILE and os.path.exists(ALIAS_FILE):
+        aliases.loadJSON(ALIAS_FILE)
+    return TieredGrader(aliases=aliases)
+
+
+class GradingWorker(QThread):
+    """GUI 스레드 밖에서 채점을 수행하고 결과를 시그널로 전달"""
+    graded = pyqtSignal(bool)
+    failed = pyqtSignal(str)
+
+    def __init__(self, grader, question, correct_answer, user_answer, timeout, parent=None):
         super().__init__(parent)
-        self.setPlaceholderText(placeholder)
-        self.setFont(QFont('Pretendard', 14))
-        self.setMinimumHeight(56)
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: #f8fafc;
-                border: 2px solid #e2e8f0;
-                border-radius: 14px;
-                padding: 14px 20px;
-                color: #1e293b;
-                selection-background-color: #6366f1;
-            }
-            QLineEdit:focus {
-                border-color: #6366f1;
-                background-color: white;
-            }
-            QLineEdit::placeholder {
-                color: #94a3b8;
-            }
-        """)
-
-
-class QuizApp(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.Ques = {}
-        self.total_questions = 0
-        self.current_question_index = 0
-        self.correct_count = 0
-        self.json_file = ""
-        self.json_file_copy = ""
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle('🤖 AI Quiz App')
-        self.setGeometry(100, 100, 650, 550)
-        self.setMinimumSize(600, 500)
-        
-        # 전체 배경 스타일
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #f0f4ff, stop:0.5 #faf5ff, stop:1 #fff7ed);
-            }
-            QMessageBox {
-                background-color: white;
-            }
-            QMessageBox QLabel {
-                color: #1e293b;
-                font-size: 14px;
-            }
-            QMessageBox QPushButton {
-                background-color: #6366f1;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 20px;
-                min-width: 80px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #4f46e5;
-            }
-        """)
-
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(30, 30, 30, 30)
-        main_layout.setSpacing(20)
-
-        # Header
-        header_label = QLabel('🤖 AI Quiz App')
-        header_label.setFont(QFont('Pretendard', 28, QFont.Bold))
-        header_label.setStyleSheet('color: #1e293b; background: transparent;')
-        header_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(header_label)
-
-        subtitle = QLabel('AI가 채점하는 스마트 퀴즈 시스템')
-        subtitle.setFont(QFont('Pretendard', 12))
-        subtitle.setStyleSheet('color: #64748b; background: transparent;')
-        subtitle.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(subtitle)
-
-        main_layout.addSpacing(10)
-
-        self.stack = QStackedWidget()
-        self.stack.setStyleSheet('background: transparent;')
-        main_layout.addWidget(self.stack)
-
-        # Welcome Page
-        self.welcome_page = self.createWelcomePage()
-        self.stack.addWidget(self.welcome_page)
-
-        # Quiz Page
-        self.quiz_page = QuizPage(self)
-        self.stack.addWidget(self.quiz_page)
-
-        self.setLayout(main_layout)
-
-    def createWelcomePage(self):
-        page = QFrame()
-        page.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 20px;
-                border: none;
-            }
-        """)
-        
-        # 그림자 효과
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setXOffset(0)
-        shadow.setYOffset(10)
-        shadow.setColor(QColor(0, 0, 0, 25))
-        page.setGraphicsEffect(shadow)
-
-        layout = QVBoxLayout(page)
-        layout.setContentsMargins(40, 50, 40, 50)
-        layout.setSpacing(25)
-
-        # 색상 원형 인디케이터
-        indicator = QLabel()
-        indicator.setFixedSize(64, 64)
-        indicator.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #6366f1, stop:1 #8b5cf6);
-            border-radius: 32px;
-        """)
-        
-        indicator_container = QHBoxLayout()
-        indicator_container.addStretch()
-        indicator_container.addWidget(indicator)
-        indicator_container.addStretch()
-        layout.addLayout(indicator_container)
-
-        guide_label = QLabel('퀴즈를 시작하려면\nJSON 파일을 선택하세요')
-        guide_label.setFont(QFont('Pretendard', 16))
-        guide_label.setStyleSheet('color: #475569; background: transparent;')
-        guide_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(guide_label)
-
-        layout.addSpacing(20)
-
-        # 파일 선택 버튼
-        self.select_button = ModernButton('📁 JSON 파일 선택', primary=True)
-        self.select_button.clicked.connect(self.selectJSONFile)
-        layout.addWidget(self.select_button)
-
-        # 안내 텍스트
-        hint_label = QLabel('💡 Tip: 문제와 정답이 담긴 JSON 파일을 준비하세요')
-        hint_label.setFont(QFont('Pretendard', 11))
-        hint_label.setStyleSheet('color: #94a3b8; background: transparent;')
-        hint_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(hint_label)
-
-        layout.addStretch()
-        return page
-
-    def selectJSONFile(self):
-        options = QFileDialog.Options()
-        file_name, _ = QFileDialog.getOpenFileName(
-            self, "JSON 파일 선택", "", "JSON Files (*.json)", options=options
-        )
-        if file_name:
-            self.json_file = file_name
-            self.createJSONFileCopy()
-            self.Ques = self.loadQuestions()
-            self.all = len(self.Ques)
-            self.i = 0
-            self.showQuizPage()
-
-    def createJSONFileCopy(self):
-        base_name = os.path.basename(self.json_file)
-        self.json_file_copy = f"copy_{base_name}"
-        shutil.copyfile(self.json_file, self.json_file_copy)
-
-    def loadQuestions(self):
+        self.grader = grader
+        self.question = question
+        self.correct_answer = correct_answer
+        self.user_answer = user_answer
+        self.timeout = timeout
+
+    def run(self):
         try:
-            with open(self.json_file_copy, 'r', encoding='utf-8') as file:
-                self.Ques = json.load(file)
-                self.total_questions = len(self.Ques)
-                return self.Ques
-        except FileNotFoundError:
-            return {}
+            is_correct = self.grader(
+                self.question, self.correct_answer, self.user_answer, timeout=self.timeout
+            )
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.failed.emit(str(e))
+            return
+        if not self.isInterruptionRequested():
+            self.graded.emit(is_correct)
 
-    def saveQuestions(self):
-        with open(self.json_file_copy, 'w', encoding='utf-8') as file:
-            json.dump(self.Ques, file, ensure_ascii=False)
 
-    def nextQuestion(self):
-        if len(self.Ques) == 0:
-            accuracy = (self.correct_count / self.total_questions) * 100 if self.total_questions > 0 else 0
-            self.showCompletionDialog(accuracy)
-        else:
-            self.question = random.choice(list(self.Ques.keys()))
-            self.current_question_index += 1
-            self.quiz_page.updateQuestion(self.question)
-            self.quiz_page.answer_input.clear()
-            self.quiz_page.answer_input.setFocus()
-            self.updateProgressLabel()
-
-    def showCompletionDialog(self, accuracy):
-        msg = QMessageBox(self)
-        msg.setWindowTitle('퀴즈 완료!')
-        
-        if accuracy >= 90:
-            grade = '최고예요!'
-        elif accuracy >= 70:
-            grade = '잘했어요!'
-        elif accuracy >= 50:
-            grade = '괜찮아요!'
-        else:
-            grade = '더 공부해봐요!'
-        
-        msg.setText(f'{grade}\n\n정답률: {accuracy:.1f}%\n맞은 문제: {self.correct_count}/{self.total_questions}')
-        msg.setIcon(QMessageBox.Information)
-        msg.exec_()
-        self.close()
-
-    def checkAnswer(self):
-        user_answer = self.quiz_page.answer_input.text().strip()
-        if not user_answer:
-            return
-        
-        # 버튼 비활성화 (중복 클릭 방지)
-        self.quiz_page.submit_button.setEnabled(False)
-        self.quiz_page.submit_button.setText('AI가 채점 중...')
-        QApplication.processEvents()
-        
+class BatchGradingWorker(QThread):
+    """시험 모드에서 모아 둔 답안을 묶음 요청으로 채점"""
+    graded = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, batch_judge, items, timeout, meter=None, parent=None):
+        super().__init__(parent)
+        self.batch_judge = batch_judge
+        self.items = items
+        self.timeout = timeout
+        self.meter = meter
+
+    def run(self):
         try:
-            response = client.chat.completions.create(
-                model="gpt-4.1-mini",
-                temperature=0,
-                max_tokens=10,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a quiz judge. Compare the user's answer to the correct answer. Reply with ONLY 'Yes' if correct (even if phrased differently or in another language), or 'No' if incorrect."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Question: {self.question}\nCorrect Answer: {self.Ques[self.question]}\nUser's Answer: {user_answer}"
-                    }
-                ]
-            )
-            judge_result = response.choices[0].message.content.strip().lower()
+            verdicts, failed = gradeBatch(self.items, self.batch_judge, timeout=self.timeout, meter=self.meter)
         except Exception as e:
-            QMessageBox.critical(self, '오류', f'API 호출 중 오류가 발생했습니다:\n{str(e)}')
-            self.quiz_page.submit_button.setEnabled(True)
-            self.quiz_page.submit_button.setText('제출하기')
+            if not self.isInterruptionRequested():
+                self.failed.emit(str(e))
             return
-        
-        # 버튼 복구
-        self.quiz_page.submit_button.setEnabled(True)
-        self.quiz_page.submit_button.setText('제출하기')
-        
-        correct_answer = self.Ques[self.question]
-        
-        if judge_result == "yes":
-            self.showResultDialog(True, correct_answer)
-            self.correct_count += 1
-            self.Ques.pop(self.question)
-            self.saveQuestions()
-            self.nextQuestion()
-        else:
-            self.showResultDialog(False, correct_answer)
-            self.current_question_index -= 1
-            self.saveQuestions()
+        if not self.isInterruptionRequested():
+            self.graded.emit(verdicts, failed)
+
+
+# 창이 닫힌 뒤에도 끝나지 않은 워커가 소멸되지 않도록 보관
+_orphan_workers = set()
+
+
+class QuizApp(QuizWindow):
+    theme = 'ai'
+    title = '🤖 AI Quiz App'
+    window_title = '🤖 AI Quiz App'
+    subtitle = 'AI가 채점하는 스마트 퀴즈 시스템'
+    hint = '💡 Tip: 문제와 정답이 담긴 JSON 파일을 준비하세요'
+    # 시작 시 확인한 채점 백엔드 상태 (작업 스레드 → GUI 스레드)
+    backendChecked = pyqtSignal(object)
+
+    def __init__(self, grader=None, grading_timeout=GRADING_TIMEOUT, verdict_cache=None, batch_judge=None,
+                 speculative_delay=SPECULATIVE_DELAY_MS, speculative_remote_limit=SPECULATIVE_REMOTE_LIMIT,
+                 backend=None):
+        # AI 채점 토큰 사용량과 세션 예산 (QUIZ_SESSION_TOKEN_BUDGET, 다 쓰면 로컬 채점)
+        self.meter = UsageMeter()
+        # grader를 주지 않으면 QUIZ_GRADER_BACKEND(또는 backend 이름)로 고른 채점 백엔드 사용
+        # (local 백엔드는 원격 채점기 없이 로컬 규칙과 임베딩 유사도로 결정)
+        self.backend = createBackend(backend, meter=self.meter) if grader is None else None
+        if self.backend is not None and self.backend.remote:
+            grader = self.backend
+            batch_judge = batch_judge or self.backend.batch
+        # 원격 백엔드를 쓸 때만 시작 시 연결을 미리 맺고 상태를 확인해 둠
+        self.warm_up = self.backend is not None and self.backend.remote
+        self.batch_judge = batch_judge or partial(judgeBatch, meter=self.meter)
+        self.exam_mode = False
+        self.grading_timeout = grading_timeout
+        self.grading_worker = None
+        self.speculative_remote_limit = speculative_remote_limit
+        self.speculative_worker = None
+        self.speculative_count = 0
+        super().__init__(QuizSession(Grader(
+            createLocalGrader(),
+            verdict_cache if verdict_cache is not None else VerdictCache(),
+            grader,
+            createSemanticGrader(),
+            meter=self.meter
+        ), scheduler=createScheduler(), results=ResultStore(), mode='ai'))
+        self.grading_timer = QTimer(self)
+        self.grading_timer.setSingleShot(True)
+        self.grading_timer.timeout.connect(self.onGradingTimeout)
+        self.backendChecked.connect(self.onBackendChecked)
+
+        # 입력 중 추측 채점: 원격 요청은 동시에 1건, 문제당 speculative_remote_limit건까지
+        self.speculation_timer = QTimer(self)
+        self.speculation_timer.setSingleShot(True)
+        self.speculation_timer.setInterval(speculative_delay)
+        self.speculation_timer.timeout.connect(self.speculate)
+
+    def addWelcomeOptions(self, layout):
+        # 시험 모드 선택
+        self.exam_mode_check = QCheckBox('📝 시험 모드: 모든 문제를 푼 뒤 한 번에 채점')
+        self.exam_mode_check.setFont(QFont('Pretendard', 12))
+        exam_mode_container = QHBoxLayout()
+        exam_mode_container.addStretch()
+        exam_mode_container.addWidget(self.exam_mode_check)
+        exam_mode_container.addStretch()
+        layout.addLayout(exam_mode_container)
+
+    def startSession(self, source):
+        self.exam_mode = self.exam_mode_check.isChecked()
+        if self.warm_up and not self.exam_mode:
+            threading.Thread(target=self.warmUpBackend, daemon=True).start()
+        super().startSession(source)
+
+    def warmUpBackend(self):
+        self.backendChecked.emit(self.backend.warmUp())
+
+    def onBackendChecked(self, status):
+        """서버는 응답했지만 요청을 거부하면(API 키, 모델 설정 오류) 로컬 채점으로 숨기지 않고 알림"""
+        if status.ok or not status.reachable:
+            return
+        QMessageBox.warning(self, '채점 서버 설정 오류',
+                            f'{self.backend.name} 채점 서버가 요청을 거부했습니다. '
+                            f'API 키와 모델 설정을 확인하세요.\n{status.detail}')
+
+    def onQuestionsAdded(self, questions):
+        if not self.source.endswith('.qbank'):
+            # 정답이 수정된 문제의 캐시된 판정은 폐기 (캐시 키에 정답이 포함되어 있어 정리 목적일 뿐)
+            self.session.grader.cache.invalidateChanged(questions)
+        # 정답 변형 색인과 정답 임베딩을 미리 만들어 두어 채점할 때는 답안만 처리
+        super().onQuestionsAdded(questions)
+
+    def nextQuestion(self):
+        # 이전 문제의 답안으로 보낸 추측 채점은 결과를 기다리지 않고 버림
+        self.cancelSpeculation()
+        self.speculative_count = 0
+        super().nextQuestion()
+
+    def submitAnswer(self, user_answer):
+        if self.grading_worker is not None:
+            return
+
+        # 시험 모드: 답안만 모아 두고 마지막에 한꺼번에 채점
+        if self.exam_mode:
+            self.session.defer(user_answer)
             self.nextQuestion()
+            metrics.observe('check_answer', (time.perf_counter() - self.check_started) * 1000)
+            return
+
+        # 로컬 규칙(정규화, 유사도, 동의어)이나 캐시로 결정되면 API 호출 생략
+        self.speculation_timer.stop()
+        question = self.session.question
+        correct_answer = self.session.correctAnswer()
+        start = time.perf_counter()
+        result = self.session.grader.lookup(question, correct_answer, user_answer)
+        if result.verdict is not None:
+            self.applyVerdict(result.verdict, user_answer, result.tier, (time.perf_counter() - start) * 1000,
+                              result.credit)
+            return
+
+        # 버튼 비활성화 (중복 클릭 방지)
+        self.quiz_page.setGrading(True, 'AI가 채점 중...')
 
-    def showResultDialog(self, is_correct, correct_answer):
-        msg = QMessageBox(self)
-        if is_correct:
-            msg.setWindowTitle('정답!')
-            msg.setText(f'정답입니다!\n\n정답: {correct_answer}')
-            msg.setIcon(QMessageBox.Information)
+        # 같은 답안을 이미 미리 보내 두었으면 그 요청의 응답을 기다림
+        worker = self.speculative_worker
+        if worker is not None and (worker.question, worker.user_answer) == (question, user_answer):
+            self.speculative_worker = None
         else:
-            msg.setWindowTitle('오답')
-            msg.setText(f'틀렸습니다.\n\n정답: {correct_answer}')
-            msg.setIcon(QMessageBox.Warning)
-        msg.exec_()
+            worker = self.createGradingWorker(question, correct_answer, user_answer)
+            worker.started_at = start
+            worker.start()
+        self.grading_worker = worker
+        # 네트워크 타임아웃과 별개로 UI 쪽 제한 시간도 적용
+        self.grading_timer.start(int(self.grading_timeout * 1000) + 1000)
+
+    def createGradingWorker(self, question, correct_answer, user_answer):
+        worker = GradingWorker(
+            self.session.grader.remote, question, correct_answer,
+            user_answer, self.grading_timeout, self
+        )
+        worker.graded.connect(lambda is_correct, w=worker: self.onGraded(w, is_correct))
+        worker.failed.connect(lambda error, w=worker: self.onGradingFailed(w, error))
+        worker.finished.connect(worker.deleteLater)
+        return worker
+
+    def onAnswerEdited(self):
+        if self.speculation_timer.interval() > 0 and not self.exam_mode:
+            self.speculation_timer.start()
+
+    def speculate(self):
+        """입력을 멈춘 답안을 미리 채점해 두어 제출 시 바로 결과를 보여줌
+
+        로컬 단계/캐시로 결정되면 제출 시에도 즉시 결정되므로 할 일이 없다.
+        결정되지 않으면 제한 안에서 AI 채점을 미리 보내고, 결과는 캐시에 넣어 둔다.
+        """
+        question = self.session.question
+        user_answer = self.quiz_page.answer_input.text().strip()
+        if question is None or not user_answer or self.grading_worker is not None:
+            return
+        grader = self.session.grader
+        correct_answer = self.session.correctAnswer()
+        if grader.speculate(question, correct_answer, user_answer).verdict is not None:
+            return
+        if (grader.cache is None or not grader.remoteAvailable() or self.speculative_worker is not None
+                or self.speculative_count >= self.speculative_remote_limit):
+            return
+
+        self.speculative_count += 1
+        worker = GradingWorker(grader.remote, question, correct_answer, user_answer, self.grading_timeout, self)
+        worker.graded.connect(lambda is_correct, w=worker: self.onSpeculated(w, is_correct))
+        worker.failed.connect(lambda error, w=worker: self.onSpeculationFailed(w, error))
+        worker.finished.connect(worker.deleteLater)
+        worker.started_at = time.perf_counter()
+        self.speculative_worker = worker
+        worker.start()
+
+    def onSpeculated(self, worker, is_correct):
+        # 제출 후 이 요청을 그대로 기다리고 있으면 일반 채점 결과로 처리
+        if worker is self.grading_worker:
+            self.onGraded(worker, is_correct)
+            return
+        # 이미 다음 문제로 넘어갔으면(취소된 요청) 무시
+        if worker is not self.speculative_worker:
+            return
+        self.speculative_worker = None
+        self.session.grader.prime(worker.question, worker.correct_answer, worker.user_answer, is_correct)
+
+    def onSpeculationFailed(self, worker, error):
+        if worker is self.grading_worker:
+            self.onGradingFailed(worker, error)
+        elif worker is self.speculative_worker:
+            self.speculative_worker = None
+
+    def cancelSpeculation(self):
+        self.speculation_timer.stop()
+        worker = self.speculative_worker
+        if worker is None:
+            return
+        self.speculative_worker = None
+        self.detachWorker(worker)
+
+    def onGraded(self, worker, is_correct):
+        if worker is not self.grading_worker:
+            return
+        self.finishGrading()
+        latency_ms = (time.perf_counter() - worker.started_at) * 1000
+        metrics.observe('grade.remote', latency_ms)
+        result = self.session.grader.remember(worker.question, worker.correct_answer, worker.user_answer, is_correct)
+        self.applyVerdict(is_correct, worker.user_answer, result.tier, latency_ms)
+
+    def gradePendingAnswers(self):
+        """모아 둔 답안을 로컬 규칙/캐시로 먼저 채점하고 나머지만 일괄 요청"""
+        grader = self.session.grader
+        remote_items = []
+        for item in self.session.takePending():
+            result = grader.lookup(item.question, item.correct_answer, item.user_answer)
+            if result.verdict is None:
+                remote_items.append(item)
+            else:
+                self.session.record(result.verdict, item.question, item.user_answer, result.tier)
+
+        if not remote_items:
+            self.finishExam([])
+            return
 
-    def showQuizPage(self):
-        self.stack.setCurrentWidget(self.quiz_page)
-        self.quiz_page.resetStats(self.total_questions)
-        self.nextQuestion()
+        self.quiz_page.setGrading(True, f'AI가 {len(remote_items)}문제 채점 중...')
+        worker = BatchGradingWorker(self.batch_judge, remote_items, self.grading_timeout, self.meter, self)
+        worker.started_at = time.perf_counter()
+        worker.graded.connect(lambda verdicts, failed, w=worker: self.onBatchGraded(w, verdicts, failed))
+        worker.failed.connect(lambda error, w=worker: self.onBatchGradingFailed(w, error))
+        worker.finished.connect(worker.deleteLater)
+        self.grading_worker = worker
+        worker.start()
+
+    def onBatchGraded(self, worker, verdicts, failed):
+        if worker is not self.grading_worker:
+            return
+        metrics.observe('grade.batch', (time.perf_counter() - worker.started_at) * 1000)
+        self.finishGrading()
+        grader = self.session.grader
+        for item in worker.items:
+            if item.id in verdicts:
+                result = grader.remember(item.question, item.correct_answer, item.user_answer, verdicts[item.id])
+                self.session.record(result.verdict, item.question, item.user_answer, result.tier)
+        # 토큰 예산을 다 써서 요청하지 못한 답안은 로컬에서 채점
+        if failed and not grader.remoteAvailable():
+            for item in failed:
+                result = grader.lookup(item.question, item.correct_answer, item.user_answer)
+                self.session.record(result.verdict, item.question, item.user_answer, result.tier)
+            failed = []
+        self.finishExam(failed)
+
+    def onBatchGradingFailed(self, worker, error):
+        if worker is not self.grading_worker:
+            return
+        self.finishGrading()
+        QMessageBox.critical(self, '오류', f'API 호출 중 오류가 발생했습니다:\n{error}')
+        self.finishExam(worker.items)
+
+    def finishExam(self, ungraded):
+        self.updateProgressLabel()
+        note = ''
+        if ungraded:
+            # 채점하지 못한 답안은 대기열과 저널에 되돌려 두어 다시 채점하거나 이어 풀 때 채점
+            self.session.requeue(ungraded)
+            retry = QMessageBox.question(
+                self, '채점 실패', f'채점하지 못한 답안이 {len(ungraded)}개 있습니다. 다시 채점할까요?',
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+            )
+            if retry == QMessageBox.Yes:
+                self.gradePendingAnswers()
+                return
+            note = f'\n채점하지 못한 문제: {len(ungraded)}개 (이어서 풀면 다시 채점)'
+        usage = self.meter.stats()
+        if usage['judgments']:
+            note += (f"\nAI 채점 {usage['judgments']}건: 판정당 {usage['tokens_per_judgment']:.0f}토큰, "
+                     f"약 ${usage['cost_usd']:.4f}")
+        if usage['exhausted']:
+            note += '\n토큰 예산을 다 써서 이후 답안은 로컬에서 채점했습니다'
+        self.showCompletionDialog(self.session.accuracy(), note)
+
+    def onGradingFailed(self, worker, error):
+        if worker is not self.grading_worker:
+            return
+        self.finishGrading()
+        QMessageBox.critical(self, '오류', f'API 호출 중 오류가 발생했습니다:\n{error}')
 
-    def updateProgressLabel(self):
-        remaining = len(self.Ques)
-        solved = self.total_questions - remaining
-        self.quiz_page.updateProgress(solved, self.total_questions, self.correct_count)
+    def onGradingTimeout(self):
+        if self.grading_worker is None:
+            return
+        self.cancelGrading()
+        QMessageBox.critical(self, '오류', '채점 시간이 초과되었습니다. 다시 시도해주세요.')
+
+    def finishGrading(self):
+        self.grading_timer.stop()
+        self.grading_worker = None
+        self.quiz_page.setGrading(False)
+
+    def cancelGrading(self):
+        """진행 중인 채점을 버리고 UI를 복구"""
+        worker = self.grading_worker
+        if worker is None:
+            return
+        self.detachWorker(worker)
+        self.finishGrading()
+        if isinstance(worker, BatchGradingWorker):
+            # 결과를 받지 못한 시험 답안은 대기열에 되돌려 둠 (창을 닫아도 체크포인트가 남아 이어서 채점)
+            self.session.requeue(worker.items)
+
+    def detachWorker(self, worker):
+        worker.requestInterruption()
+        if worker.isRunning():
+            # 부모 위젯이 사라져도 스레드가 끝날 때까지 살아 있도록 분리
+            worker.setParent(None)
+            _orphan_workers.add(worker)
+            worker.finished.connect(lambda w=worker: _orphan_workers.discard(w))
 
     def closeEvent(self, event):
-        self.deleteJSONFileCopy()
-        event.accept()
-
-    def deleteJSONFileCopy(self):
-        if self.json_file_copy and os.path.exists(self.json_file_copy):
-            os.remove(self.json_file_copy)
-
-
-class QuizPage(QWidget):
-    def __init__(self, parent):
-        super().__init__()
-        self.parent = parent
-        self.initUI()
-
-    def initUI(self):
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(15)
-
-        # 카드 컨테이너
-        card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 20px;
-                border: none;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setXOffset(0)
-        shadow.setYOffset(10)
-        shadow.setColor(QColor(0, 0, 0, 25))
-        card.setGraphicsEffect(shadow)
-
-        card_layout = QVBoxLayout(card)
-        card_layout.setContentsMargins(35, 30, 35, 30)
-        card_layout.setSpacing(20)
-
-        # 상단 진행 상태 바
-        progress_container = QFrame()
-        progress_container.setStyleSheet('background: transparent;')
-        progress_layout = QHBoxLayout(progress_container)
-        progress_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.progress_label = QLabel('진행: 0/0')
-        self.progress_label.setFont(QFont('Pretendard', 11, QFont.Medium))
-        self.progress_label.setStyleSheet('color: #6366f1; background: transparent;')
-        progress_layout.addWidget(self.progress_label)
-
-        progress_layout.addStretch()
-
-        self.score_label = QLabel('정답: 0개')
-        self.score_label.setFont(QFont('Pretendard', 11, QFont.Medium))
-        self.score_label.setStyleSheet('color: #10b981; background: transparent;')
-        progress_layout.addWidget(self.score_label)
-
-        card_layout.addWidget(progress_container)
-
-        # 진행률 바
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setTextVisible(False)
-        self.progress_bar.setMaximumHeight(8)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #e2e8f0;
-                border-radius: 4px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #6366f1, stop:1 #8b5cf6);
-                border-radius: 4px;
-            }
-        """)
-        card_layout.addWidget(self.progress_bar)
-
-        card_layout.addSpacing(10)
-
-        # 문제 라벨
-        question_header = QLabel('📝 문제')
-        question_header.setFont(QFont('Pretendard', 12, QFont.Medium))
-        question_header.setStyleSheet('color: #64748b; background: transparent;')
-        card_layout.addWidget(question_header)
-
-        self.question_label = QLabel()
-        self.question_label.setFont(QFont('Pretendard', 16, QFont.Medium))
-        self.question_label.setStyleSheet("""
-            color: #1e293b;
-            background-color: #f8fafc;
-            border: none;
-            border-radius: 12px;
-            padding: 20px;
-        """)
-        self.question_label.setWordWrap(True)
-        self.question_label.setMinimumHeight(100)
-        self.question_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        card_layout.addWidget(self.question_label)
-
-        card_layout.addSpacing(5)
-
-        # 답변 입력
-        answer_header = QLabel('✏️ 정답 입력')
-        answer_header.setFont(QFont('Pretendard', 12, QFont.Medium))
-        answer_header.setStyleSheet('color: #64748b; background: transparent;')
-        card_layout.addWidget(answer_header)
-
-        self.answer_input = ModernLineEdit('정답을 입력하세요...')
-        self.answer_input.returnPressed.connect(self.parent.checkAnswer)
-        card_layout.addWidget(self.answer_input)
-
-        card_layout.addSpacing(10)
-
-        # 버튼 영역
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(12)
-
-        self.skip_button = ModernButton('건너뛰기', primary=False)
-        self.skip_button.clicked.connect(self.skipQuestion)
-        button_layout.addWidget(self.skip_button)
-
-        self.submit_button = ModernButton('제출하기', primary=True)
-        self.submit_button.clicked.connect(self.parent.checkAnswer)
-        button_layout.addWidget(self.submit_button, 2)
-
-        card_layout.addLayout(button_layout)
-
-        layout.addWidget(card)
-        self.setLayout(layout)
-
-    def updateQuestion(self, question):
-        self.question_label.setText(question)
-
-    def updateProgress(self, solved, total, correct):
-        self.progress_label.setText(f'진행: {solved}/{total}')
-        self.score_label.setText(f'정답: {correct}개')
-        if total > 0:
-            self.progress_bar.setValue(int((solved / total) * 100))
-
-    def resetStats(self, total):
-        self.progress_bar.setValue(0)
-        self.progress_label.setText(f'진행: 0/{total}')
-        self.score_label.setText('정답: 0개')
-
-    def skipQuestion(self):
-        self.parent.current_question_index -= 1
-        self.parent.nextQuestion()
+        self.cancelSpeculation()
+        self.cancelGrading()
+        super().closeEvent(event)
 
 
 if __name__ == '__main__':
@@ -525,6 +406,10 @@ if __name__ == '__main__':
     # 시스템 폰트 설정
     app.setStyle('Fusion')
     
-    quiz_app = QuizApp()
+    # --stub: API 대신 느린 가짜 채점기로 실행 (QUIZ_GRADER_BACKEND=stub과 같고 판정 캐시는 메모리에)
+    if '--stub' in sys.argv:
+        quiz_app = QuizApp(verdict_cache=VerdictCache(':memory:'), backend='stub')
+    else:
+        quiz_app = QuizApp()
     quiz_app.show()
     sys.exit(app.exec_())
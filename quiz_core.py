@@ -0,0 +1,526 @@
+import sys
+import csv
+import json
+import time
+import argparse
+
+from grading import GradeResult, JudgeItem, TieredGrader
+from blank_grader import BlankGrader
+from metrics import metrics
+from progress_journal import ProgressJournal
+from question_bank import QuestionBank, expandSources, iterQuestions, loadBank
+from compiled_bank import CompiledBank, CompiledQuestionPool
+from question_pool import DEFAULT_SEED, QuestionPool
+from scheduler import ScheduledQuestionPool, defaultUser
+
+
+class Grader:
+    """로컬 단계 → 판정 캐시 → 임베딩 유사도 → 원격 채점기 순서로 답안을 채점
+
+    GUI는 lookup()으로 바로 결정되는 답안을 처리하고, 나머지는 remote를
+    작업 스레드에서 호출한 뒤 remember()로 결과를 돌려준다. semantic
+    (SemanticGrader)은 remote가 없으면 판단 보류 구간까지 직접 결정한다.
+    빈칸이 여러 개인 문제는 로컬 단계를 답안 전체 대신 빈칸별로 적용한다.
+    meter(UsageMeter)의 토큰 예산을 다 쓰거나 remote 백엔드의 서버가 응답하지 않으면
+    remote가 없을 때처럼 로컬에서 결정한다.
+    """
+    def __init__(self, local=None, cache=None, remote=None, semantic=None, blanks=None, meter=None):
+        self.local = local or TieredGrader()
+        self.cache = cache
+        self.remote = remote
+        self.semantic = semantic
+        self.blanks = blanks if blanks is not None else BlankGrader()
+        self.meter = meter
+
+    def remoteAvailable(self):
+        """원격 채점기가 있고, 토큰 예산이 남아 있고, 백엔드 서버가 응답하는지"""
+        if self.remote is None or (self.meter is not None and self.meter.exhausted()):
+            return False
+        available = getattr(self.remote, 'available', None)
+        return available is None or available()
+
+    def prepare(self, source, questions, save=True):
+        """문제를 불러올 때 {문제: 정답}의 정답 변형 색인과 정답 임베딩을 미리 만들어 둠
+
+        빈칸 패턴은 문제를 처음 채점할 때 컴파일한다.
+        """
+        self.local.variants.prepare(source, questions.values(), save)
+        if self.semantic is not None:
+            self.semantic.prepare(source, questions.values(), save)
+
+    def lookup(self, question, correct_answer, user_answer):
+        """원격 호출 없이 판정 (원격 채점이 필요하면 verdict=None)"""
+        with metrics.span('grade.local'):
+            return self.lookupLocal(question, correct_answer, user_answer)
+
+    def lookupLocal(self, question, correct_answer, user_answer):
+        result = self.gradeBlanks(question, correct_answer, user_answer)
+        if result is None:
+            result = self.local.gradeLocal(correct_answer, user_answer)
+        if result.verdict is not None:
+            return result
+        if self.cache is not None:
+            cached = self.cache.get(question, correct_answer, user_answer)
+            if cached is not None:
+                return self.local.record(cached, 'cache')
+        remote = self.remoteAvailable()
+        if self.semantic is not None:
+            verdict = self.semantic.judge(correct_answer, user_answer, decisive=not remote)
+            if verdict is not None:
+                return self.local.record(verdict, 'semantic')
+        if not remote:
+            return self.local.record(False, 'local')._replace(credit=result.credit)
+        return GradeResult(None, None)
+
+    def gradeBlanks(self, question, correct_answer, user_answer):
+        """빈칸 문제면 빈칸별로 채점한 GradeResult (모두 맞히면 정답, 아니면 verdict=None), 아니면 None
+
+        답안 전체를 비교하는 변형/유사도 단계는 빈칸 하나만 맞힌 답("A or B" 꼴 정답의 A)도
+        정답으로 볼 수 있으므로 빈칸 문제에는 적용하지 않는다.
+        """
+        blanks = self.blanks.judge(question, correct_answer, user_answer, self.local)
+        if blanks is None:
+            return None
+        credit = (blanks.correct, blanks.total)
+        if blanks.correct == blanks.total and not blanks.extra:
+            return self.local.record(True, 'blank')._replace(credit=credit)
+        tier = self.local.matchTier(correct_answer, user_answer)
+        if tier in ('exact', 'normalized'):
+            return self.local.record(True, tier)
+        return GradeResult(None, None, credit)
+
+    def speculate(self, question, correct_answer, user_answer):
+        """입력 중인 답안을 집계 없이 로컬 단계와 캐시로만 판정 (모르면 verdict=None)"""
+        blanks = self.blanks.judge(question, correct_answer, user_answer, self.local)
+        if blanks is None:
+            tier = self.local.matchTier(correct_answer, user_answer)
+            if tier is not None:
+                return GradeResult(True, tier)
+        elif blanks.correct == blanks.total and not blanks.extra:
+            return GradeResult(True, 'blank', (blanks.correct, blanks.total))
+        if self.cache is not None:
+            cached = self.cache.peek(question, correct_answer, user_answer)
+            if cached is not None:
+                return GradeResult(cached, 'cache')
+        if self.semantic is not None:
+            verdict = self.semantic.judge(correct_answer, user_answer)
+            if verdict is not None:
+                return GradeResult(verdict, 'semantic')
+        return GradeResult(None, None)
+
+    def prime(self, question, correct_answer, user_answer, verdict):
+        """미리 받아 둔 원격 판정을 캐시에만 저장 (제출 시 캐시 적중으로 집계됨)"""
+        if self.cache is not None:
+            self.cache.put(question, correct_answer, user_answer, verdict)
+
+    def remember(self, question, correct_answer, user_answer, verdict):
+        """원격 채점 결과를 캐시에 저장하고 집계"""
+        if self.cache is not None:
+            self.cache.put(question, correct_answer, user_answer, verdict)
+        return self.local.record(verdict, 'remote')
+
+    def grade(self, question, correct_answer, user_answer, timeout=None):
+        result = self.lookup(question, correct_answer, user_answer)
+        if result.verdict is not None:
+            return result
+        with metrics.span('grade.remote'):
+            verdict = self.remote(question, correct_answer, user_answer, timeout=timeout)
+        return self.remember(question, correct_answer, user_answer, verdict)
+
+    def gradeMany(self, items, engine=None):
+        """{item.id: GradeResult}를 반환, 원격 채점은 engine이 있으면 병렬로 수행"""
+        results = {}
+        pending = []
+        for item in items:
+            result = self.lookup(item.question, item.correct_answer, item.user_answer)
+            if result.verdict is None:
+                pending.append(item)
+            else:
+                results[item.id] = result
+
+        if engine is not None:
+            verdicts = engine.gradeMany(pending)
+        else:
+            verdicts = {}
+            for item in pending:
+                try:
+                    verdicts[item.id] = self.remote(item.question, item.correct_answer, item.user_answer)
+                except Exception:
+                    verdicts[item.id] = None
+
+        for item in pending:
+            verdict = verdicts.get(item.id)
+            if verdict is None and not self.remoteAvailable():
+                # 토큰 예산을 다 써서 요청하지 못한 답안은 로컬에서 결정
+                results[item.id] = self.lookup(item.question, item.correct_answer, item.user_answer)
+            elif verdict is None:
+                results[item.id] = GradeResult(None, 'error')
+            else:
+                results[item.id] = self.remember(item.question, item.correct_answer, item.user_answer, verdict)
+        return results
+
+    def stats(self):
+        stats = self.local.stats()
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        if self.meter is not None:
+            stats['usage'] = self.meter.stats()
+        return stats
+
+
+class QuizSession:
+    """문제 로딩, 출제, 채점, 점수 집계를 담당하는 GUI 독립적인 퀴즈 세션
+
+    scheduler를 주면 무작위 대신 복습 예정 시각 순으로 출제하고 채점 결과를
+    복습 상태에 반영한다 (.qbank는 무작위 출제). results(ResultStore)를 주면
+    모든 풀이를 기록한다. mode(basic/ai)는 진행 상황 저널을 앱별로 나누는 이름이다.
+    """
+    def __init__(self, grader=None, seed=DEFAULT_SEED, journal=True, scheduler=None, results=None, user=None,
+                 mode=''):
+        self.grader = grader or Grader()
+        self.mode = mode
+        self.scheduler = scheduler
+        self.results = results
+        self.user = user or (scheduler.user if scheduler is not None else defaultUser())
+        self.seed = seed
+        self.use_journal = journal
+        self.journal = None
+        self.source = ""
+        self.bank = QuestionBank()
+        self.questions = QuestionPool(seed=seed)
+        self.question = None
+        # 이어서 풀 때 중단 직전에 보던 문제 (다음 출제에서 먼저 냄)
+        self.resume_question = None
+        self.total_questions = 0
+        self.correct_count = 0
+        self.pending = []
+        self.answered = 0
+        self.started_at = time.monotonic()
+        # 스트리밍으로 문제를 읽는 중이면 True (풀이 비어도 아직 끝난 것이 아님)
+        self.loading = False
+
+    def open(self, source):
+        self.closeQuestions()
+        self.source = source
+        self.correct_count = 0
+        self.pending = []
+        self.question = None
+        self.resume_question = None
+        self.loading = False
+        self.answered = 0
+        self.started_at = time.monotonic()
+        if self.use_journal:
+            self.journal = ProgressJournal(ProgressJournal.pathFor(source, self.mode), source, self.mode)
+            self.journal.open()
+            self.correct_count = self.journal.correct_count
+
+    def load(self, source):
+        """문제 파일(또는 폴더/glob의 여러 파일)을 불러오고, 남아 있는 저널이 있으면 이어서 진행"""
+        with metrics.span('load_questions'):
+            return self.loadSource(source)
+
+    def loadSource(self, source):
+        self.open(source)
+
+        # .qbank는 mmap으로 열고 문제를 뽑을 때만 디코딩
+        if source.endswith('.qbank'):
+            self.bank = QuestionBank()
+            self.questions = CompiledQuestionPool(CompiledBank(source), seed=self.seed)
+            self.total_questions = len(self.questions)
+            if self.journal:
+                for question in self.journal.solved:
+                    if question in self.questions:
+                        self.questions.pop(question)
+            self.restoreCheckpoint()
+            return self.questions
+
+        self.bank = loadBank(expandSources(source))
+        questions = self.bank.answers
+        self.total_questions = len(questions)
+        if self.journal:
+            questions = self.journal.apply(questions)
+        self.questions = self.createPool(questions)
+        self.restoreCheckpoint()
+        return self.questions
+
+    def createPool(self, questions=None):
+        if self.scheduler is not None:
+            return ScheduledQuestionPool(questions, self.scheduler, seed=self.seed)
+        return QuestionPool(questions, seed=self.seed)
+
+    def beginStreaming(self, source):
+        """빈 풀로 세션을 시작하고, 문제는 addQuestions()로 도착하는 대로 추가"""
+        self.open(source)
+        self.bank = QuestionBank()
+        self.questions = self.createPool()
+        self.total_questions = 0
+        self.loading = True
+        self.restoreCheckpoint()
+
+    def restoreCheckpoint(self):
+        """저널에 남은 추첨 상태, 보던 문제, 채점을 미룬 답안을 복원
+
+        이후의 스냅샷에는 checkpointState()가 함께 저장된다.
+        """
+        if not self.journal:
+            return
+        state = self.journal.session_state
+        if state.get('rng'):
+            version, internal, gauss = state['rng']
+            self.questions.setState((version, tuple(internal), gauss))
+        self.resume_question = state.get('question')
+        for question, user_answer in self.journal.deferred.items():
+            if question in self.questions:
+                self.pending.append(JudgeItem(len(self.pending), question, self.questions.pop(question), user_answer))
+        self.journal.state = self.checkpointState
+
+    def checkpointState(self):
+        return {
+            'total': self.total_questions,
+            'question': self.question,
+            'rng': self.questions.getState(),
+        }
+
+    def addQuestions(self, pairs):
+        """스트리밍으로 읽은 (문제, 정답) 묶음을 추가하고 새로 추가된 {문제: 정답}을 반환"""
+        questions = {q: a for q, a in pairs if q not in self.bank.sources}
+        self.bank.add(self.source, questions)
+        self.total_questions = len(self.bank)
+        solved = self.journal.solved if self.journal else ()
+        deferred = self.journal.deferred if self.journal else {}
+        for question, answer in questions.items():
+            if question in deferred:
+                self.pending.append(JudgeItem(len(self.pending), question, answer, deferred[question]))
+            elif question not in solved:
+                self.questions.add(question, answer)
+        return questions
+
+    def finishStreaming(self):
+        self.loading = False
+
+    def loadStreaming(self, source, batch_size=5000, progress=None):
+        """GUI 없이 큰 JSON 파일을 스트리밍으로 모두 읽음"""
+        start = time.perf_counter()
+        self.beginStreaming(source)
+        batch = []
+        for pair in iterQuestions(source, progress=progress):
+            batch.append(pair)
+            if len(batch) >= batch_size:
+                self.addQuestions(batch)
+                batch = []
+        self.addQuestions(batch)
+        self.finishStreaming()
+        metrics.observe('load_questions', (time.perf_counter() - start) * 1000)
+        return self.questions
+
+    def nextQuestion(self):
+        """다음 문제를 뽑아 반환, 남은 문제가 없으면 None"""
+        with metrics.span('next_question'):
+            question, self.resume_question = self.resume_question, None
+            if question is None or question not in self.questions:
+                question = self.questions.draw(avoid=self.question) if len(self.questions) else None
+            self.question = question
+        return self.question
+
+    def lectureOf(self, question=None):
+        """문제가 나온 파일의 강의 태그 (예: L24)"""
+        source = self.bank.sources.get(question or self.question)
+        return source.lecture if source else ''
+
+    def correctAnswer(self, question=None):
+        return self.questions[question or self.question]
+
+    def grade(self, user_answer):
+        return self.grader.grade(self.question, self.correctAnswer(), user_answer)
+
+    def record(self, is_correct, question=None, answer='', tier=None, latency_ms=None):
+        """채점 결과를 반영 (맞힌 문제는 풀에서 제외)"""
+        with metrics.span('save_progress'):
+            self.saveResult(is_correct, question or self.question, answer, tier, latency_ms)
+
+    def saveResult(self, is_correct, question, answer, tier, latency_ms):
+        self.answered += 1
+        if self.results is not None:
+            self.results.record(self.user, question, self.lectureOf(question), answer, is_correct, tier, latency_ms)
+        if self.scheduler is not None:
+            self.scheduler.review(question, is_correct)
+            if isinstance(self.questions, ScheduledQuestionPool):
+                self.questions.reschedule(question)
+        if is_correct:
+            self.correct_count += 1
+            if question in self.questions:
+                self.questions.pop(question)
+        if self.journal:
+            self.journal.append(question, is_correct)
+
+    def defer(self, user_answer):
+        """시험 모드: 채점을 미루고 답안만 모아 둠"""
+        self.pending.append(JudgeItem(len(self.pending), self.question, self.correctAnswer(), user_answer))
+        self.questions.pop(self.question)
+        if self.journal:
+            self.journal.defer(self.question, user_answer)
+
+    def takePending(self):
+        pending, self.pending = self.pending, []
+        return pending
+
+    def requeue(self, items):
+        """채점하지 못한 답안을 다시 대기열에 넣음 (저널에도 미룬 답안으로 남아 이어 풀 때 다시 채점)"""
+        for item in items:
+            self.pending.append(item._replace(id=len(self.pending)))
+            if self.journal and self.journal.deferred.get(item.question) != item.user_answer:
+                self.journal.defer(item.question, item.user_answer)
+
+    def solvedCount(self):
+        return self.total_questions - len(self.questions)
+
+    def questionsPerMinute(self):
+        """이번 실행에서 채점한 답안 수를 경과 시간(분)으로 나눈 풀이 속도"""
+        minutes = (time.monotonic() - self.started_at) / 60
+        return self.answered / minutes if minutes > 0 else 0.0
+
+    def accuracy(self):
+        return (self.correct_count / self.total_questions) * 100 if self.total_questions > 0 else 0
+
+    def finished(self):
+        """모든 문제를 맞혔고 채점을 기다리는 답안도 없으면 True"""
+        return not self.loading and len(self.questions) == 0 and not self.pending
+
+    def close(self, keep_progress=None):
+        """세션을 닫음 (keep_progress가 None이면 끝나지 않은 세션만 이어서 풀 수 있도록 남김)"""
+        if self.results is not None:
+            self.results.flush()
+        if keep_progress is None:
+            keep_progress = not self.finished()
+        if self.journal:
+            if keep_progress:
+                self.journal.close()
+            else:
+                self.journal.delete()
+            self.journal = None
+        self.closeQuestions()
+
+    def closeQuestions(self):
+        """.qbank 문제 풀의 mmap과 파일을 닫음 (JSON 문제 풀은 할 일 없음)"""
+        if isinstance(self.questions, CompiledQuestionPool):
+            self.questions.close()
+
+
+def readAnswers(path):
+    """CSV(question,answer 열) 또는 JSONL({"question", "answer"}) 답안 파일을 읽음"""
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        if path.endswith('.csv'):
+            rows = list(csv.DictReader(file))
+        else:
+            rows = [json.loads(line) for line in file if line.strip()]
+    return [(row.get('id', index), row['question'], row['answer']) for index, row in enumerate(rows)]
+
+
+def createGrader(mode, use_cache=True, token_budget=None, backend=None, base_url=None):
+    if mode == 'exact':
+        return Grader(TieredGrader(tiers=('exact',)))
+    if mode == 'local':
+        return Grader(TieredGrader())
+    from semantic_grader import createSemanticGrader
+    if mode == 'semantic':
+        return Grader(TieredGrader(), semantic=createSemanticGrader() or createSemanticGrader('hashing'))
+    from verdict_cache import VerdictCache
+    from ai_judge import SESSION_TOKEN_BUDGET, UsageMeter
+    from grader_backends import createBackend
+    meter = UsageMeter(SESSION_TOKEN_BUDGET if token_budget is None else token_budget)
+    options = {}
+    if base_url:
+        # 주소만 주면 OpenAI 호환 서버로 채점
+        backend = backend or 'openai-compatible'
+        options['base_url'] = base_url
+    remote = createBackend(backend, meter=meter, **options)
+    return Grader(TieredGrader(), VerdictCache() if use_cache else None, remote if remote.remote else None,
+                  createSemanticGrader(), meter=meter)
+
+
+def gradeCommand(args):
+    bank = loadBank(expandSources(args.bank)).answers
+
+    items = []
+    unknown = []
+    for item_id, question, answer in readAnswers(args.answers):
+        if question in bank:
+            items.append(JudgeItem(item_id, question, bank[question], answer))
+        else:
+            unknown.append(item_id)
+
+    grader = createGrader(args.mode, use_cache=not args.no_cache, token_budget=args.token_budget,
+                          backend=args.backend, base_url=args.base_url)
+    grader.prepare(args.bank, bank, save=False)
+    engine = None
+    if args.mode == 'ai' and grader.remote is not None:
+        from grading_engine import GradingEngine
+        # 백엔드의 연결 풀로 요청해야 서버에 연결되지 않을 때 풀이 실패 상태가 되어 로컬 채점으로 넘어감
+        engine = GradingEngine(judge=grader.remote, max_workers=args.workers, rate=args.rate, meter=grader.meter)
+
+    start = time.perf_counter()
+    results = grader.gradeMany(items, engine)
+    elapsed = time.perf_counter() - start
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for item in items:
+            result = results[item.id]
+            output.write(json.dumps({
+                'id': item.id,
+                'question': item.question,
+                'answer': item.user_answer,
+                'correct_answer': item.correct_answer,
+                'verdict': result.verdict,
+                'tier': result.tier,
+                'credit': result.credit,
+            }, ensure_ascii=False) + '\n')
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    correct = sum(1 for result in results.values() if result.verdict)
+    summary = {
+        'answers': len(items),
+        'correct': correct,
+        'accuracy': correct / len(items) * 100 if items else 0,
+        'unknown_questions': len(unknown),
+        'elapsed_sec': elapsed,
+        'answers_per_sec': len(items) / elapsed if elapsed else 0.0,
+        'grader': grader.stats(),
+    }
+    if engine is not None:
+        summary['engine'] = engine.stats()
+    print(json.dumps(summary, ensure_ascii=False, indent=4), file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='GUI 없이 퀴즈 답안을 채점합니다')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    grade = commands.add_parser('grade', help='답안 파일(CSV/JSONL)을 문제 파일 기준으로 채점')
+    grade.add_argument('bank', help='문제 JSON 파일 ({"문제": "정답"}), 폴더 또는 glob 패턴')
+    grade.add_argument('answers', help='답안 파일 (.csv 또는 .jsonl, question/answer 필드)')
+    grade.add_argument('--mode', choices=('exact', 'local', 'semantic', 'ai'), default='local',
+                       help='exact: 정확 일치, local: 로컬 단계별 채점, semantic: 로컬 + 임베딩 유사도(오프라인), '
+                            'ai: 로컬 + 캐시 + 임베딩 유사도 + AI')
+    grade.add_argument('--output', help='결과 JSONL 경로 (기본: 표준 출력)')
+    grade.add_argument('--workers', type=int, default=8, help='AI 채점 동시 요청 수')
+    grade.add_argument('--rate', type=float, default=10.0, help='AI 채점 초당 요청 수')
+    grade.add_argument('--backend', help='AI 채점 백엔드 (openai, openai-compatible, local, stub, 기본: QUIZ_GRADER_BACKEND)')
+    grade.add_argument('--base-url', help='OpenAI 호환 API 주소 (주면 기본 백엔드는 openai-compatible)')
+    grade.add_argument('--no-cache', action='store_true', help='판정 캐시를 사용하지 않음')
+    grade.add_argument('--token-budget', type=int, help='AI 채점에 쓸 최대 토큰 수 (넘으면 로컬 채점, 기본: QUIZ_SESSION_TOKEN_BUDGET)')
+    grade.add_argument('--metrics', help='단계별 소요 시간 히스토그램 저장 경로 (.json 또는 .prom)')
+    grade.set_defaults(handler=gradeCommand)
+
+    args = parser.parse_args(argv)
+    if args.metrics:
+        metrics.enabled = True
+    args.handler(args)
+    if args.metrics:
+        metrics.export(args.metrics)
+
+
+if __name__ == '__main__':
+    main()
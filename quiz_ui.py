@@ -0,0 +1,710 @@
+import os
+import glob
+import time
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QMessageBox, QStackedWidget, QFileDialog,
+    QFrame, QProgressBar, QGraphicsDropShadowEffect, QComboBox
+)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont, QColor
+from question_bank import STREAMING_THRESHOLD
+from question_loader import StreamingLoader
+from progress_journal import listCheckpoints
+from metrics import exportMetrics, metrics
+
+# 결과 표시 후 다음 문제로 자동으로 넘어가기까지의 시간 (ms, 0이면 Enter를 누를 때까지 대기)
+AUTO_ADVANCE_MS = int(os.getenv("QUIZ_AUTO_ADVANCE_MS", "1200"))
+AUTO_ADVANCE_WRONG_MS = int(os.getenv("QUIZ_AUTO_ADVANCE_WRONG_MS", "0"))
+
+# 창 종류별 색상 (basic: 초록, ai: 남보라)
+THEMES = {
+    'basic': {
+        'background': ('#ecfdf5', '#f0fdf4', '#f0f9ff'),
+        'accent': ('#10b981', '#059669'),
+        'hover': ('#059669', '#047857'),
+        'pressed': ('#047857', '#065f46'),
+        'progress': '#10b981',
+        'score': '#059669',
+    },
+    'ai': {
+        'background': ('#f0f4ff', '#faf5ff', '#fff7ed'),
+        'accent': ('#6366f1', '#8b5cf6'),
+        'hover': ('#4f46e5', '#7c3aed'),
+        'pressed': ('#4338ca', '#6d28d9'),
+        'progress': '#6366f1',
+        'score': '#10b981',
+    },
+}
+
+# 테마와 무관한 공통 규칙 (퀴즈 창 안의 위젯에만 적용되도록 #quizWindow 아래로 한정)
+BASE_STYLE = """
+#quizWindow QLabel, #quizWindow QCheckBox, #quizWindow QStackedWidget {
+    background: transparent;
+}
+#quizWindow QFrame#card {
+    background-color: white;
+    border-radius: 20px;
+    border: none;
+}
+#quizWindow QLabel#title { color: #1e293b; }
+#quizWindow QLabel#subtitle, #quizWindow QLabel#sectionHeader { color: #64748b; }
+#quizWindow QLabel#guide, #quizWindow QCheckBox { color: #475569; }
+#quizWindow QLabel#hint { color: #94a3b8; }
+#quizWindow QLabel#question {
+    color: #1e293b;
+    background-color: #f8fafc;
+    border: none;
+    border-radius: 12px;
+    padding: 20px;
+}
+#quizWindow QLabel#feedback {
+    border-radius: 12px;
+    padding: 14px 20px;
+}
+#quizWindow QLabel#feedback[correct="true"] {
+    color: #047857;
+    background-color: #ecfdf5;
+}
+#quizWindow QLabel#feedback[correct="false"] {
+    color: #b91c1c;
+    background-color: #fef2f2;
+}
+#quizWindow QPushButton[primary="false"] {
+    background-color: #f1f5f9;
+    color: #475569;
+    border: 2px solid #e2e8f0;
+    border-radius: 12px;
+    padding: 12px 24px;
+    font-weight: 500;
+}
+#quizWindow QPushButton[primary="false"]:hover {
+    background-color: #e2e8f0;
+    border-color: #cbd5e1;
+}
+#quizWindow QPushButton[primary="false"]:pressed {
+    background-color: #cbd5e1;
+}
+#quizWindow QLineEdit {
+    background-color: #f8fafc;
+    border: 2px solid #e2e8f0;
+    border-radius: 14px;
+    padding: 14px 20px;
+    color: #1e293b;
+}
+#quizWindow QLineEdit:focus {
+    background-color: white;
+}
+#quizWindow QComboBox {
+    background-color: #f8fafc;
+    border: 2px solid #e2e8f0;
+    border-radius: 12px;
+    padding: 10px 16px;
+    color: #1e293b;
+}
+#quizWindow QProgressBar {
+    background-color: #e2e8f0;
+    border-radius: 4px;
+}
+#quizWindow QMessageBox {
+    background-color: white;
+}
+#quizWindow QMessageBox QLabel {
+    color: #1e293b;
+    font-size: 14px;
+}
+"""
+
+THEME_STYLE = """
+#quizWindow[theme="{name}"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 {background[0]}, stop:0.5 {background[1]}, stop:1 {background[2]});
+}}
+#quizWindow[theme="{name}"] QLabel#indicator {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 {accent[0]}, stop:1 {accent[1]});
+    border-radius: 32px;
+}}
+#quizWindow[theme="{name}"] QLabel#progress {{ color: {progress}; }}
+#quizWindow[theme="{name}"] QLabel#score {{ color: {score}; }}
+#quizWindow[theme="{name}"] QPushButton[primary="true"] {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 {accent[0]}, stop:1 {accent[1]});
+    color: white;
+    border: none;
+    border-radius: 12px;
+    padding: 12px 24px;
+    font-weight: 600;
+}}
+#quizWindow[theme="{name}"] QPushButton[primary="true"]:hover {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 {hover[0]}, stop:1 {hover[1]});
+}}
+#quizWindow[theme="{name}"] QPushButton[primary="true"]:pressed {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 {pressed[0]}, stop:1 {pressed[1]});
+}}
+#quizWindow[theme="{name}"] QPushButton[primary="true"]:disabled {{
+    background: #94a3b8;
+}}
+#quizWindow[theme="{name}"] QLineEdit {{
+    selection-background-color: {accent[0]};
+}}
+#quizWindow[theme="{name}"] QLineEdit:focus {{
+    border-color: {accent[0]};
+}}
+#quizWindow[theme="{name}"] QProgressBar::chunk {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 {accent[0]}, stop:1 {accent[1]});
+    border-radius: 4px;
+}}
+#quizWindow[theme="{name}"] QMessageBox QPushButton {{
+    background-color: {accent[0]};
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 8px 20px;
+    min-width: 80px;
+}}
+#quizWindow[theme="{name}"] QMessageBox QPushButton:hover {{
+    background-color: {hover[0]};
+}}
+"""
+
+# 모든 테마를 담은 스타일시트 (모듈을 불러올 때 한 번만 만듦)
+STYLE_SHEET = BASE_STYLE + ''.join(THEME_STYLE.format(name=name, **theme) for name, theme in THEMES.items())
+
+
+def installStyleSheet(app=None):
+    """퀴즈 창 스타일시트를 애플리케이션에 한 번만 추가
+
+    위젯마다 setStyleSheet를 호출하면 창을 만들 때마다 문자열을 다시 해석하므로,
+    애플리케이션 전체에 한 번 넣고 위젯은 objectName/속성으로만 구분한다.
+    """
+    app = app or QApplication.instance()
+    if app is None or app.property('quizStyleInstalled'):
+        return
+    app.setStyleSheet(app.styleSheet() + STYLE_SHEET)
+    app.setProperty('quizStyleInstalled', True)
+
+
+def createCard():
+    card = QFrame()
+    card.setObjectName('card')
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(30)
+    shadow.setXOffset(0)
+    shadow.setYOffset(10)
+    shadow.setColor(QColor(0, 0, 0, 25))
+    card.setGraphicsEffect(shadow)
+    return card
+
+
+def createLabel(text, name, size, weight=QFont.Normal):
+    label = QLabel(text)
+    label.setObjectName(name)
+    label.setFont(QFont('Pretendard', size, weight))
+    return label
+
+
+class ModernButton(QPushButton):
+    """모던한 스타일의 버튼"""
+    def __init__(self, text, primary=True, parent=None):
+        super().__init__(text, parent)
+        self.setProperty('primary', primary)
+        self.setFont(QFont('Pretendard', 12, QFont.Medium))
+        self.setCursor(Qt.PointingHandCursor)
+        self.setMinimumHeight(48)
+
+
+class ModernLineEdit(QLineEdit):
+    """모던한 스타일의 입력 필드"""
+    def __init__(self, placeholder="", parent=None):
+        super().__init__(parent)
+        self.setPlaceholderText(placeholder)
+        self.setFont(QFont('Pretendard', 14))
+        self.setMinimumHeight(56)
+
+
+class QuizWindow(QWidget):
+    """Basic/AI 퀴즈 창이 함께 쓰는 화면과 진행 흐름
+
+    파일 선택, 스트리밍 로딩, 출제, 결과 표시, 완료 대화상자는 여기서 처리하고,
+    채점 방식은 submitAnswer를 재정의해 바꾼다 (기본은 session.grade로 바로 채점).
+    """
+    theme = 'basic'
+    title = '📖 Quiz App'
+    window_title = '📖 Quiz App'
+    subtitle = ''
+    hint = ''
+
+    def __init__(self, session):
+        super().__init__()
+        installStyleSheet()
+        self.session = session
+        self.loader = None
+        # 결과 표시 후 자동으로 다음 문제로 넘어가는 타이머
+        self.advance_timer = QTimer(self)
+        self.advance_timer.setSingleShot(True)
+        self.advance_timer.timeout.connect(self.nextQuestion)
+        self.initUI()
+
+    def initUI(self):
+        self.setObjectName('quizWindow')
+        self.setProperty('theme', self.theme)
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setWindowTitle(self.window_title)
+        self.setGeometry(100, 100, 650, 550)
+        self.setMinimumSize(600, 500)
+
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(30, 30, 30, 30)
+        main_layout.setSpacing(20)
+
+        # Header
+        header_label = createLabel(self.title, 'title', 28, QFont.Bold)
+        header_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(header_label)
+
+        subtitle = createLabel(self.subtitle, 'subtitle', 12)
+        subtitle.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(subtitle)
+
+        main_layout.addSpacing(10)
+
+        self.stack = QStackedWidget()
+        main_layout.addWidget(self.stack)
+
+        # Welcome Page
+        self.welcome_page = self.createWelcomePage()
+        self.stack.addWidget(self.welcome_page)
+
+        # Quiz Page
+        self.quiz_page = QuizPage(self)
+        self.stack.addWidget(self.quiz_page)
+
+        self.setLayout(main_layout)
+
+    def createWelcomePage(self):
+        page = createCard()
+
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(40, 50, 40, 50)
+        layout.setSpacing(25)
+
+        # 색상 원형 인디케이터
+        indicator = QLabel()
+        indicator.setObjectName('indicator')
+        indicator.setFixedSize(64, 64)
+
+        indicator_container = QHBoxLayout()
+        indicator_container.addStretch()
+        indicator_container.addWidget(indicator)
+        indicator_container.addStretch()
+        layout.addLayout(indicator_container)
+
+        guide_label = createLabel('퀴즈를 시작하려면\nJSON 파일을 선택하세요', 'guide', 16)
+        guide_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(guide_label)
+
+        layout.addSpacing(20)
+
+        self.addWelcomeOptions(layout)
+
+        self.select_button = ModernButton('📁 JSON 파일 선택', primary=True)
+        self.select_button.clicked.connect(self.selectJSONFile)
+        layout.addWidget(self.select_button)
+
+        # 폴더 안의 모든 JSON 파일을 합쳐서 복습
+        self.select_folder_button = ModernButton('📂 폴더 전체 선택', primary=False)
+        self.select_folder_button.clicked.connect(self.selectFolder)
+        layout.addWidget(self.select_folder_button)
+
+        # 끝내지 못한 세션 이어서 풀기
+        resume_layout = QHBoxLayout()
+        resume_layout.setSpacing(12)
+        self.checkpoint_combo = QComboBox()
+        self.checkpoint_combo.setFont(QFont('Pretendard', 11))
+        resume_layout.addWidget(self.checkpoint_combo, 2)
+        self.resume_button = ModernButton('⏯ 이어서 풀기', primary=False)
+        self.resume_button.clicked.connect(self.resumeSession)
+        resume_layout.addWidget(self.resume_button, 1)
+        layout.addLayout(resume_layout)
+        self.refreshCheckpoints()
+
+        hint_label = createLabel(self.hint, 'hint', 11)
+        hint_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(hint_label)
+
+        layout.addStretch()
+        return page
+
+    def addWelcomeOptions(self, layout):
+        """파일 선택 버튼 위에 창별 옵션을 추가"""
+
+    def refreshCheckpoints(self):
+        """저장된 진행 상황 목록을 다시 읽음 (없으면 이어서 풀기를 숨김)"""
+        self.checkpoint_combo.clear()
+        for checkpoint in listCheckpoints(self.session.mode):
+            name = os.path.basename(os.path.normpath(checkpoint.source))
+            solved = f'{checkpoint.solved}/{checkpoint.total}' if checkpoint.total else f'{checkpoint.solved}'
+            saved = time.strftime('%m-%d %H:%M', time.localtime(checkpoint.updated_at))
+            self.checkpoint_combo.addItem(f'{name} · {solved}문제 완료 · {saved}', checkpoint.source)
+        has_checkpoints = self.checkpoint_combo.count() > 0
+        self.checkpoint_combo.setVisible(has_checkpoints)
+        self.resume_button.setVisible(has_checkpoints)
+
+    def resumeSession(self):
+        source = self.checkpoint_combo.currentData()
+        if not source:
+            return
+        if not glob.glob(source):
+            QMessageBox.warning(self, '오류', f'문제 파일을 찾을 수 없습니다:\n{source}')
+            return
+        self.startSession(source)
+
+    def selectJSONFile(self):
+        options = QFileDialog.Options()
+        file_name, _ = QFileDialog.getOpenFileName(
+            self, "JSON 파일 선택", "", "Question Files (*.json *.qbank)", options=options
+        )
+        if file_name:
+            self.startSession(file_name)
+
+    def selectFolder(self):
+        folder = QFileDialog.getExistingDirectory(self, "문제 폴더 선택")
+        if folder:
+            self.startSession(folder)
+
+    def startSession(self, source):
+        self.source = source
+        # 큰 JSON 파일은 스트리밍으로 읽으며 첫 묶음이 도착하는 즉시 시작
+        if source.endswith('.json') and os.path.isfile(source) and os.path.getsize(source) > STREAMING_THRESHOLD:
+            self.startStreaming(source)
+            return
+        # 이전 세션의 저널이 남아 있으면 이어서 진행
+        self.session.load(source)
+        if not self.checkBank():
+            return
+        # load()가 돌려주는 출제 풀이 아니라 불러온 {문제: 정답} 전체를 넘김 (스트리밍과 같은 형식)
+        self.onQuestionsAdded(self.session.bank.answers)
+        self.showQuizPage()
+
+    def checkBank(self):
+        """읽지 못한 파일과 중복 문제를 알리고, 풀 문제가 하나도 없으면 세션을 닫고 False"""
+        problems = self.session.bank.problems()
+        if self.session.total_questions == 0:
+            # 이전에 풀던 기록이 있으면 파일을 고친 뒤 이어서 풀 수 있도록 남김
+            journal = self.session.journal
+            self.session.close(keep_progress=journal is not None and not journal.empty())
+            self.stack.setCurrentWidget(self.welcome_page)
+            self.refreshCheckpoints()
+            QMessageBox.critical(self, '오류', '\n'.join(['불러온 문제가 없습니다.'] + problems))
+            return False
+        if problems:
+            QMessageBox.warning(self, '문제 파일 경고', '\n'.join(problems))
+        return True
+
+    def onQuestionsAdded(self, questions):
+        """새로 읽은 {문제: 정답}을 받는 확장 지점 (기본: 채점용 색인 준비)"""
+        # 전체를 디코딩해야 하는 .qbank에서는 생략 (채점할 때 필요한 정답만 계산)
+        if self.source.endswith('.qbank'):
+            return
+        # 스트리밍 중에는 일부만 읽었으므로 색인 파일을 저장하지 않음
+        self.session.grader.prepare(self.source, questions, save=not self.session.loading)
+
+    def startStreaming(self, source):
+        self.loading_started = time.perf_counter()
+        self.session.beginStreaming(source)
+        self.stack.setCurrentWidget(self.quiz_page)
+        self.quiz_page.resetStats(0)
+        self.quiz_page.setLoadingProgress(0)
+        self.quiz_page.updateQuestion('문제를 불러오는 중...')
+
+        loader = StreamingLoader(source, parent=self)
+        loader.batchLoaded.connect(self.onQuestionsLoaded)
+        loader.progress.connect(self.onLoadingProgress)
+        loader.failed.connect(self.onLoadingFailed)
+        loader.finished.connect(self.onLoadingFinished)
+        loader.finished.connect(loader.deleteLater)
+        self.loader = loader
+        loader.start()
+
+    def onQuestionsLoaded(self, batch):
+        self.onQuestionsAdded(self.session.addQuestions(batch))
+        # 문제가 없어 기다리던 중이면 바로 출제
+        if self.session.question is None:
+            self.nextQuestion()
+        else:
+            self.updateProgressLabel()
+
+    def onLoadingProgress(self, percent):
+        self.quiz_page.setLoadingProgress(percent)
+        self.updateProgressLabel()
+
+    def onLoadingFailed(self, error):
+        # 읽기가 끝나면 checkBank()에서 함께 알림 (읽은 문제가 없으면 시작하지 않음)
+        self.session.bank.errors[self.source] = error
+
+    def onLoadingFinished(self):
+        metrics.observe('load_questions', (time.perf_counter() - self.loading_started) * 1000)
+        self.loader = None
+        self.session.finishStreaming()
+        self.quiz_page.setLoadingProgress(None)
+        if not self.checkBank():
+            return
+        if self.session.question is None:
+            self.nextQuestion()
+        else:
+            self.updateProgressLabel()
+
+    def stopLoading(self):
+        if self.loader is not None:
+            self.loader.requestInterruption()
+            self.loader.wait()
+            self.loader = None
+
+    def nextQuestion(self):
+        self.advance_timer.stop()
+        self.quiz_page.hideFeedback()
+        # 남은 문제가 없으면 채점을 미뤄 둔 답안(시험 모드)을 채점하고 끝냄
+        if len(self.session.questions) == 0 and self.session.pending and not self.session.loading:
+            self.gradePendingAnswers()
+            return
+        question = self.session.nextQuestion()
+        if question is None:
+            if self.session.loading:
+                self.quiz_page.updateQuestion('문제를 불러오는 중...')
+                return
+            self.showCompletionDialog(self.session.accuracy())
+        else:
+            self.quiz_page.updateQuestion(question, self.session.lectureOf(question))
+            self.quiz_page.answer_input.clear()
+            self.quiz_page.answer_input.setFocus()
+            self.updateProgressLabel()
+
+    def gradePendingAnswers(self):
+        grader = self.session.grader
+        for item in self.session.takePending():
+            result = grader.grade(item.question, item.correct_answer, item.user_answer)
+            self.session.record(result.verdict, item.question, item.user_answer, result.tier)
+        self.updateProgressLabel()
+        self.showCompletionDialog(self.session.accuracy())
+
+    def showCompletionDialog(self, accuracy, note=''):
+        msg = QMessageBox(self)
+        msg.setWindowTitle('퀴즈 완료!')
+
+        if accuracy >= 90:
+            grade = '최고예요!'
+        elif accuracy >= 70:
+            grade = '잘했어요!'
+        elif accuracy >= 50:
+            grade = '괜찮아요!'
+        else:
+            grade = '더 공부해봐요!'
+
+        msg.setText(f'{grade}\n\n정답률: {accuracy:.1f}%\n맞은 문제: {self.session.correct_count}/{self.session.total_questions}\n풀이 속도: 분당 {self.session.questionsPerMinute():.1f}문제{note}')
+        msg.setIcon(QMessageBox.Information)
+        msg.exec_()
+        self.close()
+
+    def checkAnswer(self):
+        # 결과를 보고 있을 때 Enter(또는 버튼)는 다음 문제로
+        if self.quiz_page.showing_feedback:
+            self.nextQuestion()
+            return
+        if self.session.question is None:
+            return
+        user_answer = self.quiz_page.answer_input.text().strip()
+        if not user_answer:
+            return
+        self.check_started = time.perf_counter()
+        self.submitAnswer(user_answer)
+
+    def submitAnswer(self, user_answer):
+        """답안을 채점하고 applyVerdict로 결과를 반영 (비동기 채점이면 나중에 호출해도 됨)"""
+        start = time.perf_counter()
+        result = self.session.grade(user_answer)
+        self.applyVerdict(result.verdict, user_answer, result.tier, (time.perf_counter() - start) * 1000,
+                          result.credit)
+
+    def onAnswerEdited(self):
+        """답안 입력이 바뀔 때마다 호출 (입력 중 미리 채점하는 창에서 재정의)"""
+
+    def applyVerdict(self, is_correct, user_answer='', tier=None, latency_ms=None, credit=None):
+        correct_answer = self.session.correctAnswer()
+        self.session.record(is_correct, answer=user_answer, tier=tier, latency_ms=latency_ms)
+        self.showFeedback(is_correct, correct_answer, credit)
+        # 제출부터 결과 표시까지 (AI 응답 대기 포함)
+        metrics.observe('check_answer', (time.perf_counter() - self.check_started) * 1000)
+
+    def showFeedback(self, is_correct, correct_answer, credit=None):
+        """결과를 문제 화면 안에 표시하고, 정답이면 잠시 후 자동으로 다음 문제로 넘어감"""
+        self.quiz_page.showFeedback(is_correct, correct_answer, credit)
+        self.updateProgressLabel()
+        delay = AUTO_ADVANCE_MS if is_correct else AUTO_ADVANCE_WRONG_MS
+        if delay > 0:
+            self.advance_timer.start(delay)
+
+    def showQuizPage(self):
+        self.stack.setCurrentWidget(self.quiz_page)
+        self.quiz_page.resetStats(self.session.total_questions)
+        self.nextQuestion()
+
+    def updateProgressLabel(self):
+        session = self.session
+        self.quiz_page.updateProgress(session.solvedCount(), session.total_questions, session.correct_count)
+
+    def closeEvent(self, event):
+        self.advance_timer.stop()
+        self.stopLoading()
+        self.session.close()
+        exportMetrics()
+        event.accept()
+
+
+class QuizPage(QWidget):
+    def __init__(self, parent):
+        super().__init__()
+        self.parent = parent
+        # 스트리밍으로 문제를 읽는 동안의 진행률 (읽는 중이 아니면 None)
+        self.loading_percent = None
+        self.showing_feedback = False
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(15)
+
+        # 카드 컨테이너
+        card = createCard()
+
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(35, 30, 35, 30)
+        card_layout.setSpacing(20)
+
+        # 상단 진행 상태
+        progress_layout = QHBoxLayout()
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.progress_label = createLabel('진행: 0/0', 'progress', 11, QFont.Medium)
+        progress_layout.addWidget(self.progress_label)
+
+        progress_layout.addStretch()
+
+        self.score_label = createLabel('정답: 0개', 'score', 11, QFont.Medium)
+        progress_layout.addWidget(self.score_label)
+
+        card_layout.addLayout(progress_layout)
+
+        # 진행률 바
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setMaximumHeight(8)
+        card_layout.addWidget(self.progress_bar)
+
+        card_layout.addSpacing(10)
+
+        # 문제 라벨
+        self.question_header = createLabel('📝 문제', 'sectionHeader', 12, QFont.Medium)
+        card_layout.addWidget(self.question_header)
+
+        self.question_label = createLabel('', 'question', 16, QFont.Medium)
+        self.question_label.setWordWrap(True)
+        self.question_label.setMinimumHeight(100)
+        self.question_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        card_layout.addWidget(self.question_label)
+
+        card_layout.addSpacing(5)
+
+        # 답변 입력
+        answer_header = createLabel('✏️ 정답 입력', 'sectionHeader', 12, QFont.Medium)
+        card_layout.addWidget(answer_header)
+
+        self.answer_input = ModernLineEdit('정답을 입력하세요...')
+        self.answer_input.returnPressed.connect(self.parent.checkAnswer)
+        self.answer_input.textChanged.connect(self.parent.onAnswerEdited)
+        card_layout.addWidget(self.answer_input)
+
+        # 채점 결과 (대화상자 대신 문제 화면 안에 표시)
+        self.feedback_label = createLabel('', 'feedback', 13, QFont.Medium)
+        self.feedback_label.setWordWrap(True)
+        self.feedback_label.setVisible(False)
+        card_layout.addWidget(self.feedback_label)
+
+        card_layout.addSpacing(10)
+
+        # 버튼 영역
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(12)
+
+        self.skip_button = ModernButton('건너뛰기', primary=False)
+        self.skip_button.clicked.connect(self.skipQuestion)
+        button_layout.addWidget(self.skip_button)
+
+        self.submit_button = ModernButton('제출하기', primary=True)
+        self.submit_button.clicked.connect(self.parent.checkAnswer)
+        button_layout.addWidget(self.submit_button, 2)
+
+        card_layout.addLayout(button_layout)
+
+        layout.addWidget(card)
+        self.setLayout(layout)
+
+    def updateQuestion(self, question, lecture=''):
+        self.question_header.setText(f'📝 문제 · {lecture}' if lecture else '📝 문제')
+        self.question_label.setText(question)
+
+    def updateProgress(self, solved, total, correct):
+        loading = f' · 불러오는 중 {self.loading_percent}%' if self.loading_percent is not None else ''
+        self.progress_label.setText(f'진행: {solved}/{total}{loading}')
+        self.score_label.setText(f'정답: {correct}개')
+        if self.loading_percent is not None:
+            self.progress_bar.setValue(self.loading_percent)
+        elif total > 0:
+            self.progress_bar.setValue(int((solved / total) * 100))
+
+    def setLoadingProgress(self, percent):
+        self.loading_percent = percent
+
+    def resetStats(self, total):
+        self.progress_bar.setValue(0)
+        self.progress_label.setText(f'진행: 0/{total}')
+        self.score_label.setText('정답: 0개')
+
+    def setGrading(self, grading, text='채점 중...'):
+        self.submit_button.setEnabled(not grading)
+        self.skip_button.setEnabled(not grading)
+        self.answer_input.setReadOnly(grading)
+        self.submit_button.setText(text if grading else '제출하기')
+
+    def showFeedback(self, is_correct, correct_answer, credit=None):
+        self.showing_feedback = True
+        if is_correct:
+            text = f'✅ 정답입니다!  정답: {correct_answer}'
+        else:
+            text = f'❌ 틀렸습니다.  정답: {correct_answer}'
+            # 빈칸 문제는 몇 개를 맞혔는지 함께 표시
+            if credit is not None:
+                text += f'  (빈칸 {credit[1]}개 중 {credit[0]}개 정답)'
+        self.feedback_label.setText(f'{text}\n⏎ Enter로 다음 문제')
+        # 색상은 스타일시트의 [correct=...] 규칙으로 바뀌므로 속성만 바꾸고 다시 적용
+        self.feedback_label.setProperty('correct', bool(is_correct))
+        self.feedback_label.style().unpolish(self.feedback_label)
+        self.feedback_label.style().polish(self.feedback_label)
+        self.feedback_label.setVisible(True)
+        self.answer_input.setReadOnly(True)
+        self.submit_button.setText('다음 문제 ▶')
+
+    def hideFeedback(self):
+        if not self.showing_feedback:
+            return
+        self.showing_feedback = False
+        self.feedback_label.setVisible(False)
+        self.answer_input.setReadOnly(False)
+        self.submit_button.setText('제출하기')
+
+    def skipQuestion(self):
+        self.parent.nextQuestion()
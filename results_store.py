@@ -0,0 +1,242 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+from collections import namedtuple
+
+from scheduler import defaultUser
+
+
+DEFAULT_RESULTS_PATH = os.getenv(
+    "QUIZ_RESULTS_DB",
+    os.path.join(os.path.expanduser("~"), ".quiz_app", "results.db"),
+)
+
+# 답안 1건의 채점 기록 (latency_ms: 채점에 걸린 시간, 일괄 채점이면 None)
+Attempt = namedtuple('Attempt', ['user', 'question', 'lecture', 'answer', 'verdict', 'tier', 'latency_ms', 'created_at'])
+
+
+def questionId(question):
+    return hashlib.sha1(question.encode('utf-8')).hexdigest()[:16]
+
+
+class ResultStore:
+    """모든 풀이 기록을 남기는 SQLite 저장소
+
+    기록은 batch_size개씩 모아 한 트랜잭션으로 넣고, 같은 트랜잭션에서
+    문제별/사용자·날짜별 집계 테이블을 갱신해 두어 분석 질의가 원본
+    기록 전체를 훑지 않도록 한다.
+    """
+    def __init__(self, path=DEFAULT_RESULTS_PATH, batch_size=20):
+        self.path = path
+        self.batch_size = batch_size
+        self.buffer = []
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS questions (
+                question_id TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                lecture TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS attempts (
+                id INTEGER PRIMARY KEY,
+                user TEXT NOT NULL,
+                question_id TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                verdict INTEGER,
+                tier TEXT,
+                latency_ms REAL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_attempts_user_time ON attempts(user, created_at);
+            CREATE INDEX IF NOT EXISTS idx_attempts_question ON attempts(question_id);
+            CREATE TABLE IF NOT EXISTS question_stats (
+                question_id TEXT PRIMARY KEY,
+                lecture TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                correct INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_question_stats_lecture ON question_stats(lecture);
+            CREATE TABLE IF NOT EXISTS user_daily (
+                user TEXT NOT NULL,
+                day TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                correct INTEGER NOT NULL,
+                PRIMARY KEY (user, day)
+            );
+        """)
+        self.conn.commit()
+
+    def record(self, user, question, lecture, answer, verdict, tier=None, latency_ms=None, created_at=None):
+        self.buffer.append(Attempt(
+            user, question, lecture or '', answer, verdict, tier, latency_ms,
+            created_at if created_at is not None else time.time()
+        ))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """모아 둔 기록을 한 트랜잭션으로 저장하고 집계 테이블을 갱신"""
+        if not self.buffer:
+            return
+        attempts, self.buffer = self.buffer, []
+        questions = {}
+        question_stats = {}
+        user_daily = {}
+        rows = []
+        for attempt in attempts:
+            qid = questionId(attempt.question)
+            questions[qid] = (qid, attempt.question, attempt.lecture)
+            correct = 1 if attempt.verdict else 0
+            rows.append((
+                attempt.user, qid, attempt.answer,
+                None if attempt.verdict is None else correct,
+                attempt.tier, attempt.latency_ms, attempt.created_at
+            ))
+            # 채점하지 못한 답안은 집계에서 제외
+            if attempt.verdict is None:
+                continue
+            stats = question_stats.setdefault(qid, [attempt.lecture, 0, 0])
+            stats[1] += 1
+            stats[2] += correct
+            day = time.strftime('%Y-%m-%d', time.localtime(attempt.created_at))
+            daily = user_daily.setdefault((attempt.user, day), [0, 0])
+            daily[0] += 1
+            daily[1] += correct
+
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO questions VALUES (?, ?, ?)", questions.values())
+            self.conn.executemany(
+                "INSERT INTO attempts (user, question_id, answer, verdict, tier, latency_ms, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self.conn.executemany("""
+                INSERT INTO question_stats VALUES (?, ?, ?, ?)
+                ON CONFLICT(question_id) DO UPDATE SET
+                    attempts = attempts + excluded.attempts, correct = correct + excluded.correct
+            """, [(qid, *stats) for qid, stats in question_stats.items()])
+            self.conn.executemany("""
+                INSERT INTO user_daily VALUES (?, ?, ?, ?)
+                ON CONFLICT(user, day) DO UPDATE SET
+                    attempts = attempts + excluded.attempts, correct = correct + excluded.correct
+            """, [(user, day, *counts) for (user, day), counts in user_daily.items()])
+
+    def rebuildAggregates(self):
+        """원본 기록으로부터 집계 테이블을 다시 계산"""
+        self.flush()
+        with self.conn:
+            self.conn.execute("DELETE FROM question_stats")
+            self.conn.execute("""
+                INSERT INTO question_stats
+                SELECT a.question_id, q.lecture, COUNT(*), SUM(a.verdict)
+                FROM attempts a JOIN questions q ON q.question_id = a.question_id
+                WHERE a.verdict IS NOT NULL
+                GROUP BY a.question_id
+            """)
+            self.conn.execute("DELETE FROM user_daily")
+            self.conn.execute("""
+                INSERT INTO user_daily
+                SELECT user, date(created_at, 'unixepoch', 'localtime'), COUNT(*), SUM(verdict)
+                FROM attempts WHERE verdict IS NOT NULL
+                GROUP BY 1, 2
+            """)
+
+    def hardestQuestions(self, lecture=None, limit=10, min_attempts=3):
+        """정답률이 낮은 문제 [(문제, 강의, 시도 수, 정답률)]"""
+        self.flush()
+        where = "s.attempts >= ?"
+        params = [min_attempts]
+        if lecture:
+            where += " AND s.lecture = ?"
+            params.append(lecture)
+        rows = self.conn.execute(f"""
+            SELECT q.question, s.lecture, s.attempts, CAST(s.correct AS REAL) / s.attempts AS accuracy
+            FROM question_stats s JOIN questions q ON q.question_id = s.question_id
+            WHERE {where}
+            ORDER BY accuracy, s.attempts DESC
+            LIMIT ?
+        """, (*params, limit))
+        return rows.fetchall()
+
+    def userProgress(self, user, since=None):
+        """날짜별 정답률 [(날짜, 시도 수, 정답 수, 정답률)]"""
+        self.flush()
+        rows = self.conn.execute("""
+            SELECT day, attempts, correct, CAST(correct AS REAL) / attempts
+            FROM user_daily WHERE user = ? AND day >= ?
+            ORDER BY day
+        """, (user, since or ''))
+        return rows.fetchall()
+
+    def labelledAttempts(self, tiers=('remote', 'cache')):
+        """AI가 채점한 답안 [(문제, 답안, 판정)] (로컬 채점 기준 보정용)"""
+        self.flush()
+        marks = ', '.join('?' * len(tiers))
+        rows = self.conn.execute(f"""
+            SELECT q.question, a.answer, a.verdict
+            FROM attempts a JOIN questions q ON q.question_id = a.question_id
+            WHERE a.verdict IS NOT NULL AND a.tier IN ({marks})
+        """, tiers)
+        return rows.fetchall()
+
+    def userAccuracy(self):
+        """사용자별 전체 정답률 [(사용자, 시도 수, 정답률)]"""
+        self.flush()
+        rows = self.conn.execute("""
+            SELECT user, SUM(attempts), CAST(SUM(correct) AS REAL) / SUM(attempts)
+            FROM user_daily GROUP BY user ORDER BY user
+        """)
+        return rows.fetchall()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='풀이 기록을 분석합니다')
+    parser.add_argument('--db', default=DEFAULT_RESULTS_PATH, help='풀이 기록 DB 경로')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    hardest = commands.add_parser('hardest', help='정답률이 낮은 문제')
+    hardest.add_argument('--lecture', help='강의 태그 (예: L24)')
+    hardest.add_argument('--limit', type=int, default=10)
+    hardest.add_argument('--min-attempts', type=int, default=3)
+
+    progress = commands.add_parser('progress', help='사용자의 날짜별 정답률')
+    progress.add_argument('--user', default=defaultUser())
+    progress.add_argument('--since', help='시작 날짜 (YYYY-MM-DD)')
+
+    commands.add_parser('users', help='사용자별 정답률')
+    commands.add_parser('rebuild', help='집계 테이블 다시 계산')
+
+    args = parser.parse_args(argv)
+    store = ResultStore(args.db)
+    try:
+        if args.command == 'hardest':
+            rows = store.hardestQuestions(args.lecture, args.limit, args.min_attempts)
+            keys = ('question', 'lecture', 'attempts', 'accuracy')
+        elif args.command == 'progress':
+            rows = store.userProgress(args.user, args.since)
+            keys = ('day', 'attempts', 'correct', 'accuracy')
+        elif args.command == 'users':
+            rows = store.userAccuracy()
+            keys = ('user', 'attempts', 'accuracy')
+        else:
+            store.rebuildAggregates()
+            return
+        for row in rows:
+            print(json.dumps(dict(zip(keys, row)), ensure_ascii=False))
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+import os
+import time
+import heapq
+import getpass
+import sqlite3
+from collections import namedtuple
+
+from question_pool import DEFAULT_SEED, QuestionPool
+
+
+DEFAULT_SCHEDULE_PATH = os.getenv(
+    "QUIZ_SCHEDULE_DB",
+    os.path.join(os.path.expanduser("~"), ".quiz_app", "schedule.db"),
+)
+
+# 출제 순서 정책: sm2, leitner, random(기존처럼 무작위)
+DEFAULT_POLICY = os.getenv("QUIZ_SCHEDULER", "sm2")
+
+DAY = 24 * 3600
+
+# ease: 난이도 계수, interval: 다음 복습까지 간격(일), repetitions: 연속 정답 횟수,
+# lapses: 누적 오답 횟수, due: 다음 복습 시각 (epoch 초, 0이면 처음 보는 문제)
+CardState = namedtuple('CardState', ['ease', 'interval', 'repetitions', 'lapses', 'due'])
+
+
+def defaultUser():
+    return os.getenv("QUIZ_USER") or getpass.getuser()
+
+
+class SM2Policy:
+    """SuperMemo-2 방식: 맞히면 간격을 ease배씩 늘리고, 틀리면 처음부터 다시 학습
+
+    정답/오답만 있으므로 품질 점수는 correct_quality/wrong_quality로 고정한다.
+    틀린 문제는 relearn_delay초 뒤로 미뤄 같은 세션 안에서 다시 나오게 한다.
+    """
+    def __init__(self, initial_ease=2.5, min_ease=1.3, first_interval=1, second_interval=6,
+                 correct_quality=4, wrong_quality=1, relearn_delay=60):
+        self.initial_ease = initial_ease
+        self.min_ease = min_ease
+        self.first_interval = first_interval
+        self.second_interval = second_interval
+        self.correct_quality = correct_quality
+        self.wrong_quality = wrong_quality
+        self.relearn_delay = relearn_delay
+
+    def newCard(self):
+        return CardState(self.initial_ease, 0, 0, 0, 0.0)
+
+    def review(self, state, is_correct, now):
+        quality = self.correct_quality if is_correct else self.wrong_quality
+        ease = max(self.min_ease, state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        if not is_correct:
+            return CardState(ease, 0, 0, state.lapses + 1, now + self.relearn_delay)
+        if state.repetitions == 0:
+            interval = self.first_interval
+        elif state.repetitions == 1:
+            interval = self.second_interval
+        else:
+            interval = state.interval * ease
+        return CardState(ease, interval, state.repetitions + 1, state.lapses, now + interval * DAY)
+
+
+class LeitnerPolicy:
+    """라이트너 상자: 맞히면 다음 상자로, 틀리면 첫 상자로 (상자마다 복습 간격이 고정)"""
+    def __init__(self, intervals=(1, 2, 4, 8, 16, 32), relearn_delay=60):
+        self.intervals = intervals
+        self.relearn_delay = relearn_delay
+
+    def newCard(self):
+        return CardState(1.0, 0, 0, 0, 0.0)
+
+    def review(self, state, is_correct, now):
+        if not is_correct:
+            return CardState(state.ease, 0, 0, state.lapses + 1, now + self.relearn_delay)
+        box = min(state.repetitions, len(self.intervals) - 1)
+        interval = self.intervals[box]
+        return CardState(state.ease, interval, state.repetitions + 1, state.lapses, now + interval * DAY)
+
+
+POLICIES = {
+    'sm2': SM2Policy,
+    'leitner': LeitnerPolicy,
+}
+
+
+class ScheduleStore:
+    """사용자별 문제 복습 상태를 저장하는 SQLite 저장소"""
+    def __init__(self, path=DEFAULT_SCHEDULE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS cards (
+                user TEXT NOT NULL,
+                question TEXT NOT NULL,
+                ease REAL NOT NULL,
+                interval REAL NOT NULL,
+                repetitions INTEGER NOT NULL,
+                lapses INTEGER NOT NULL,
+                due REAL NOT NULL,
+                reviewed_at REAL NOT NULL,
+                PRIMARY KEY (user, question)
+            )
+        """)
+        self.conn.commit()
+
+    def load(self, user):
+        """{문제: CardState} (해당 사용자의 전체 상태를 한 번에 읽음)"""
+        rows = self.conn.execute(
+            "SELECT question, ease, interval, repetitions, lapses, due FROM cards WHERE user = ?", (user,)
+        )
+        return {row[0]: CardState(*row[1:]) for row in rows}
+
+    def save(self, user, question, state, now):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (user, question, *state, now)
+        )
+        self.conn.commit()
+
+    def reset(self, user):
+        self.conn.execute("DELETE FROM cards WHERE user = ?", (user,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class Scheduler:
+    """정책에 따라 복습 상태를 갱신하고 저장소에 기록"""
+    def __init__(self, policy=None, store=None, user=None, clock=time.time):
+        self.policy = policy or SM2Policy()
+        self.store = store
+        self.user = user or defaultUser()
+        self.clock = clock
+        self.states = store.load(self.user) if store is not None else {}
+
+    def state(self, question):
+        state = self.states.get(question)
+        return state if state is not None else self.policy.newCard()
+
+    def review(self, question, is_correct):
+        now = self.clock()
+        state = self.policy.review(self.state(question), is_correct, now)
+        self.states[question] = state
+        if self.store is not None:
+            self.store.save(self.user, question, state, now)
+        return state
+
+    def dueCount(self, questions):
+        now = self.clock()
+        return sum(1 for question in questions if self.state(question).due <= now)
+
+    def close(self):
+        if self.store is not None:
+            self.store.close()
+
+
+class ScheduledQuestionPool(QuestionPool):
+    """복습 예정 시각이 가장 이른 문제부터 출제하는 QuestionPool
+
+    (예정 시각, 무작위 순번, 문제)를 힙에 넣어 O(log n)에 다음 문제를 고른다.
+    상태가 바뀌거나 풀에서 빠진 문제의 옛 항목은 지우지 않고, 꺼낼 때
+    current와 다르면 버린다. 처음 보는 문제끼리는 무작위 순번으로 섞인다.
+    """
+    def __init__(self, questions=None, scheduler=None, seed=DEFAULT_SEED):
+        self.scheduler = scheduler or Scheduler()
+        self.heap = []
+        self.current = {}
+        super().__init__(questions, seed=seed)
+
+    def add(self, question, answer):
+        if question not in self.index:
+            self.push(question)
+        super().add(question, answer)
+
+    def pop(self, question):
+        self.current.pop(question, None)
+        return super().pop(question)
+
+    def reschedule(self, question):
+        """복습 상태가 바뀐 문제를 새 예정 시각으로 다시 넣음"""
+        if question in self.index:
+            self.push(question)
+
+    def push(self, question):
+        entry = (self.scheduler.state(question).due, self.rng.random(), question)
+        self.current[question] = entry
+        heapq.heappush(self.heap, entry)
+        # 버려진 항목이 너무 많이 쌓이면 힙을 다시 만듦
+        if len(self.heap) > 2 * len(self.current) + 64:
+            self.heap = list(self.current.values())
+            heapq.heapify(self.heap)
+
+    def top(self):
+        while self.heap and self.current.get(self.heap[0][2]) is not self.heap[0]:
+            heapq.heappop(self.heap)
+        if not self.heap:
+            raise IndexError('빈 문제 풀에서 추첨할 수 없습니다')
+        return self.heap[0]
+
+    def draw(self, avoid=None):
+        entry = self.top()
+        if entry[2] != avoid or len(self.keys) == 1:
+            return entry[2]
+        # 방금 낸 문제가 또 맨 앞이면 그다음 문제를 냄
+        heapq.heappop(self.heap)
+        try:
+            return self.top()[2]
+        finally:
+            heapq.heappush(self.heap, entry)
+
+
+def createScheduler(policy=DEFAULT_POLICY, path=DEFAULT_SCHEDULE_PATH, user=None):
+    """설정된 정책의 Scheduler (random이면 None → 기존 무작위 출제)"""
+    if not policy or policy == 'random':
+        return None
+    if policy not in POLICIES:
+        raise ValueError(f'알 수 없는 출제 정책: {policy} (사용 가능: random, {", ".join(POLICIES)})')
+    return Scheduler(POLICIES[policy](), ScheduleStore(path), user)
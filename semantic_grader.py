@@ -0,0 +1,369 @@
+import os
+import re
+import sys
+import json
+import time
+import zlib
+import argparse
+
+from grading import normalizeText
+from question_bank import expandSources, loadBank
+
+try:
+    import numpy as np
+except ImportError:
+    # 모델 임베더는 semantic extra(uv sync --extra semantic)를 설치해야 사용 가능
+    np = None
+
+
+# 임베더 종류: off(기본), st:<모델 이름>(sentence-transformers, 권장), hashing(의존성 없음)
+# st:는 정답 임베딩을 .qemb로 미리 계산해 두고 채점할 때 답안만 CPU에서 임베딩한다
+# hashing은 증가/감소처럼 글자가 비슷한 반대말과 순서를 바꾼 답을 구분하지 못하므로
+# 모델을 설치할 수 없을 때 풀이 기록으로 기준을 보정(calibrate)한 뒤에만 켠다
+DEFAULT_EMBEDDER = os.getenv("QUIZ_SEMANTIC_GRADER", "off")
+DEFAULT_MODEL = 'paraphrase-multilingual-MiniLM-L12-v2'
+
+# 코사인 유사도가 accept 이상이면 정답, reject 이하면 오답, 그 사이는 AI 채점으로 넘김
+# 기본값은 hashing 임베더 기준: 번역어/동의어는 유사도가 0에 가까우므로 오답 단정은 끔
+# (모델 임베더는 semantic_grader.py calibrate로 풀이 기록에서 기준을 구해 설정)
+ACCEPT_THRESHOLD = float(os.getenv("QUIZ_SEMANTIC_ACCEPT", "0.88"))
+REJECT_THRESHOLD = float(os.getenv("QUIZ_SEMANTIC_REJECT", "-1"))
+# AI 채점을 쓸 수 없을 때(오프라인) 판단 보류 구간을 나누는 기준
+OFFLINE_THRESHOLD = float(os.getenv("QUIZ_SEMANTIC_OFFLINE", "0.7"))
+
+_DIGITS = re.compile(r'\d+')
+_NEGATIONS = re.compile(r'\b(?:not|no|never|without|non)\b|않|없|아니|못')
+
+# 문제 파일 옆에 저장하는 정답 임베딩 파일 확장자
+INDEX_EXTENSION = '.qemb'
+
+
+def indexPathFor(path):
+    return os.path.splitext(path)[0] + INDEX_EXTENSION
+
+
+class HashingEmbedder:
+    """단어와 문자 n-gram을 고정 차원으로 해시한 벡터 (모델 없이 CPU에서 바로 동작)
+
+    의미를 이해하지는 못하지만 조사/어미, 띄어쓰기, 어순, 일부 철자 차이에
+    강하다. 계산이 가벼워 정답 벡터도 미리 만들거나 저장하지 않고, 채점할 때
+    희소 벡터({차원: 값})끼리 바로 내적한다.
+    """
+    sparse = True
+
+    def __init__(self, dim=1024, ngrams=(2, 3)):
+        self.dim = dim
+        self.ngrams = ngrams
+        self.name = f'hashing-{dim}-{"".join(map(str, ngrams))}'
+
+    def weights(self, text):
+        """{차원: 값} 형태의 L2 정규화된 희소 벡터"""
+        counts = {}
+        for word in normalizeText(text).split():
+            bucket = zlib.crc32(('w:' + word).encode('utf-8')) % self.dim
+            counts[bucket] = counts.get(bucket, 0.0) + 1.0
+            padded = f' {word} '
+            for n in self.ngrams:
+                for i in range(len(padded) - n + 1):
+                    bucket = zlib.crc32(padded[i:i + n].encode('utf-8')) % self.dim
+                    counts[bucket] = counts.get(bucket, 0.0) + 0.5
+        norm = sum(value * value for value in counts.values()) ** 0.5 or 1.0
+        return {bucket: value / norm for bucket, value in counts.items()}
+
+    def similarity(self, a, b):
+        """두 문장의 코사인 유사도 (희소 벡터의 내적)"""
+        a, b = self.weights(a), self.weights(b)
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(value * b.get(bucket, 0.0) for bucket, value in a.items())
+
+
+class SentenceTransformerEmbedder:
+    """sentence-transformers의 작은 다국어 모델 (semantic extra 설치 필요)"""
+    sparse = False
+
+    def __init__(self, model=DEFAULT_MODEL):
+        try:
+            if np is None:
+                raise ImportError('numpy')
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise RuntimeError(f'{model} 임베더에는 numpy와 sentence-transformers가 필요합니다 '
+                               f'(uv sync --extra semantic): {e}') from e
+        self.model = SentenceTransformer(model, device='cpu')
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f'st:{model}'
+
+    def encode(self, texts):
+        return self.model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).astype('float32')
+
+
+def rowDots(users, corrects):
+    """두 행렬의 같은 행끼리 내적 (정규화된 벡터이므로 코사인 유사도)"""
+    return np.einsum('ij,ij->i', users, corrects).tolist()
+
+
+class AnswerIndex:
+    """정규화한 정답 문장 → 임베딩 벡터
+
+    같은 정답은 한 번만 계산하고, 문제 파일 옆의 .qemb 파일로 저장/로드한다.
+    .qemb는 JSON 헤더 한 줄 + float32 행렬(행 순서는 헤더의 answers 순서)이다.
+    밀집 벡터 임베더(st:) 전용이며 numpy로 계산한다.
+    """
+    def __init__(self, embedder):
+        self.embedder = embedder
+        # 정답 → (블록 번호, 블록 안의 행), 블록은 한 번에 계산하거나 읽은 행렬
+        self.rows = {}
+        self.blocks = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, answer):
+        return normalizeText(answer) in self.rows
+
+    def add(self, answers):
+        """아직 없는 정답을 한 번에 임베딩 (새로 추가된 수를 반환)"""
+        missing = list(dict.fromkeys(key for key in map(normalizeText, answers) if key not in self.rows))
+        if missing:
+            self.append(missing, self.embedder.encode(missing))
+        return len(missing)
+
+    def append(self, keys, vectors):
+        block = len(self.blocks)
+        for offset, key in enumerate(keys):
+            self.rows[key] = (block, offset)
+        self.blocks.append(vectors)
+
+    def vectors(self, answers):
+        """정답 목록에 해당하는 행렬 (없는 정답은 먼저 계산)"""
+        self.add(answers)
+        rows = [self.blocks[block][offset] for block, offset in (self.rows[normalizeText(a)] for a in answers)]
+        return np.stack(rows) if rows else np.zeros((0, self.embedder.dim), 'float32')
+
+    def save(self, path, answers=None):
+        """answers(기본: 전체)의 벡터를 path에 저장"""
+        keys = list(self.rows) if answers is None else list(dict.fromkeys(normalizeText(a) for a in answers))
+        matrix = self.vectors(keys)
+        header = {'embedder': self.embedder.name, 'dim': self.embedder.dim, 'answers': keys}
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n')
+            file.write(np.ascontiguousarray(matrix, dtype='float32').tobytes())
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        """path의 벡터를 추가 (다른 임베더로 만든 파일이면 False)"""
+        with open(path, 'rb') as file:
+            header = json.loads(file.readline())
+            if header['embedder'] != self.embedder.name:
+                return False
+            data = file.read()
+        dim = header['dim']
+        keys = header['answers']
+        vectors = np.frombuffer(data, dtype='float32').reshape(len(keys), dim)
+        new = [(n, key) for n, key in enumerate(keys) if key not in self.rows]
+        if new:
+            self.append([key for _, key in new], vectors[[n for n, _ in new]])
+        return True
+
+
+class SemanticGrader:
+    """정답과 답안 임베딩의 코사인 유사도로 정답/오답/판단 보류를 결정하는 로컬 채점기"""
+    def __init__(self, embedder=None, accept=ACCEPT_THRESHOLD, reject=REJECT_THRESHOLD, offline=OFFLINE_THRESHOLD):
+        self.embedder = embedder or HashingEmbedder()
+        self.accept = accept
+        self.reject = reject
+        self.offline = offline
+        self.index = AnswerIndex(self.embedder)
+        self.prepared = set()
+
+    def prepare(self, source, answers=(), save=True):
+        """문제 파일 옆의 .qemb를 읽고, 없는 정답은 계산해 둠
+
+        새로 계산한 정답은 save이고 단일 JSON 파일일 때만 저장한다
+        (폴더나 스트리밍으로 나눠 읽는 파일은 build 명령으로).
+        .qbank처럼 정답 목록이 없으면 채점할 때 필요한 정답만 계산한다.
+        희소 벡터 임베더(hashing)는 채점할 때 계산하므로 아무것도 하지 않는다.
+        """
+        if self.embedder.sparse:
+            return
+        for path in expandSources(source):
+            if path in self.prepared or not path.endswith('.json'):
+                continue
+            self.prepared.add(path)
+            index_path = indexPathFor(path)
+            if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(path):
+                self.index.load(index_path)
+        if self.index.add(answers) and save and os.path.isfile(source) and source.endswith('.json'):
+            try:
+                self.index.save(indexPathFor(source), answers)
+            except OSError:
+                pass
+
+    def scoreMany(self, pairs):
+        """[(정답, 답안)]의 코사인 유사도 목록 (답안은 한 번에 임베딩)"""
+        if not pairs:
+            return []
+        if self.embedder.sparse:
+            return [self.embedder.similarity(user, correct) for correct, user in pairs]
+        corrects = self.index.vectors([correct for correct, _ in pairs])
+        users = self.embedder.encode([user for _, user in pairs])
+        return rowDots(users, corrects)
+
+    def score(self, correct_answer, user_answer):
+        return self.scoreMany([(correct_answer, user_answer)])[0]
+
+    def decide(self, score, decisive=False):
+        """True(정답) / False(오답) / None(AI 채점으로 넘김)
+
+        decisive면 판단 보류 구간도 offline 기준으로 결정한다 (AI 채점을 쓸 수 없을 때).
+        """
+        if score >= self.accept:
+            return True
+        if score <= self.reject:
+            return False
+        if decisive:
+            return score >= self.offline
+        return None
+
+    def judge(self, correct_answer, user_answer, decisive=False):
+        correct = normalizeText(correct_answer)
+        user = normalizeText(user_answer)
+        if not user:
+            return False
+        # 숫자나 부정어가 다르면 벡터가 가까워도 뜻이 반대일 수 있으므로 AI에 맡김
+        if (_DIGITS.findall(correct) != _DIGITS.findall(user)
+                or bool(_NEGATIONS.search(correct)) != bool(_NEGATIONS.search(user))):
+            return False if decisive else None
+        return self.decide(self.score(correct_answer, user_answer), decisive)
+
+
+def createEmbedder(name=DEFAULT_EMBEDDER):
+    if name.startswith('st:'):
+        return SentenceTransformerEmbedder(name[3:])
+    if name == 'hashing':
+        return HashingEmbedder()
+    raise ValueError(f'알 수 없는 임베더: {name} (사용 가능: hashing, st:<모델>, off)')
+
+
+def createSemanticGrader(name=DEFAULT_EMBEDDER):
+    """설정된 임베더의 SemanticGrader (off면 None)"""
+    if not name or name == 'off':
+        return None
+    return SemanticGrader(createEmbedder(name))
+
+
+def calibrate(scored, precision=0.97):
+    """[(유사도, 판정)]에서 정답/오답 각각 precision 이상을 유지하는 가장 넓은 기준
+
+    accept는 그 이상에서 정답 비율이 precision 이상인 가장 낮은 값,
+    reject는 그 이하에서 오답 비율이 precision 이상인 가장 높은 값이다.
+    """
+    scored = sorted(scored)
+    accept = reject = None
+    correct = wrong = 0
+    for score, verdict in reversed(scored):
+        correct += 1 if verdict else 0
+        wrong += 0 if verdict else 1
+        if correct / (correct + wrong) >= precision:
+            accept = score
+    correct = wrong = 0
+    for score, verdict in scored:
+        correct += 1 if verdict else 0
+        wrong += 0 if verdict else 1
+        if wrong / (correct + wrong) >= precision:
+            reject = score
+    if accept is not None and reject is not None and reject >= accept:
+        reject = None
+    return accept, reject
+
+
+def coverage(scored, accept, reject):
+    """기준을 적용했을 때 로컬에서 결정되는 비율과 그중 AI 판정과 일치하는 비율"""
+    decided = agreed = 0
+    for score, verdict in scored:
+        if accept is not None and score >= accept:
+            decided += 1
+            agreed += 1 if verdict else 0
+        elif reject is not None and score <= reject:
+            decided += 1
+            agreed += 0 if verdict else 1
+    return {
+        'samples': len(scored),
+        'decided_rate': decided / len(scored) if scored else 0.0,
+        'agreement': agreed / decided if decided else 0.0,
+    }
+
+
+def buildCommand(args, grader):
+    if grader.embedder.sparse:
+        print(f'{grader.embedder.name} 임베더는 채점할 때 바로 계산하므로 .qemb가 필요 없습니다', file=sys.stderr)
+        sys.exit(1)
+    for path in expandSources(args.source):
+        if not path.endswith('.json'):
+            continue
+        answers = loadBank([path]).answers.values()
+        start = time.perf_counter()
+        grader.index.add(answers)
+        grader.index.save(indexPathFor(path), answers)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f'{indexPathFor(path)}: 정답 {len(set(answers))}개, {elapsed:.0f} ms')
+
+
+def calibrateCommand(args, grader):
+    from results_store import ResultStore
+    bank = loadBank(expandSources(args.source)).answers
+    store = ResultStore(args.db)
+    try:
+        attempts = store.labelledAttempts()
+    finally:
+        store.close()
+    pairs = []
+    verdicts = []
+    for question, answer, verdict in attempts:
+        if question in bank:
+            pairs.append((bank[question], answer))
+            verdicts.append(bool(verdict))
+    if not pairs:
+        print('AI가 채점한 풀이 기록이 없습니다', file=sys.stderr)
+        return
+    start = time.perf_counter()
+    scores = grader.scoreMany(pairs)
+    elapsed = time.perf_counter() - start
+    scored = list(zip(scores, verdicts))
+    accept, reject = calibrate(scored, args.precision)
+    print(json.dumps({
+        'QUIZ_SEMANTIC_ACCEPT': accept,
+        'QUIZ_SEMANTIC_REJECT': reject,
+        'embedder': grader.embedder.name,
+        'per_answer_ms': elapsed * 1000 / len(pairs),
+        'current': coverage(scored, grader.accept, grader.reject),
+        'calibrated': coverage(scored, accept, reject),
+    }, ensure_ascii=False, indent=4))
+
+
+def main(argv=None):
+    from results_store import DEFAULT_RESULTS_PATH
+
+    parser = argparse.ArgumentParser(description='정답 임베딩을 미리 계산하고 채점 기준을 보정합니다')
+    parser.add_argument('--embedder', default=DEFAULT_EMBEDDER if DEFAULT_EMBEDDER != 'off' else f'st:{DEFAULT_MODEL}',
+                        help='st:<sentence-transformers 모델> 또는 hashing')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='문제 파일마다 정답 임베딩(.qemb)을 저장')
+    build.add_argument('source', help='문제 JSON 파일, 폴더 또는 glob 패턴')
+    build.set_defaults(handler=buildCommand)
+
+    calibration = commands.add_parser('calibrate', help='AI가 채점한 풀이 기록으로 accept/reject 기준 계산')
+    calibration.add_argument('source', help='문제 JSON 파일, 폴더 또는 glob 패턴')
+    calibration.add_argument('--db', default=DEFAULT_RESULTS_PATH, help='풀이 기록 DB 경로')
+    calibration.add_argument('--precision', type=float, default=0.97, help='기준 이상/이하에서 유지할 정확도')
+    calibration.set_defaults(handler=calibrateCommand)
+
+    args = parser.parse_args(argv)
+    args.handler(args, SemanticGrader(createEmbedder(args.embedder)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+import os
+import sys
+import tempfile
+
+# 저장소 최상위의 모듈(quiz_core, grading 등)을 바로 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 풀이 기록, 복습 일정, 판정 캐시, 저널을 사용자 홈 대신 임시 폴더에 둠 (모듈을 불러오기 전에 설정)
+_state = tempfile.mkdtemp(prefix='quiz_app_tests_')
+os.environ.setdefault('QUIZ_RESULTS_DB', os.path.join(_state, 'results.db'))
+os.environ.setdefault('QUIZ_SCHEDULE_DB', os.path.join(_state, 'schedule.db'))
+os.environ.setdefault('QUIZ_VERDICT_CACHE', os.path.join(_state, 'verdict_cache.db'))
+os.environ.setdefault('QUIZ_CHECKPOINT_DIR', os.path.join(_state, 'checkpoints'))
+# GUI 테스트는 화면 없이 실행
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
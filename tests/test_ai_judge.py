@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('dotenv')
+
+from ai_judge import JudgeReplyError, judgeAnswer
+from grading import TieredGrader
+from quiz_core import Grader
+from verdict_cache import VerdictCache
+
+
+class FakeClient:
+    """chat.completions.create가 정해진 응답을 돌려주는 클라이언트"""
+    def __init__(self, content):
+        self.chat = SimpleNamespace(completions=self)
+        self.content = content
+
+    def create(self, **request):
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+@pytest.mark.parametrize('content, verdict', [
+    ('Y', True), (' y', True), ('"Y"', True), ('Yes', True),
+    ('N', False), ('N.', False), (' no', False),
+])
+def test_judge_answer_parses_verdict(content, verdict):
+    assert judgeAnswer('Q', 'A', 'B', client=FakeClient(content)) is verdict
+
+
+@pytest.mark.parametrize('content', ['', None, 'Maybe', 'I', '{"v":"Y"}'])
+def test_judge_answer_rejects_unparseable_reply(content):
+    with pytest.raises(JudgeReplyError):
+        judgeAnswer('Q', 'A', 'B', client=FakeClient(content))
+
+
+def test_unparseable_reply_is_not_cached():
+    cache = VerdictCache(':memory:')
+    remote = lambda question, correct, user, timeout=None: judgeAnswer(question, correct, user,
+                                                                       client=FakeClient('Sorry'))
+    grader = Grader(TieredGrader(), cache, remote)
+    with pytest.raises(JudgeReplyError):
+        grader.grade('Capital of France?', 'Paris', 'the city of light')
+    assert cache.get('Capital of France?', 'Paris', 'the city of light') is None
@@ -0,0 +1,35 @@
+from grading import TieredGrader
+from quiz_core import Grader
+
+TRIPLE = ('A knowledge graph stores (____, ____, ____) triples', 'Head, Relation, Tail')
+FACTORS = ('The two factors are ____ and ____.', 'Speed and Accuracy')
+
+
+def test_comma_tuple_keeps_order():
+    grader = Grader(TieredGrader())
+    assert grader.lookup(*TRIPLE, 'head, relation, tail').verdict is True
+    result = grader.lookup(*TRIPLE, 'Tail, Relation, Head')
+    assert result.verdict is not True
+    assert result.credit == (1, 3)
+
+
+def test_and_connector_is_unordered():
+    grader = Grader(TieredGrader())
+    assert grader.lookup(*FACTORS, 'accuracy, speed').verdict is True
+
+
+def test_blanks_use_only_the_mode_tiers():
+    exact = Grader(TieredGrader(tiers=('exact',)))
+    assert exact.lookup(*FACTORS, 'Speed, Accuracy').verdict is True
+    result = exact.lookup(*FACTORS, 'speed, accuracy')
+    assert result.verdict is False
+    assert result.credit == (0, 2)
+    assert exact.lookup(*FACTORS, 'The two factors are Speed and Accuracy').verdict is True
+
+
+def test_patterns_compile_on_first_use(tmp_path):
+    grader = Grader(TieredGrader())
+    grader.prepare(str(tmp_path / 'L01.json'), dict([TRIPLE, FACTORS]), save=False)
+    assert len(grader.blanks) == 0
+    grader.lookup(*TRIPLE, 'Head, Relation, Tail')
+    assert len(grader.blanks) == 1
@@ -0,0 +1,120 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('openai')
+
+from grader_backends import CompatibleBackend
+
+
+class RejectingHandler(BaseHTTPRequestHandler):
+    """모든 요청을 401로 거부하는 서버 (잘못된 API 키)"""
+    def do_GET(self):
+        self.reject()
+
+    def do_POST(self):
+        self.reject()
+
+    def reject(self):
+        body = b'{"error": {"message": "Incorrect API key provided", "type": "invalid_request_error"}}'
+        self.send_response(401)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def rejecting_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RejectingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/v1'
+    server.shutdown()
+    server.server_close()
+
+
+def test_unreachable_server_falls_back_to_local():
+    backend = CompatibleBackend(base_url='http://127.0.0.1:9/v1')
+    status = backend.healthCheck(timeout=1.0)
+    assert not status.ok
+    assert not status.reachable
+    assert not backend.available()
+
+
+def test_auth_error_is_not_hidden_by_local_fallback(rejecting_url):
+    backend = CompatibleBackend(base_url=rejecting_url, api_key='wrong')
+    status = backend.healthCheck(timeout=2.0)
+    assert not status.ok
+    assert status.reachable
+    assert 'AuthenticationError' in status.detail
+    assert backend.available()
+    with pytest.raises(Exception) as error:
+        backend('Q', 'A', 'A', timeout=2.0)
+    assert type(error.value).__name__ == 'AuthenticationError'
+    assert backend.available()
+
+
+def test_backends_use_separate_settings(monkeypatch):
+    import importlib
+    import ai_judge
+    import grader_backends
+    monkeypatch.setenv('QUIZ_OPENAI_MODEL', 'gpt-test')
+    monkeypatch.setenv('QUIZ_OPENAI_MAX_CONNECTIONS', '5')
+    monkeypatch.setenv('QUIZ_COMPATIBLE_MODEL', 'llama-test')
+    monkeypatch.setenv('QUIZ_COMPATIBLE_MAX_CONNECTIONS', '1')
+    try:
+        importlib.reload(ai_judge)
+        backends = importlib.reload(grader_backends)
+        openai_backend = backends.createBackend('openai', api_key='key')
+        compatible = backends.createBackend('openai-compatible')
+        assert (openai_backend.model, openai_backend.pool.max_connections) == ('gpt-test', 5)
+        assert (compatible.model, compatible.pool.max_connections) == ('llama-test', 1)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(ai_judge)
+        importlib.reload(grader_backends)
+
+
+def test_backend_requires_call():
+    from grader_backends import Backend
+    with pytest.raises(TypeError):
+        Backend()
+
+
+def test_compatible_backend_against_fake_server():
+    from benchmarks.fake_openai_server import startServer
+    from grading import JudgeItem
+    server, base_url = startServer(latency=0.0, model='fake-judge')
+    try:
+        backend = CompatibleBackend(model='fake-judge', base_url=base_url)
+        status = backend.healthCheck(timeout=2.0)
+        assert status.ok and status.detail == 'fake-judge'
+        assert backend('Q', 'Paris', 'paris') is True
+        items = [JudgeItem(7, 'Q1', 'Paris', 'paris'), JudgeItem(9, 'Q2', 'Seoul', 'Tokyo')]
+        assert backend.batch(items) == {7: True, 9: False}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_grade_command_falls_back_to_local_when_server_is_down(tmp_path):
+    import json
+    from quiz_core import main
+    bank = tmp_path / 'L01.json'
+    bank.write_text(json.dumps({'Capital of France?': 'Paris', 'Largest planet?': 'Jupiter'}), encoding='utf-8')
+    answers = tmp_path / 'answers.jsonl'
+    answers.write_text('\n'.join(json.dumps({'question': question, 'answer': answer}) for question, answer in [
+        ('Capital of France?', 'the city of Paris'),
+        ('Largest planet?', 'gas giant Jupiter'),
+        ('Largest planet?', 'Jupiter'),
+    ]), encoding='utf-8')
+    output = tmp_path / 'results.jsonl'
+    main(['grade', str(bank), str(answers), '--mode', 'ai', '--no-cache', '--workers', '1',
+          '--base-url', 'http://127.0.0.1:1/v1', '--output', str(output)])
+    tiers = [json.loads(line)['tier'] for line in output.read_text(encoding='utf-8').splitlines()]
+    assert tiers == ['local', 'local', 'exact']
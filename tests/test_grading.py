@@ -0,0 +1,76 @@
+import pytest
+
+from grading import TieredGrader, normalizeText
+from quiz_core import Grader
+
+
+@pytest.mark.parametrize('correct, user', [
+    ('Externalization', 'Internalization'),
+    ('unsupervised', 'supervised'),
+    ('Implicit', 'Explicit'),
+    ('categorical', 'non-categorical'),
+    ('categorical, non-categorical', 'non-categorical, categorical'),
+    ('increase batch size', 'decrease batch size'),
+])
+def test_similarity_rejects_opposites(correct, user):
+    grader = TieredGrader()
+    assert not grader.isSimilar(normalizeText(correct), normalizeText(user))
+    assert grader.matchTier(correct, user) != 'similarity'
+
+
+@pytest.mark.parametrize('correct, user', [
+    ('accommodation', 'accomodation'),
+    ('machine learning', 'machinelearning'),
+    ('Tokenization', 'Tokenisation'),
+])
+def test_similarity_accepts_typos(correct, user):
+    assert TieredGrader().matchTier(correct, user) == 'similarity'
+
+
+def test_blank_similarity_does_not_fill_opposite_blank():
+    grader = Grader(TieredGrader())
+    result = grader.lookup('Knowledge conversion: ____ and ____',
+                           'Externalization and Internalization', 'Internalization and Internalization')
+    assert result.verdict is not True
+    assert result.credit == (1, 2)
+
+
+def test_variant_tier_only_applies_to_compound_answers():
+    basic = TieredGrader(tiers=('exact', 'variant'))
+    assert basic.matchTier('16x16', '16X16') is None
+    assert basic.matchTier('TCP/IP', 'TCP') is None
+    assert basic.matchTier('TCP/IP', 'TCP/IP') == 'exact'
+    assert basic.matchTier('TCP or UDP', 'udp') == 'variant'
+    assert basic.matchTier('speed and accuracy', 'Accuracy & Speed') == 'variant'
+
+
+def test_stale_variant_files_are_ignored(tmp_path):
+    from grading import VariantIndex
+    path = str(tmp_path / 'L01.qvar')
+    (tmp_path / 'L01.qvar').write_text('{"TCP/IP": ["ip", "tcp", "ip|tcp"]}', encoding='utf-8')
+    index = VariantIndex()
+    assert index.load(path) is False
+    assert not index.match('TCP/IP', 'TCP')
+
+    index.save(path, ['TCP or UDP'])
+    reloaded = VariantIndex()
+    assert reloaded.load(path) is True
+    assert reloaded.match('TCP or UDP', 'tcp')
+
+
+@pytest.mark.parametrize('correct, user, accepted', [
+    ('fast and interpretable', 'fast or interpretable', False),
+    ('fast and interpretable', 'interpretable, fast', True),
+    ('TCP or UDP', 'UDP or TCP', True),
+    ('TCP or UDP', 'TCP and UDP', True),
+    ('speed and accuracy or cost', 'speed or accuracy', False),
+    ('speed and accuracy or cost', 'cost', True),
+])
+def test_variant_key_keeps_and_or_distinct(correct, user, accepted):
+    basic = TieredGrader(tiers=('exact', 'variant'))
+    assert (basic.matchTier(correct, user) == 'variant') is accepted
+
+
+@pytest.mark.parametrize('correct, user', [('the mean', 'mean'), ('Mean', 'The mean'), ('an epoch', 'the Epoch')])
+def test_articles_are_ignored_for_every_answer(correct, user):
+    assert TieredGrader().matchTier(correct, user) == 'normalized'
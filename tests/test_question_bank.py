@@ -0,0 +1,55 @@
+import json
+import random
+
+import pytest
+
+from question_bank import iterQuestions
+
+QUESTIONS = {
+    "Learning rate?": 0.25,
+    "Samples per epoch?": 1e5,
+    "Scale?": 1.5e3,
+    "Tolerance?": -1.5e-3,
+    "Is ReLU linear?": False,
+    "Escaped \"quote\"?": "a\\b \"c\"",
+    "레이어 수?": 12,
+    "Nested?": {"a": [1, 2.5, None]},
+    "Plain?": "answer",
+}
+
+
+def writeBank(tmp_path, questions, **dump_options):
+    path = tmp_path / 'bank.json'
+    path.write_text(json.dumps(questions, ensure_ascii=False, **dump_options), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('indent', [None, 2])
+@pytest.mark.parametrize('chunk_size', range(1, 41))
+def test_values_split_across_chunks(tmp_path, chunk_size, indent):
+    path = writeBank(tmp_path, QUESTIONS, indent=indent)
+    assert dict(iterQuestions(path, chunk_size=chunk_size)) == QUESTIONS
+
+
+def test_random_banks_parse_at_any_chunk_size(tmp_path):
+    rng = random.Random(12)
+    for _ in range(100):
+        questions = {f'q{i} {rng.random()}': rng.choice([rng.random() * 10 ** rng.randint(-6, 6),
+                                                         rng.randint(-999, 999), 'text', True, None])
+                     for i in range(rng.randint(1, 6))}
+        path = writeBank(tmp_path, questions, indent=rng.choice([None, 1]))
+        chunk_size = rng.randint(1, 16)
+        assert dict(iterQuestions(path, chunk_size=chunk_size)) == questions
+
+
+def test_empty_object(tmp_path):
+    path = writeBank(tmp_path, {})
+    assert list(iterQuestions(path, chunk_size=1)) == []
+
+
+@pytest.mark.parametrize('text', ['{"a": 1 "b": 2}', '{"a": 0.}', '["a", "b"]', '{"a": "b"'])
+def test_malformed_json_raises(tmp_path, text):
+    path = tmp_path / 'bad.json'
+    path.write_text(text, encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(iterQuestions(str(path), chunk_size=3))
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+
+import pytest
+
+pytest.importorskip('PyQt5')
+pytest.importorskip('dotenv')
+
+from PyQt5.QtWidgets import QApplication
+
+from ai_judge import StubGrader
+from verdict_cache import VerdictCache
+
+QUESTIONS = {
+    "Capital of France?": "Paris",
+    "Largest planet?": "Jupiter",
+}
+
+
+@pytest.fixture(scope='module')
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'L01.json'
+    path.write_text(json.dumps(QUESTIONS), encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def window(qapp, source):
+    from quiz_app_advanced import QuizApp
+    window = QuizApp(grader=StubGrader(delay=0.3), verdict_cache=VerdictCache(':memory:'), speculative_delay=10,
+                     speculative_remote_limit=1)
+    window.startSession(source)
+    yield window
+    window.close()
+    waitUntil(qapp, lambda: True, 0.5)
+
+
+def waitUntil(qapp, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_speculation_primes_cache(qapp, window):
+    question = window.session.question
+    window.quiz_page.answer_input.setText('not the answer')
+    assert waitUntil(qapp, lambda: window.speculative_worker is not None)
+    assert waitUntil(qapp, lambda: window.speculative_worker is None)
+    assert window.session.grader.cache.peek(question, QUESTIONS[question], 'not the answer') is False
+
+
+def test_remote_speculation_is_opt_in(qapp, source):
+    from quiz_app_advanced import QuizApp
+    window = QuizApp(grader=StubGrader(), verdict_cache=VerdictCache(':memory:'), speculative_delay=10)
+    window.startSession(source)
+    window.quiz_page.answer_input.setText('not the answer')
+    waitUntil(qapp, lambda: False, 0.2)
+    assert window.speculative_worker is None and window.speculative_count == 0
+    window.close()
+
+
+def test_next_question_cancels_speculation(qapp, window):
+    question = window.session.question
+    window.quiz_page.answer_input.setText('not the answer')
+    assert waitUntil(qapp, lambda: window.speculative_worker is not None)
+    worker = window.speculative_worker
+
+    window.nextQuestion()
+    assert window.speculative_worker is None
+    assert worker.isInterruptionRequested()
+    waitUntil(qapp, lambda: False, 0.5)
+    assert window.session.grader.cache.peek(question, QUESTIONS[question], 'not the answer') is None
+
+
+def test_grading_worker_runs_off_the_gui_thread(qapp):
+    from quiz_app_advanced import GradingWorker
+    verdicts = []
+    worker = GradingWorker(StubGrader(delay=0.3), 'Capital of France?', 'Paris', ' paris ', timeout=5)
+    worker.graded.connect(verdicts.append)
+    start = time.perf_counter()
+    worker.start()
+    assert time.perf_counter() - start < 0.1
+    assert waitUntil(qapp, lambda: verdicts)
+    assert verdicts == [True]
+    worker.wait()
+
+
+def test_submit_answer_grades_in_background(qapp, window):
+    window.speculative_remote_limit = 0
+    question = window.session.question
+    window.quiz_page.answer_input.setText('Lyon')
+    start = time.perf_counter()
+    window.checkAnswer()
+    assert time.perf_counter() - start < 0.1
+    assert window.grading_worker is not None
+
+    assert waitUntil(qapp, lambda: window.grading_worker is None)
+    assert (window.session.answered, window.session.correct_count) == (1, 0)
+    assert window.session.grader.cache.peek(question, QUESTIONS[question], 'Lyon') is False
+
+
+def test_closing_during_exam_grading_keeps_checkpoint(qapp, source):
+    from progress_journal import ProgressJournal
+    from quiz_app_advanced import QuizApp
+    stub = StubGrader(delay=1.0)
+    window = QuizApp(grader=stub, batch_judge=stub.batch, verdict_cache=VerdictCache(':memory:'))
+    window.exam_mode_check.setChecked(True)
+    window.startSession(source)
+    journal_path = window.session.journal.path
+    for _ in QUESTIONS:
+        window.quiz_page.answer_input.setText('not the answer')
+        window.checkAnswer()
+    assert window.grading_worker is not None
+
+    window.close()
+    waitUntil(qapp, lambda: False, 0.2)
+    assert os.path.exists(journal_path)
+    journal = ProgressJournal(journal_path, source, 'ai')
+    journal.open()
+    assert sorted(journal.deferred) == sorted(QUESTIONS)
+    journal.close()
+
+
+@pytest.mark.parametrize('text', ['{"Capital of France?": "Paris"', '["Paris", "Jupiter"]'])
+def test_refuses_to_start_on_empty_bank(qapp, tmp_path, monkeypatch, text):
+    from PyQt5.QtWidgets import QMessageBox
+    from progress_journal import ProgressJournal
+    from quiz_app_advanced import QuizApp
+    shown = []
+    monkeypatch.setattr(QMessageBox, 'critical', lambda parent, title, text: shown.append(text))
+    path = tmp_path / 'broken.json'
+    path.write_text(text, encoding='utf-8')
+    window = QuizApp(grader=StubGrader(), verdict_cache=VerdictCache(':memory:'))
+    window.startSession(str(path))
+    assert window.stack.currentWidget() is window.welcome_page
+    assert len(shown) == 1 and 'broken.json' in shown[0]
+    assert not os.path.exists(ProgressJournal.pathFor(str(path), 'ai'))
+    window.close()
+
+
+def test_warns_about_duplicate_questions(qapp, tmp_path, monkeypatch):
+    from PyQt5.QtWidgets import QMessageBox
+    from quiz_app_advanced import QuizApp
+    shown = []
+    monkeypatch.setattr(QMessageBox, 'warning', lambda parent, title, text: shown.append(text))
+    (tmp_path / 'L01.json').write_text(json.dumps(QUESTIONS), encoding='utf-8')
+    (tmp_path / 'L02.json').write_text(json.dumps({"Capital of France?": "Lyon"}), encoding='utf-8')
+    window = QuizApp(grader=StubGrader(), verdict_cache=VerdictCache(':memory:'))
+    window.startSession(str(tmp_path))
+    assert window.stack.currentWidget() is window.quiz_page
+    assert shown == ['중복 문제 1개 (정답이 다른 문제 1개, 먼저 읽은 파일의 정답 사용)']
+    window.close()
@@ -0,0 +1,104 @@
+import os
+import json
+
+import pytest
+
+from quiz_core import Grader, QuizSession
+
+QUESTIONS = {
+    "The two factors are ____ and ____.": "speed and accuracy",
+    "Name the transport protocols": "TCP or UDP",
+    "What is the capital of Korea?": "서울",
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'L01.json'
+    path.write_text(json.dumps(QUESTIONS, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_prepare_accepts_loaded_bank(source):
+    session = QuizSession(Grader(), journal=False)
+    pool = session.load(source)
+    assert len(pool) == len(QUESTIONS)
+
+    session.grader.prepare(source, session.bank.answers)
+    assert os.path.exists(os.path.splitext(source)[0] + '.qvar')
+    assert session.grader.lookup("Name the transport protocols", "TCP or UDP", "udp").verdict is True
+    assert session.grader.lookup("The two factors are ____ and ____.", "speed and accuracy",
+                                 "accuracy, speed").verdict is True
+
+
+def test_start_session_prepares_grader(source):
+    pytest.importorskip('PyQt5')
+    from PyQt5.QtWidgets import QApplication
+    from quiz_ui import QuizWindow
+
+    app = QApplication.instance() or QApplication([])
+    window = QuizWindow(QuizSession(Grader(), journal=False))
+    try:
+        window.startSession(source)
+        assert os.path.exists(os.path.splitext(source)[0] + '.qvar')
+        assert window.session.question in QUESTIONS
+    finally:
+        window.close()
+    app.processEvents()
+
+
+def test_requeued_answers_survive_close(source, tmp_path, monkeypatch):
+    from progress_journal import ProgressJournal
+    journal_path = str(tmp_path / 'progress.jsonl')
+    monkeypatch.setattr(ProgressJournal, 'pathFor', staticmethod(lambda source, mode='': journal_path))
+
+    session = QuizSession(Grader(), journal=True)
+    session.load(source)
+    while session.nextQuestion() is not None:
+        session.defer('모름')
+    failed = session.takePending()
+    assert len(failed) == len(QUESTIONS)
+
+    session.requeue(failed)
+    assert not session.finished()
+    session.close()
+    assert os.path.exists(journal_path)
+
+    resumed = QuizSession(Grader(), journal=True)
+    resumed.load(source)
+    assert sorted(item.question for item in resumed.pending) == sorted(QUESTIONS)
+    assert [item.id for item in resumed.pending] == list(range(len(QUESTIONS)))
+
+
+
+def test_checkpoints_are_kept_per_app(source):
+    from progress_journal import listCheckpoints
+    paths = {}
+    for mode in ('basic', 'ai'):
+        session = QuizSession(Grader(), journal=True, mode=mode)
+        session.load(source)
+        session.nextQuestion()
+        if mode == 'ai':
+            session.defer('모름')
+        paths[mode] = session.journal.path
+        session.close(keep_progress=True)
+    assert paths['basic'] != paths['ai']
+    assert [c.path for c in listCheckpoints('ai') if c.source == os.path.abspath(source)] == [paths['ai']]
+
+    # AI Quiz 시험 모드에서 미룬 답안은 Basic에서 이어 풀지 않음
+    resumed = QuizSession(Grader(), journal=True, mode='basic')
+    resumed.load(source)
+    assert resumed.pending == []
+    resumed.close(keep_progress=False)
+
+
+def test_close_releases_compiled_bank(tmp_path):
+    from compiled_bank import compileBank
+    path = str(tmp_path / 'L01.qbank')
+    compileBank(QUESTIONS, path)
+    session = QuizSession(Grader(), journal=False)
+    session.load(path)
+    bank = session.questions.bank
+    assert session.nextQuestion() in QUESTIONS
+    session.close()
+    assert bank.mm.closed and bank.file.closed
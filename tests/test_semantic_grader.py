@@ -0,0 +1,32 @@
+import os
+import importlib.util
+
+import pytest
+
+from semantic_grader import HashingEmbedder, SemanticGrader, createSemanticGrader
+
+
+def test_off_disables_grader():
+    assert createSemanticGrader('off') is None
+
+
+def test_hashing_prepare_keeps_no_vectors(tmp_path):
+    source = tmp_path / 'L01.json'
+    source.write_text('{"Q": "gradient descent"}', encoding='utf-8')
+    grader = SemanticGrader(HashingEmbedder())
+    grader.prepare(str(source), ['gradient descent'])
+    assert len(grader.index) == 0
+    assert not os.path.exists(tmp_path / 'L01.qemb')
+
+
+def test_hashing_scores_sparse_vectors():
+    grader = SemanticGrader(HashingEmbedder())
+    assert grader.score('gradient descent', 'Gradient  descent!') == pytest.approx(1.0)
+    assert grader.score('gradient descent', '서울') < 0.1
+
+
+def test_model_embedder_requires_semantic_extra():
+    if importlib.util.find_spec('numpy') and importlib.util.find_spec('sentence_transformers'):
+        pytest.skip('semantic extra가 설치되어 있음')
+    with pytest.raises(RuntimeError, match='--extra semantic'):
+        createSemanticGrader('st:paraphrase-multilingual-MiniLM-L12-v2')
@@ -0,0 +1,181 @@
+import os
+import time
+import sqlite3
+import hashlib
+import unicodedata
+from collections import OrderedDict
+
+
+DEFAULT_CACHE_PATH = os.getenv(
+    "QUIZ_VERDICT_CACHE",
+    os.path.join(os.path.expanduser("~"), ".quiz_app", "verdict_cache.db"),
+)
+
+
+def normalizeAnswer(text):
+    """캐시 키 비교용으로 유니코드/대소문자/공백을 정규화"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(text.split())
+
+
+class VerdictCache:
+    """AI 채점 결과를 (문제, 정답, 정규화된 답안) 기준으로 저장하는 캐시
+
+    SQLite 파일에 영구 저장하고, 앞단에 메모리 LRU를 두어 반복 조회를 줄인다.
+    """
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=30 * 24 * 3600,
+                 max_entries=200000, memory_size=2048):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_size = memory_size
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.puts_since_evict = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                correct_answer TEXT NOT NULL,
+                verdict INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_question ON verdicts(question)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_last_used ON verdicts(last_used)")
+        self.conn.commit()
+
+    def makeKey(self, question, correct_answer, user_answer):
+        raw = "\x1f".join((question, correct_answer, normalizeAnswer(user_answer)))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, question, correct_answer, user_answer):
+        """저장된 판정을 반환, 없거나 만료되었으면 None"""
+        key = self.makeKey(question, correct_answer, user_answer)
+        now = time.time()
+
+        entry = self.memory.get(key)
+        if entry is not None:
+            verdict, created_at = entry
+            if now - created_at <= self.ttl:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return verdict
+            del self.memory[key]
+
+        try:
+            row = self.conn.execute(
+                "SELECT verdict, created_at FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                self.conn.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+                self.conn.commit()
+                row = None
+            if row is not None:
+                self.conn.execute("UPDATE verdicts SET last_used = ? WHERE key = ?", (now, key))
+                self.conn.commit()
+        except sqlite3.Error:
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        verdict = bool(row[0])
+        self.remember(key, verdict, row[1])
+        self.hits += 1
+        return verdict
+
+    def peek(self, question, correct_answer, user_answer):
+        """적중 통계와 사용 시각을 바꾸지 않고 조회 (입력 중 추측 채점용)"""
+        key = self.makeKey(question, correct_answer, user_answer)
+        now = time.time()
+        entry = self.memory.get(key)
+        if entry is not None and now - entry[1] <= self.ttl:
+            return entry[0]
+        try:
+            row = self.conn.execute(
+                "SELECT verdict, created_at FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or now - row[1] > self.ttl:
+            return None
+        return bool(row[0])
+
+    def put(self, question, correct_answer, user_answer, verdict):
+        key = self.makeKey(question, correct_answer, user_answer)
+        now = time.time()
+        self.remember(key, bool(verdict), now)
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?, ?)",
+                (key, question, correct_answer, int(bool(verdict)), now, now)
+            )
+            self.conn.commit()
+        except sqlite3.Error:
+            return
+
+        self.puts_since_evict += 1
+        if self.puts_since_evict >= 100:
+            self.evict()
+
+    def remember(self, key, verdict, created_at):
+        self.memory[key] = (verdict, created_at)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def evict(self):
+        """만료된 항목과 최대 개수를 넘는 오래된 항목을 삭제"""
+        self.puts_since_evict = 0
+        try:
+            self.conn.execute("DELETE FROM verdicts WHERE created_at < ?", (time.time() - self.ttl,))
+            overflow = self.size() - self.max_entries
+            if overflow > 0:
+                self.conn.execute("""
+                    DELETE FROM verdicts WHERE key IN (
+                        SELECT key FROM verdicts ORDER BY last_used LIMIT ?
+                    )
+                """, (overflow,))
+            self.conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def invalidateQuestion(self, question):
+        self.conn.execute("DELETE FROM verdicts WHERE question = ?", (question,))
+        self.conn.commit()
+        self.memory.clear()
+
+    def invalidateChanged(self, questions):
+        """JSON의 정답이 바뀐 문제의 판정을 삭제 ({문제: 정답} 딕셔너리)"""
+        cur = self.conn.executemany(
+            "DELETE FROM verdicts WHERE question = ? AND correct_answer != ?",
+            questions.items()
+        )
+        self.conn.commit()
+        if cur.rowcount:
+            self.memory.clear()
+        return cur.rowcount
+
+    def size(self):
+        return self.conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": self.size(),
+        }
+
+    def close(self):
+        self.conn.close()